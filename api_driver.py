@@ -0,0 +1,195 @@
+"""
+직접 API 호출 드라이버
+브라우저 없이 에이전트 HTTP 엔드포인트에 Request Fields와 메시지를 바로 전송합니다.
+TestAutomation과 같은 run_tests 인터페이스를 제공하므로 에이전트 로직만 검증하는 스위트에 사용합니다.
+"""
+import os
+import time
+import uuid
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from test_automation import TestAutomation
+
+
+class ApiTestAutomation(TestAutomation):
+    """에이전트 API를 직접 호출하는 테스트 자동화 클래스 (Chromium 미사용)"""
+
+    _WORKER_CONFIG_ATTRS = TestAutomation._WORKER_CONFIG_ATTRS + ('api_url', 'clone_url', 'pool_size', 'verify_tls')
+
+    # 세션 복제 엔드포인트로 대화를 분기할 수 있으므로 멀티턴 prefix 공유 실행 사용
+    supports_conversation_fork = True
+
+    def __init__(self, api_url: Optional[str] = None,
+                 base_url: str = "https://navi-agent-adk-api.dev.onkakao.net/streamlit/",
+                 pool_size: int = 10, insecure: Optional[bool] = None):
+        """
+        Args:
+            api_url: 에이전트 HTTP 엔드포인트 (기본값: 환경 변수 NAVIQA_AGENT_API_URL)
+            base_url: 결과 표시용 대상 URL (브라우저 접속에는 사용하지 않음)
+            pool_size: 호스트당 keep-alive 연결 풀 크기
+            insecure: True이면 TLS 인증서 검증을 끔 (사내 인증서 대응, 기본값: NAVIQA_API_INSECURE 또는 False)
+        """
+        super().__init__(base_url=base_url, capture_mode='api')
+        self.resource_blocker = None  # 브라우저를 쓰지 않으므로 리소스 차단 불필요
+        self.failure_tracer = None  # 트레이스할 브라우저 컨텍스트 없음
+        self.memory_watchdog = None  # 감시할 Chromium 프로세스 없음
+        self.api_url = api_url or os.environ.get('NAVIQA_AGENT_API_URL', '')
+        # 세션 복제 엔드포인트 (기본값: NAVIQA_AGENT_CLONE_URL 또는 api_url과 같은 경로의 /sessions/clone)
+        self.clone_url = os.environ.get('NAVIQA_AGENT_CLONE_URL') or (
+            f"{self.api_url.rsplit('/', 1)[0]}/sessions/clone" if self.api_url else '')
+        self.pool_size = pool_size
+        if insecure is None:
+            insecure = os.environ.get('NAVIQA_API_INSECURE', 'false').lower() in ('1', 'true', 'yes')
+        self.verify_tls = not insecure
+        self.session: Optional[requests.Session] = None
+        self.request_fields: Dict = {}
+        self.session_id: Optional[str] = None
+
+    @property
+    def target_url(self) -> str:
+        """요청은 base_url이 아니라 에이전트 API로 전송되므로 초당 요청 수 상한도 api_url 호스트 기준"""
+        return self.api_url
+
+    def start_browser(self, remote_debugging: bool = False):
+        """브라우저 대신 keep-alive 연결 풀을 가진 HTTP 세션을 준비합니다."""
+        if not self.api_url:
+            raise ValueError("에이전트 API URL이 없습니다. api_url 인자 또는 NAVIQA_AGENT_API_URL 환경 변수를 설정하세요.")
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        proxy_config = self._get_proxy_config()
+        if proxy_config:
+            self.session.proxies = {'http': proxy_config['server'], 'https': proxy_config['server']}
+        # 사내망 인증서 대응은 명시적으로 켠 경우에만 (경고는 숨기지 않음)
+        self.session.verify = self.verify_tls
+        if not self.verify_tls:
+            print("⚠️ TLS 인증서 검증 끔 (NAVIQA_API_INSECURE)")
+        print(f"✅ API 세션 준비 완료: {self.api_url}")
+
+    def attach_browser(self, cdp_endpoint: Optional[str] = None):
+        """병렬 워커: 워커별 HTTP 세션을 엽니다. (공유할 브라우저 없음)"""
+        self.start_browser()
+
+    def close_browser(self):
+        """HTTP 세션 종료"""
+        if self.session:
+            self.session.close()
+            self.session = None
+
+    def reset_page(self):
+        """새 대화 세션을 시작합니다."""
+        self.session_id = None
+
+    def start_new_conversation(self) -> bool:
+        """세션 재사용: Request Fields는 유지하고 새 대화 세션 ID만 발급합니다."""
+        self.session_id = uuid.uuid4().hex
+        return True
+
+    def initialize_chat(self, user_id: str, lat: float, lng: float, is_driving: bool):
+        """
+        Request Fields를 저장하고 새 대화 세션 ID를 발급합니다.
+
+        Args:
+            user_id: 사용자 ID
+            lat: 위도
+            lng: 경도
+            is_driving: 운전 여부
+        """
+        self.request_fields = {
+            'user_id': user_id,
+            'lat': lat,
+            'lng': lng,
+            'is_driving': is_driving,
+        }
+        self.session_id = uuid.uuid4().hex
+
+    def save_conversation(self) -> Dict:
+        """현재 대화 상태와 대화 세션 ID를 저장합니다."""
+        state = super().save_conversation()
+        state['session_id'] = self.session_id
+        return state
+
+    def restore_conversation(self, state: Dict, fork: bool = False):
+        """
+        저장한 대화 세션으로 돌아갑니다. fork이면 서버에서 세션을 복제해 복제본에서 계속합니다.
+        복제에 실패하면 새 세션에서 저장된 메시지를 다시 보내 대화를 재구성합니다.
+
+        Args:
+            state: save_conversation() 결과
+            fork: True이면 저장한 세션은 그대로 두고 복제본 사용
+        """
+        if not fork:
+            self.session_id = state['session_id']
+            self._conversation_fields = dict(state['fields'])
+            self._conversation_history = list(state['history'])
+            return
+
+        clone_id = uuid.uuid4().hex
+        try:
+            response = self.session.post(
+                self.clone_url,
+                json={'source_session_id': state['session_id'], 'session_id': clone_id},
+                timeout=self.timing_profile.timeout_ms('response', self.response_timeout_ms) / 1000,
+            )
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            print(f"  ⚠️ 세션 복제 실패 (메시지 재전송으로 대체): {e}")
+            self._replay_conversation(state)
+            return
+        self.session_id = clone_id
+        self._conversation_fields = dict(state['fields'])
+        self._conversation_history = list(state['history'])
+
+    def send_message_and_collect_results(self, message: str, message_index: int = 0) -> Dict:
+        """
+        메시지를 에이전트 API로 전송하고 결과를 수집합니다.
+
+        Args:
+            message: 전송할 메시지
+            message_index: 메시지 인덱스 (디버깅용)
+
+        Returns:
+            결과 딕셔너리 (latency, response_structured, raw_json, tts)
+        """
+        results = {
+            'latency': '',
+            'response_structured': '',
+            'raw_json': '',
+            'tts': '',
+            'capture_source': 'api',
+        }
+
+        if self.session_id is None:
+            self.session_id = uuid.uuid4().hex
+
+        payload = dict(self.request_fields)
+        payload.update({'session_id': self.session_id, 'message': str(message)})
+
+        try:
+            print(f"  📤 메시지 {message_index + 1} API 전송: {str(message)[:50]}...")
+            request_start = time.time()
+            timeout_ms = self.timing_profile.timeout_ms('response', self.response_timeout_ms)
+            with self.step_timer.span('wait_response'):
+                response = self.session.post(self.api_url, json=payload, timeout=timeout_ms / 1000)
+            latency_ms = (time.time() - request_start) * 1000
+            self.timing_profile.record('response', latency_ms)
+
+            results['raw_json'] = response.text
+            results['latency'] = f"Response received in {latency_ms:.0f}ms (api)"
+            results['tts'] = self.extract_tts_from_raw_json(response.text)
+            if response.status_code >= 400:
+                results['error'] = f"HTTP {response.status_code}"
+            print(f"  📊 API 응답: status={response.status_code}, latency={latency_ms:.0f}ms, raw_json_len={len(response.text)}")
+        except requests.exceptions.RequestException as e:
+            if isinstance(e, requests.exceptions.ReadTimeout):
+                self.timing_profile.record_timeout('response', timeout_ms)
+            print(f"  ❌ API 호출 실패: {e}")
+            results['error'] = str(e)
+
+        return results
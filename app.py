@@ -21,6 +21,13 @@ except Exception:
 
 # Playwright 테스트 자동화 모듈 import
 from test_automation import TestAutomation
+from api_driver import ApiTestAutomation
+from replay_driver import ReplayTestAutomation
+from browser_pool import get_browser_pool
+from timing_profile import TimingProfile
+from fanout import environment_labels, run_multi_environment
+from response_archive import ResponseArchive
+from suite_loader import prepare_suite, validate_excel_file
 
 # 페이지 설정
 st.set_page_config(
@@ -238,62 +245,30 @@ if 'proxy_config' not in st.session_state:
     }
 if 'base_url' not in st.session_state:
     st.session_state.base_url = os.environ.get('TEST_BASE_URL', 'https://navi-agent-adk-api.dev.onkakao.net/streamlit/')
+if 'workers' not in st.session_state:
+    st.session_state.workers = int(os.environ.get('NAVIQA_WORKERS', '1'))
+if 'timing_preset' not in st.session_state:
+    st.session_state.timing_preset = os.environ.get('NAVIQA_TIMING_PRESET', 'balanced')
+if 'driver_mode' not in st.session_state:
+    st.session_state.driver_mode = os.environ.get('NAVIQA_DRIVER', 'ui')
+if 'agent_api_url' not in st.session_state:
+    st.session_state.agent_api_url = os.environ.get('NAVIQA_AGENT_API_URL', '')
+if 'record_responses' not in st.session_state:
+    st.session_state.record_responses = os.environ.get('NAVIQA_RECORD_RESPONSES', 'false').lower() in ('1', 'true', 'yes')
+if 'session_reuse' not in st.session_state:
+    st.session_state.session_reuse = os.environ.get('NAVIQA_SESSION_REUSE', 'false').lower() in ('1', 'true', 'yes')
+if 'compare_urls' not in st.session_state:
+    st.session_state.compare_urls = os.environ.get('NAVIQA_COMPARE_URLS', '').replace(',', '\n')
+if 'comparison_results' not in st.session_state:
+    st.session_state.comparison_results = None
+if 'resume_run' not in st.session_state:
+    st.session_state.resume_run = os.environ.get('NAVIQA_RESUME', 'false').lower() in ('1', 'true', 'yes')
 
-
-def validate_excel_file(df: pd.DataFrame) -> tuple[bool, str]:
-    """
-    엑셀 파일의 필수 컬럼을 검증합니다.
-    대소문자 구분 없이 검증합니다.
-    멀티턴 시나리오를 지원합니다 (test_case_id, turn_number).
-    
-    Args:
-        df: 업로드된 DataFrame
-    
-    Returns:
-        (is_valid: bool, error_message: str)
-    """
-    required_columns = ['user_id', 'lat', 'lng', 'is_driving', 'message']
-    # 선택적 컬럼 (기대값 - 있으면 평가에 사용, 없어도 됨)
-    optional_columns = ['tts_expected', 'action_name_expected', 'action_data_expected', 'next_step_expected']
-    
-    df_columns_lower = {col.lower(): col for col in df.columns}
-    missing_columns = []
-    
-    for req_col in required_columns:
-        if req_col.lower() not in df_columns_lower:
-            missing_columns.append(req_col)
-    
-    if missing_columns:
-        return False, f"필수 컬럼이 없습니다: {', '.join(missing_columns)}"
-    
-    # 선택적 컬럼 확인 (정보만 출력)
-    found_optional = []
-    for opt_col in optional_columns:
-        if opt_col.lower() in df_columns_lower:
-            found_optional.append(opt_col)
-    
-    if found_optional:
-        print(f"ℹ️ 기대값 컬럼 발견: {', '.join(found_optional)}", flush=True)
-    
-    if df.empty:
-        return False, "테스트 케이스가 없습니다."
-    
-    # 멀티턴 시나리오 검증 (test_case_id와 turn_number가 모두 있는 경우)
-    has_test_case_id = 'test_case_id' in df_columns_lower or 'TEST_CASE_ID' in df.columns
-    has_turn_number = 'turn_number' in df_columns_lower or 'TURN_NUMBER' in df.columns
-    
-    if has_test_case_id and has_turn_number:
-        # test_case_id별로 turn_number가 1부터 순차적으로 있는지 확인
-        test_case_id_col = df_columns_lower.get('test_case_id') or 'TEST_CASE_ID'
-        turn_number_col = df_columns_lower.get('turn_number') or 'TURN_NUMBER'
-        
-        for test_case_id in df[test_case_id_col].unique():
-            case_turns = df[df[test_case_id_col] == test_case_id][turn_number_col].sort_values()
-            expected_turns = list(range(1, len(case_turns) + 1))
-            if not case_turns.tolist() == expected_turns:
-                return False, f"test_case_id '{test_case_id}'의 turn_number가 순차적이지 않습니다. (1, 2, 3, ... 순서여야 함)"
-    
-    return True, ""
+# 상주 브라우저 풀 (파드당 한 번만 Chromium 실행 및 페이지 로드)
+USE_BROWSER_POOL = os.environ.get('NAVIQA_BROWSER_POOL', 'true').lower() == 'true'
+if USE_BROWSER_POOL and st.session_state.driver_mode == 'ui' and 'browser_pool_warmed' not in st.session_state:
+    get_browser_pool().prewarm_async(st.session_state.base_url)
+    st.session_state.browser_pool_warmed = True
 
 
 def format_time(seconds):
@@ -406,6 +381,62 @@ with st.sidebar:
     
     st.markdown("---")
     
+    # 실행 설정
+    with st.expander("⚙️ 실행 설정", expanded=False):
+        st.session_state.workers = st.number_input(
+            "병렬 워커 수",
+            min_value=1,
+            max_value=16,
+            value=st.session_state.workers,
+            help="하나의 Chromium 안에서 독립된 브라우저 컨텍스트 N개로 시나리오를 나눠 실행합니다. 컨텍스트당 약 100MB 메모리가 추가로 필요합니다."
+        )
+        timing_presets = ['fast', 'balanced', 'debug']
+        st.session_state.timing_preset = st.selectbox(
+            "타이밍 프리셋",
+            options=timing_presets,
+            index=timing_presets.index(st.session_state.timing_preset) if st.session_state.timing_preset in timing_presets else 1,
+            help="fast/balanced: 과거 실행의 단계별 소요 시간(p99 x 안전 계수)으로 타임아웃 산출, slow_mo 없음. debug: 기본 타임아웃 + slow_mo 100ms + 긴 안정화 대기"
+        )
+        driver_options = {'ui': 'UI (브라우저)', 'api': 'API 직접 호출', 'replay': '녹화 응답 재생'}
+        st.session_state.driver_mode = st.radio(
+            "실행 방식",
+            options=list(driver_options.keys()),
+            format_func=lambda key: driver_options[key],
+            index=list(driver_options.keys()).index(st.session_state.driver_mode) if st.session_state.driver_mode in driver_options else 0,
+            help="API 직접 호출은 브라우저 없이 에이전트 엔드포인트에 Request Fields와 메시지를 바로 전송합니다. "
+                 "녹화 응답 재생은 '응답 녹화'로 기록해 둔 응답으로 평가만 다시 실행합니다. (같은 URL과 엑셀 파일 필요)"
+        )
+        if st.session_state.driver_mode != 'replay':
+            st.session_state.record_responses = st.checkbox(
+                "응답 녹화",
+                value=st.session_state.record_responses,
+                help="턴별 입력과 수집된 응답(Raw JSON, Response, latency)을 아카이브에 기록합니다. 평가 코드만 바꿨을 때 '녹화 응답 재생'으로 다시 평가할 수 있습니다."
+            )
+        st.session_state.session_reuse = st.checkbox(
+            "세션 재사용 (단일 턴)",
+            value=st.session_state.session_reuse,
+            help="Request Fields가 같은 단일 턴 케이스를 묶어 페이지 리셋/채팅 초기화 없이 앱의 새 대화 버튼으로 이어서 실행합니다. 결과의 session_id로 케이스가 실행된 세션을 확인할 수 있습니다."
+        )
+        if st.session_state.driver_mode == 'api':
+            st.session_state.agent_api_url = st.text_input(
+                "에이전트 API URL",
+                value=st.session_state.agent_api_url,
+                help="예: http://127.0.0.1:8765/chat (python mock_agent_server.py 로 로컬 모의 서버 실행 가능)"
+            )
+        if st.session_state.driver_mode == 'ui':
+            st.session_state.compare_urls = st.text_area(
+                "비교 환경 URL (선택)",
+                value=st.session_state.compare_urls,
+                help="한 줄에 하나씩 입력하면 현재 URL(기준 환경)과 같은 스위트를 동시에 실행하고 환경별 verdict, latency, 점수 차이를 비교합니다."
+            )
+        st.session_state.resume_run = st.checkbox(
+            "중단된 실행 이어하기",
+            value=st.session_state.resume_run,
+            help="같은 엑셀 파일과 URL로 중단된 실행이 있으면 결과 저널에 완료된 시나리오는 건너뛰고 나머지만 실행합니다."
+        )
+    
+    st.markdown("---")
+    
     # 엑셀 파일 업로드
     uploaded_file = st.file_uploader(
         "엑셀 파일을 선택하세요",
@@ -416,11 +447,7 @@ with st.sidebar:
     if uploaded_file is not None:
         try:
             # 엑셀 파일 읽기
-            df = pd.read_excel(uploaded_file)
-            
-            # user_id를 문자열로 변환
-            if 'user_id' in df.columns:
-                df['user_id'] = df['user_id'].astype(str)
+            df = prepare_suite(pd.read_excel(uploaded_file))
             
             st.success(f"✅ 파일 로드 완료: {len(df)}개 테스트 케이스")
             
@@ -490,11 +517,68 @@ if st.session_state.test_in_progress and 'test_cases_df' in st.session_state:
                 status_text.text(f"테스트 진행 중: {current}/{total} ({elapsed_str} 경과)")
         
         # TestAutomation 인스턴스 생성 및 실행
-        automation = TestAutomation(base_url=base_url)
+        browser_pool = None
+        compare_urls = [url.strip() for url in st.session_state.compare_urls.splitlines() if url.strip()]
+        st.session_state.comparison_results = None
+        if st.session_state.driver_mode == 'ui' and compare_urls:
+            automation = None
+        elif st.session_state.driver_mode == 'replay':
+            automation = ReplayTestAutomation(base_url=base_url)
+        elif st.session_state.driver_mode == 'api':
+            automation = ApiTestAutomation(api_url=st.session_state.agent_api_url, base_url=base_url)
+            automation.timing_profile = TimingProfile(base_url, st.session_state.timing_preset)
+        elif USE_BROWSER_POOL:
+            browser_pool = get_browser_pool()
+            automation = TestAutomation(base_url=base_url, browser_pool=browser_pool, timing_preset=st.session_state.timing_preset)
+        else:
+            automation = TestAutomation(base_url=base_url, timing_preset=st.session_state.timing_preset)
+        if automation is not None and st.session_state.driver_mode != 'replay' and st.session_state.record_responses:
+            automation.archive_mode = 'record'
+            automation.response_archive = ResponseArchive()
+        if automation is not None:
+            automation.session_reuse = st.session_state.session_reuse
         status_text.text("브라우저 시작 중...")
         
-        # 테스트 실행
-        results_df = automation.run_tests(test_cases_df, progress_callback=update_progress)
+        # 테스트 실행 (브라우저 풀 사용 시 풀 스레드에서 실행하고 진행 상황은 이 스레드에서 갱신)
+        if automation is None:
+            # 다중 환경 비교: 환경별 자체 브라우저로 동시에 실행하고, 기준 환경 결과는 기존 결과 화면에 표시
+            preset = st.session_state.timing_preset
+            session_reuse = st.session_state.session_reuse
+            
+            def automation_factory(url):
+                environment_automation = TestAutomation(base_url=url, timing_preset=preset)
+                environment_automation.session_reuse = session_reuse
+                return environment_automation
+            
+            environments = environment_labels([base_url] + compare_urls)
+            baseline_label = next(iter(environments))
+            joined_df, per_env_results = run_multi_environment(
+                test_cases_df,
+                environments,
+                workers=st.session_state.workers,
+                progress_callback=update_progress,
+                automation_factory=automation_factory,
+                return_per_environment=True,
+                baseline_label=baseline_label,
+            )
+            # 기준 환경이 실패하면 run_multi_environment가 오류를 내므로 여기서는 항상 기준 환경 결과
+            results_df = per_env_results[baseline_label]
+            st.session_state.comparison_results = joined_df
+        elif browser_pool is not None:
+            results_df = browser_pool.run(
+                automation.run_tests,
+                test_cases_df,
+                progress_callback=update_progress,
+                workers=st.session_state.workers,
+                resume=st.session_state.resume_run
+            )
+        else:
+            results_df = automation.run_tests(
+                test_cases_df,
+                progress_callback=update_progress,
+                workers=st.session_state.workers,
+                resume=st.session_state.resume_run
+            )
         
         # 결과 저장
         st.session_state.test_results = results_df
@@ -572,6 +656,22 @@ elif st.session_state.test_results is not None:
     
     st.markdown("---")
     
+    # 다중 환경 비교 결과
+    if st.session_state.comparison_results is not None:
+        comparison_df = st.session_state.comparison_results
+        with st.expander("🌐 환경 비교 (기준: 첫 번째 환경)", expanded=True):
+            changed_columns = [col for col in comparison_df.columns if col.startswith('verdict_changed_')]
+            for col in changed_columns:
+                st.markdown(f"**{col.replace('verdict_changed_', '')}**: verdict 변경 {int(comparison_df[col].sum())}건")
+            st.dataframe(comparison_df, use_container_width=True, height=300)
+            st.download_button(
+                label="📥 환경 비교 CSV 다운로드",
+                data=comparison_df.to_csv(index=False).encode('utf-8-sig'),
+                file_name=f"environment_comparison_{time.strftime('%Y%m%d_%H%M%S')}.csv",
+                mime="text/csv"
+            )
+        st.markdown("---")
+    
     # 요약 통계
     total_cases = len(results_df)
     # verdict 컬럼이 있으면 사용, 없으면 pass/fail 사용 (하위 호환성)
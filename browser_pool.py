@@ -0,0 +1,270 @@
+"""
+상주 브라우저 풀 모듈
+파드(프로세스)당 한 번만 Playwright와 Chromium을 띄우고, 미리 base_url에 접속해 둔
+컨텍스트/페이지를 테스트 실행에 빌려줍니다. 실행이 끝나면 컨텍스트를 닫고 백그라운드에서 다시 준비합니다.
+
+Playwright sync API는 객체를 만든 스레드에서만 사용할 수 있고 Streamlit은 rerun마다 다른 스레드에서
+스크립트를 실행하므로, 풀은 전용 스레드 하나를 소유하고 테스트 실행도 그 스레드에서 수행합니다 (submit/run).
+병렬 워커는 CDP 엔드포인트(cdp_endpoint)로 같은 Chromium에 접속합니다.
+"""
+import atexit
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+
+class BrowserPool:
+    """프로세스 전역 상주 브라우저 풀"""
+
+    def __init__(self, warm_size: int = 1):
+        """
+        Args:
+            warm_size: base_url별로 미리 준비해 둘 페이지 수
+        """
+        self.warm_size = warm_size
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='naviqa-browser-pool')
+        self._thread: Optional[threading.Thread] = None
+        self._owner = None  # 브라우저를 실행한 TestAutomation 인스턴스
+        self._warm_slots: Dict[Tuple[str, str], List[Dict]] = {}
+        self.launch_count = 0
+        self.lease_count = 0
+
+    # ------------------------------------------------------------------
+    # 풀 스레드 실행
+    # ------------------------------------------------------------------
+    def submit(self, fn, *args, **kwargs) -> Future:
+        """풀 스레드에서 fn을 실행합니다. (Playwright 객체를 쓰는 작업은 반드시 이 경로로 실행)"""
+        return self._executor.submit(self._call_on_pool_thread, fn, *args, **kwargs)
+
+    def _call_on_pool_thread(self, fn, *args, **kwargs):
+        self._thread = threading.current_thread()
+        return fn(*args, **kwargs)
+
+    def run(self, fn, *args, progress_callback=None, **kwargs):
+        """
+        풀 스레드에서 fn을 실행하고 끝날 때까지 기다립니다.
+        fn에 전달되는 progress_callback 호출은 호출한 스레드(예: Streamlit 스크립트 스레드)에서
+        다시 실행되므로 UI 요소를 안전하게 갱신할 수 있습니다.
+
+        Args:
+            fn: 실행할 함수 (예: automation.run_tests)
+            progress_callback: 호출 스레드에서 실행할 진행 상황 콜백 (키워드 인자)
+
+        Returns:
+            fn의 반환값
+        """
+        if progress_callback is None:
+            return self.submit(fn, *args, **kwargs).result()
+
+        progress_queue = queue.Queue()
+        future = self.submit(fn, *args, progress_callback=lambda **kw: progress_queue.put(kw), **kwargs)
+        while True:
+            try:
+                progress_callback(**progress_queue.get(timeout=0.2))
+            except queue.Empty:
+                if future.done():
+                    break
+        while not progress_queue.empty():
+            progress_callback(**progress_queue.get_nowait())
+        return future.result()
+
+    def _assert_pool_thread(self):
+        if threading.current_thread() is not self._thread:
+            raise RuntimeError("BrowserPool의 브라우저는 pool.submit() 또는 pool.run()으로 실행한 작업 안에서만 사용할 수 있습니다.")
+
+    # ------------------------------------------------------------------
+    # 브라우저 수명 관리 (풀 스레드 전용)
+    # ------------------------------------------------------------------
+    @property
+    def browser(self):
+        return self._owner.browser if self._owner else None
+
+    @property
+    def cdp_endpoint(self) -> Optional[str]:
+        return self._owner.cdp_endpoint if self._owner else None
+
+    @property
+    def browser_pid(self) -> Optional[int]:
+        """풀 브라우저 프로세스 PID (빌려 간 실행의 메모리 감시 대상)"""
+        return self._owner.browser_pid if self._owner else None
+
+    def is_healthy(self) -> bool:
+        """Chromium 연결이 살아 있는지 확인합니다."""
+        try:
+            return bool(self._owner and self._owner.browser and self._owner.browser.is_connected())
+        except Exception:
+            return False
+
+    def _ensure_browser(self, base_url: str, settings: Optional[Dict] = None):
+        """브라우저가 없거나 죽었으면 (다시) 실행합니다. settings는 첫 페이지에 적용할 실행 설정 (_new_slot 참고)"""
+        if self.is_healthy():
+            return
+        if self._owner is not None:
+            print("⚠️ 풀 브라우저 연결 끊김 - 재실행")
+            self._shutdown_owner()
+
+        from test_automation import TestAutomation
+        owner = TestAutomation(base_url=base_url)
+        self._apply_settings(owner, settings)
+        owner.start_browser(remote_debugging=True)
+        self._owner = owner
+        self.launch_count += 1
+        # start_browser가 이미 base_url에 접속한 페이지를 첫 번째 warm 슬롯으로 사용
+        self._warm_slots.setdefault((base_url, owner.capture_mode), []).append({
+            'context': owner.context,
+            'page': owner.page,
+            'network_capture': owner.network_capture,
+            'resource_blocker': owner.resource_blocker,
+        })
+        owner.context = None
+        owner.page = None
+        owner.network_capture = None
+
+    def _shutdown_owner(self):
+        self._warm_slots.clear()
+        try:
+            self._owner.close_browser()
+        except Exception:
+            pass
+        self._owner = None
+
+    @staticmethod
+    def _apply_settings(loader, settings: Optional[Dict]):
+        """
+        컨텍스트를 만드는 임시 인스턴스에 빌려 갈 실행의 설정을 적용합니다.
+
+        Args:
+            loader: 컨텍스트를 만들 TestAutomation 인스턴스
+            settings: {'resource_blocker': 차단기 또는 None(차단 안 함), 'timing_profile': 타이밍 프로필 또는 None(기본값)}.
+                None이면(백그라운드 prewarm) 기본 설정 사용
+        """
+        if settings is None:
+            return
+        loader.resource_blocker = settings['resource_blocker']
+        if settings['timing_profile'] is not None:
+            loader.timing_profile = settings['timing_profile']
+
+    def _new_slot(self, base_url: str, capture_mode: str, settings: Optional[Dict] = None) -> Dict:
+        """공유 브라우저에 새 컨텍스트를 열고 base_url에 접속한 슬롯을 만듭니다."""
+        from test_automation import TestAutomation
+        loader = TestAutomation(base_url=base_url, capture_mode=capture_mode)
+        self._apply_settings(loader, settings)
+        loader.browser = self.browser
+        loader._open_page(loader._get_proxy_config())
+        return {
+            'context': loader.context,
+            'page': loader.page,
+            'network_capture': loader.network_capture,
+            'resource_blocker': loader.resource_blocker,
+        }
+
+    @staticmethod
+    def _rebind_blocker(slot: Dict, resource_blocker):
+        """미리 준비한 슬롯의 리소스 차단기를 빌려 가는 실행의 차단기로 바꿉니다. (차단 설정/통계를 실행 기준으로)"""
+        if slot.get('resource_blocker') is resource_blocker:
+            return
+        if slot.get('resource_blocker') is not None:
+            slot['resource_blocker'].detach(slot['context'])
+        if resource_blocker is not None:
+            resource_blocker.attach(slot['context'])
+        slot['resource_blocker'] = resource_blocker
+
+    @staticmethod
+    def _slot_is_healthy(slot: Dict) -> bool:
+        try:
+            page = slot['page']
+            return not page.is_closed() and page.evaluate("document.readyState") == 'complete'
+        except Exception:
+            return False
+
+    def _close_slot(self, slot: Dict):
+        try:
+            slot['context'].close()
+        except Exception:
+            pass
+
+    def prewarm(self, base_url: str, capture_mode: str = 'dom'):
+        """(풀 스레드) base_url용 warm 슬롯을 warm_size개까지 채웁니다."""
+        self._assert_pool_thread()
+        self._ensure_browser(base_url)
+        slots = self._warm_slots.setdefault((base_url, capture_mode), [])
+        while len(slots) < self.warm_size:
+            slots.append(self._new_slot(base_url, capture_mode))
+            print(f"🔥 warm 페이지 준비 완료: {base_url} ({capture_mode})")
+
+    def prewarm_async(self, base_url: str, capture_mode: str = 'dom') -> Future:
+        """백그라운드(풀 스레드)에서 warm 슬롯을 준비합니다. 실패해도 다음 acquire에서 다시 시도합니다."""
+        def _prewarm():
+            try:
+                self.prewarm(base_url, capture_mode)
+            except Exception as e:
+                print(f"⚠️ warm 페이지 준비 실패 (다음 실행 시 재시도): {e}")
+        return self.submit(_prewarm)
+
+    def acquire(self, base_url: str, capture_mode: str = 'dom', resource_blocker=None, timing_profile=None) -> Dict:
+        """
+        (풀 스레드) 건강한 warm 슬롯을 빌려줍니다. 없으면 새로 만듭니다.
+
+        Args:
+            base_url: 접속할 URL
+            capture_mode: 응답 수집 방식
+            resource_blocker: 빌려 가는 실행의 리소스 차단기 (None이면 차단 안 함). warm 슬롯도 이 차단기로 교체
+            timing_profile: 빌려 가는 실행의 타이밍 프로필 (새 슬롯의 페이지 로드 타임아웃/기록에 사용)
+
+        Returns:
+            context, page, network_capture, resource_blocker 를 담은 슬롯 딕셔너리
+        """
+        self._assert_pool_thread()
+        settings = {'resource_blocker': resource_blocker, 'timing_profile': timing_profile}
+        self._ensure_browser(base_url, settings)
+        slots = self._warm_slots.setdefault((base_url, capture_mode), [])
+        while slots:
+            slot = slots.pop(0)
+            if self._slot_is_healthy(slot):
+                self._rebind_blocker(slot, resource_blocker)
+                self.lease_count += 1
+                print("♻️ warm 페이지 재사용 (브라우저 시작/페이지 로드 생략)")
+                return slot
+            print("⚠️ warm 페이지 상태 이상 - 폐기 후 새로 준비")
+            self._close_slot(slot)
+        self.lease_count += 1
+        slot = self._new_slot(base_url, capture_mode, settings)
+        self._rebind_blocker(slot, resource_blocker)
+        return slot
+
+    def release(self, slot: Dict, base_url: str, capture_mode: str = 'dom'):
+        """
+        (풀 스레드) 실행이 끝난 슬롯을 닫고, 다음 실행을 위한 warm 슬롯을 백그라운드로 준비합니다.
+        """
+        self._assert_pool_thread()
+        self._close_slot(slot)
+        self.prewarm_async(base_url, capture_mode)
+
+    def close(self):
+        """풀 브라우저를 종료합니다."""
+        def _close():
+            for slots in self._warm_slots.values():
+                for slot in slots:
+                    self._close_slot(slot)
+            if self._owner is not None:
+                self._shutdown_owner()
+        try:
+            self.submit(_close).result(timeout=30)
+        except Exception:
+            pass
+        self._executor.shutdown(wait=False)
+
+
+_pool: Optional[BrowserPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """프로세스 전역 BrowserPool 싱글톤을 반환합니다. (Streamlit 세션 간 공유)"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool()
+            atexit.register(_pool.close)
+        return _pool
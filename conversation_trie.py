@@ -0,0 +1,130 @@
+"""
+멀티턴 시나리오 prefix 공유 실행 계획 모듈
+Request Fields와 메시지 순서로 시나리오들의 prefix 트리(trie)를 만들고, 첫 메시지까지 같은 시나리오들을
+하나의 공유 실행 단위로 묶습니다. 공유 단위는 공통 prefix 턴을 한 번만 전송하고, 분기점에서 대화 상태를
+저장(save)한 뒤 가지마다 복원/복제(restore, fork)하여 이어서 실행합니다.
+공유된 턴의 응답은 그 턴을 가진 모든 시나리오 행에서 각자의 기대값으로 평가되므로 결과는 원래 test_case_id별로 남습니다.
+
+실행 계획 단계:
+    ('start', 위치)                     세션 리셋 후 위치의 행으로 채팅 초기화
+    ('send', 메시지, [위치, ...])        메시지를 한 번 전송하고 위치별 행으로 평가
+    ('save', 노드 번호)                  분기점의 대화 상태 저장
+    ('restore', 노드 번호, fork)         저장한 상태로 되돌림 (fork이면 저장 상태는 그대로 두고 복제본에서 계속)
+위치는 공유 단위의 turns/members 인덱스이며, 결과 행은 위치 순서대로 나옵니다.
+"""
+from typing import Callable, Dict, List
+
+
+class _Node:
+    __slots__ = ('message', 'entries', 'children')
+
+    def __init__(self, message: str):
+        self.message = message
+        self.entries: List[tuple] = []  # (단위, 단위 내 턴 위치)
+        self.children: Dict[str, '_Node'] = {}
+
+
+def _plan_group(first_node: _Node) -> Dict:
+    """첫 메시지 노드 아래의 시나리오들을 하나의 공유 실행 단위로 만듭니다. (깊이 우선 실행 계획)"""
+    turns, members, send_turns = [], [], []
+    # 채팅 초기화는 첫 시나리오의 첫 턴 행(위치 0)으로 수행
+    plan = [('start', 0)]
+    save_count = [0]
+
+    def visit(node: _Node):
+        positions = []
+        for unit, turn_pos in node.entries:
+            positions.append(len(turns))
+            turns.append(unit['turns'][turn_pos])
+            members.append((unit, turn_pos))
+        send_turns.append(turns[positions[0]])
+        plan.append(('send', node.message, positions))
+        children = list(node.children.values())
+        if len(children) == 1:
+            visit(children[0])
+        elif children:
+            save_count[0] += 1
+            node_id = save_count[0]
+            plan.append(('save', node_id))
+            for child_pos, child in enumerate(children):
+                # 마지막 가지는 저장한 대화를 그대로 이어 쓰고, 나머지 가지는 복제본에서 실행
+                plan.append(('restore', node_id, child_pos < len(children) - 1))
+                visit(child)
+
+    visit(first_node)
+    first_unit = members[0][0]
+    scenario_keys = list(dict.fromkeys(unit['key'] for unit, _ in members))
+    return {
+        'index': min(unit['index'] for unit, _ in members),
+        'key': f"prefix:{first_unit['key']}+{len(scenario_keys) - 1}",
+        'test_case_id': first_unit['test_case_id'],
+        'turns': turns,
+        'members': members,
+        'plan': plan,
+        'send_turns': send_turns,
+        'scenarios': scenario_keys,
+    }
+
+
+def build_prefix_units(units: List[Dict], fields_key: Callable, message_of: Callable) -> List[Dict]:
+    """
+    멀티턴 실행 단위를 prefix 트리로 묶어 공유 실행 단위를 만듭니다.
+    Request Fields와 첫 메시지가 같은 시나리오가 둘 이상이면 하나의 공유 단위가 되고, 나머지는 그대로 남습니다.
+
+    Args:
+        units: _build_units가 만든 멀티턴 실행 단위 리스트
+        fields_key: 첫 턴 행 -> 채팅 초기화 fingerprint
+        message_of: 행 -> 메시지 문자열
+
+    Returns:
+        실행 단위 리스트 (공유 단위는 members/plan/send_turns/scenarios를 추가로 가짐, 원래 순서 기준)
+    """
+    roots: Dict[tuple, _Node] = {}
+    for unit in units:
+        if not unit['turns']:
+            continue
+        first_row = unit['turns'][0][1]
+        node = roots.setdefault(fields_key(first_row), _Node(''))
+        for turn_pos, (_, row) in enumerate(unit['turns']):
+            message = message_of(row)
+            node = node.children.setdefault(message, _Node(message))
+            node.entries.append((unit, turn_pos))
+
+    grouped: Dict[int, Dict] = {}
+    for root in roots.values():
+        for first_node in root.children.values():
+            scenario_count = len({unit['index'] for unit, _ in first_node.entries})
+            if scenario_count < 2:
+                continue
+            group = _plan_group(first_node)
+            for unit, _ in group['members']:
+                grouped[unit['index']] = group
+
+    result, emitted = [], set()
+    for unit in units:
+        group = grouped.get(unit['index'])
+        if group is None:
+            result.append(unit)
+        elif id(group) not in emitted:
+            emitted.add(id(group))
+            result.append(group)
+    return result
+
+
+def sharing_report(units: List[Dict]) -> Dict:
+    """
+    공유 실행 단위의 전송 절감 통계
+
+    Returns:
+        groups(공유 단위 수), scenarios(묶인 시나리오 수), turns(평가한 턴 수), sent_turns(실제 전송 턴 수), saved_turns
+    """
+    groups = [unit for unit in units if 'plan' in unit]
+    turns = sum(len(group['turns']) for group in groups)
+    sent = sum(len(group['send_turns']) for group in groups)
+    return {
+        'groups': len(groups),
+        'scenarios': sum(len(group['scenarios']) for group in groups),
+        'turns': turns,
+        'sent_turns': sent,
+        'saved_turns': turns - sent,
+    }
@@ -0,0 +1,153 @@
+"""
+실패 전용 Playwright 트레이스 모듈
+컨텍스트마다 트레이싱(DOM 스냅샷, 네트워크)을 켜 두고 실행 단위(시나리오)마다 새 트레이스 청크를 시작합니다.
+스크린샷은 기록 비용과 용량이 크므로 NAVIQA_TRACE_SCREENSHOTS=true로 켠 경우에만 포함합니다.
+단위의 턴이 FAIL이거나 오류가 나면 청크를 압축된 trace zip으로 저장하고, 그렇지 않으면 버립니다.
+따라서 기록은 항상 현재 시나리오 하나 분량만 유지되며, 실행당 저장 용량 상한을 넘으면 더 저장하지 않습니다.
+저장된 트레이스는 `playwright show-trace <파일>`로 열어 볼 수 있습니다.
+"""
+import os
+import re
+import tempfile
+import threading
+import time
+import weakref
+from typing import Dict, List, Optional
+
+
+DEFAULT_TRACE_DIR = os.environ.get(
+    'NAVIQA_TRACE_DIR',
+    os.path.join(tempfile.gettempdir(), 'naviqa', 'traces'),
+)
+DEFAULT_TRACE_MAX_BYTES = int(float(os.environ.get('NAVIQA_TRACE_MAX_MB', '200')) * 1024 * 1024)
+DEFAULT_TRACE_SCREENSHOTS = os.environ.get('NAVIQA_TRACE_SCREENSHOTS', 'false').lower() in ('1', 'true', 'yes')
+
+
+def _safe_name(value: str) -> str:
+    return re.sub(r'[^0-9A-Za-z가-힣_.-]+', '_', str(value))[:80] or 'unit'
+
+
+class FailureTracer:
+    """실패한 실행 단위의 트레이스만 저장하는 트레이서 (워커 스레드 간 공유, 스레드 안전)"""
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: Optional[int] = None,
+                 screenshots: Optional[bool] = None):
+        """
+        Args:
+            directory: 트레이스 저장 디렉터리 (기본값: NAVIQA_TRACE_DIR 또는 /tmp/naviqa/traces)
+            max_bytes: 실행당 저장 용량 상한 (기본값: NAVIQA_TRACE_MAX_MB 또는 200MB)
+            screenshots: 트레이스에 스크린샷 포함 여부 (기본값: NAVIQA_TRACE_SCREENSHOTS 또는 False)
+        """
+        self.directory = directory or DEFAULT_TRACE_DIR
+        self.max_bytes = max_bytes if max_bytes is not None else DEFAULT_TRACE_MAX_BYTES
+        self.screenshots = screenshots if screenshots is not None else DEFAULT_TRACE_SCREENSHOTS
+        self._lock = threading.Lock()
+        # 트레이싱을 시작한 컨텍스트 (닫힌 컨텍스트는 자동으로 빠짐)
+        self._started = weakref.WeakSet()
+        self.start_run('default')
+
+    def start_run(self, run_id: str):
+        """실행마다 저장 위치(<디렉터리>/<실행 ID>)와 용량 집계를 초기화합니다."""
+        with self._lock:
+            self.run_dir = os.path.join(self.directory, _safe_name(run_id))
+            self._saved: List[Dict] = []
+            self._saved_bytes = 0
+            self._budget_exhausted = False
+            self._sequence = 0
+            self._discarded = 0
+            self._dropped = 0
+            self._errors = 0
+
+    def begin(self, context, title: str) -> bool:
+        """
+        컨텍스트에 새 트레이스 청크를 시작합니다. 처음 보는 컨텍스트면 트레이싱부터 켭니다.
+
+        Args:
+            context: Playwright BrowserContext
+            title: 트레이스 제목 (실행 단위 키)
+
+        Returns:
+            청크를 시작했으면 True
+        """
+        try:
+            if context not in self._started:
+                context.tracing.start(screenshots=self.screenshots, snapshots=True)
+                # start()가 연 첫 청크(페이지 로드 등 단위 이전 동작)는 버리고 단위별 청크만 기록
+                context.tracing.stop_chunk()
+                self._started.add(context)
+            context.tracing.start_chunk(title=title)
+            return True
+        except Exception as e:
+            print(f"⚠️ 트레이스 시작 실패 (트레이스 없이 계속): {e}")
+            with self._lock:
+                self._errors += 1
+            return False
+
+    def end(self, context, unit_key: str, keep: bool) -> Optional[str]:
+        """
+        현재 트레이스 청크를 끝냅니다. keep이면 용량 상한 안에서 저장하고, 아니면 버립니다.
+
+        Args:
+            context: begin()에 사용한 컨텍스트
+            unit_key: 실행 단위 키 (파일 이름에 사용)
+            keep: FAIL/오류가 있어 저장할지 여부
+
+        Returns:
+            저장한 트레이스 파일 경로 (저장하지 않았으면 None)
+        """
+        with self._lock:
+            budget_left = not self._budget_exhausted
+            self._sequence += 1
+            sequence = self._sequence
+        try:
+            if not keep or not budget_left:
+                context.tracing.stop_chunk()
+                with self._lock:
+                    if keep:
+                        self._dropped += 1
+                    else:
+                        self._discarded += 1
+                return None
+
+            os.makedirs(self.run_dir, exist_ok=True)
+            path = os.path.join(self.run_dir, f"{sequence:05d}_{_safe_name(unit_key)}_{int(time.time())}.zip")
+            context.tracing.stop_chunk(path=path)
+        except Exception as e:
+            print(f"⚠️ 트레이스 종료 실패: {e}")
+            with self._lock:
+                self._errors += 1
+            return None
+
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        with self._lock:
+            if self._saved_bytes + size > self.max_bytes:
+                # 이번 트레이스로 상한을 넘으면 저장하지 않고, 이후 트레이스도 저장하지 않음
+                self._dropped += 1
+                self._budget_exhausted = True
+                saved = False
+            else:
+                self._saved_bytes += size
+                self._saved.append({'unit_key': unit_key, 'path': path, 'bytes': size})
+                saved = True
+        if not saved:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            print(f"⚠️ 트레이스 용량 상한({self.max_bytes / 1024 / 1024:.0f}MB) 초과로 저장하지 않음: {unit_key}")
+            return None
+        print(f"🎞️ 실패 트레이스 저장: {path} ({size / 1024:.0f}KB)")
+        return path
+
+    def stats(self) -> Dict:
+        """이번 실행의 트레이스 저장 통계"""
+        with self._lock:
+            return {
+                'directory': self.run_dir,
+                'saved': list(self._saved),
+                'saved_bytes': self._saved_bytes,
+                'max_bytes': self.max_bytes,
+                'discarded': self._discarded,
+                'dropped_over_budget': self._dropped,
+                'errors': self._errors,
+            }
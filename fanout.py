@@ -0,0 +1,222 @@
+"""
+다중 환경 동시 실행 모듈
+같은 테스트 스위트를 여러 base_url(예: dev, staging 에이전트 빌드)에 동시에 실행하고,
+환경별 verdict, latency, 점수와 기준 환경(기본값: 첫 번째) 대비 차이를 한 표로 합칩니다.
+환경별 결과는 위치가 아니라 행 키(test_case_id/turn_number와 입력 컬럼)로 맞추므로 한 환경에서 행이 빠지거나
+순서가 바뀌어도 다른 케이스와 비교되지 않으며, 기준 환경이 실패하면 다른 환경을 기준으로 삼지 않고 오류를 냅니다.
+환경마다 별도 스레드에서 자체 Playwright/Chromium과 워커 컨텍스트를 사용합니다.
+"""
+import json
+import queue
+import threading
+from typing import Callable, Dict, List, Optional, Union
+from urllib.parse import urlparse
+
+import pandas as pd
+
+from test_automation import TestAutomation
+
+
+# 합친 표에서 환경 공통으로 한 번만 표시할 입력/기대값 컬럼
+SHARED_COLUMNS = [
+    'test_case_id', 'turn_number', 'user_id', 'lat', 'lng', 'is_driving', 'message',
+    'tts_expected', 'action_name_expected', 'action_data_expected', 'next_step_expected',
+]
+# 환경별로 표시할 결과 컬럼
+PER_ENV_COLUMNS = ['verdict', 'latency', 'tts_actual', 'action_name', 'next_step', 'fail_reason']
+SCORE_AXES = ['tts', 'action_name', 'action_data', 'next_step']
+
+
+def environment_labels(environments: Union[Dict[str, str], List[str]]) -> Dict[str, str]:
+    """
+    환경 목록을 {라벨: base_url}로 정리합니다. 리스트면 호스트 이름(중복 시 순번 추가)을 라벨로 사용합니다.
+
+    Args:
+        environments: {라벨: base_url} 또는 base_url 리스트
+
+    Returns:
+        {라벨: base_url} (입력 순서 유지, 첫 번째가 기준 환경)
+    """
+    if isinstance(environments, dict):
+        return dict(environments)
+    labels: Dict[str, str] = {}
+    for position, base_url in enumerate(environments, start=1):
+        label = urlparse(base_url).hostname or f"env{position}"
+        if label in labels:
+            label = f"{label}#{position}"
+        labels[label] = base_url
+    return labels
+
+
+def _scores(value) -> Dict[str, float]:
+    try:
+        return json.loads(value) if isinstance(value, str) else dict(value or {})
+    except (TypeError, ValueError):
+        return {}
+
+
+def _keyed_by_case(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    결과 행의 인덱스를 행 키로 바꿉니다.
+    행 키는 공통 입력 컬럼(test_case_id, turn_number, Request Fields, 메시지, 기대값) 값과 같은 입력이 몇 번째로 나왔는지로 만듭니다.
+    """
+    frame = frame.reset_index(drop=True)
+    key_columns = [column for column in SHARED_COLUMNS if column in frame.columns]
+    if not key_columns or frame.empty:
+        return frame
+    case_key = frame[key_columns].astype(str).agg('\x1f'.join, axis=1)
+    occurrence = case_key.groupby(case_key).cumcount()
+    frame.index = case_key + '\x1f#' + occurrence.astype(str)
+    return frame
+
+
+def join_environment_results(results: Dict[str, pd.DataFrame], baseline_label: str) -> pd.DataFrame:
+    """
+    환경별 결과를 행 키(test_case_id/turn_number와 입력 컬럼) 기준으로 기준 환경의 행에 맞춰 합칩니다.
+    다른 환경에 없는 행은 그 환경의 결과 컬럼이 비어 있습니다.
+
+    Args:
+        results: {라벨: run_tests 결과 DataFrame}
+        baseline_label: 기준 환경 라벨
+
+    Returns:
+        공통 입력 컬럼 + 환경별 결과 컬럼(<컬럼>_<라벨>) + 기준 환경 대비 차이 컬럼
+
+    Raises:
+        ValueError: 기준 환경 결과가 없거나 비어 있을 때
+    """
+    if baseline_label not in results or results[baseline_label].empty:
+        raise ValueError(f"기준 환경 {baseline_label}의 결과가 없습니다.")
+    labels = [baseline_label] + [label for label in results if label != baseline_label]
+    baseline = _keyed_by_case(results[baseline_label])
+    joined = baseline[[column for column in SHARED_COLUMNS if column in baseline.columns]].copy()
+
+    for label in labels:
+        frame = _keyed_by_case(results[label])
+        for column in PER_ENV_COLUMNS:
+            joined[f"{column}_{label}"] = frame[column] if column in frame.columns else None
+        scores = frame['scores'].map(_scores) if 'scores' in frame.columns else pd.Series([{}] * len(frame), index=frame.index)
+        for axis in SCORE_AXES:
+            joined[f"score_{axis}_{label}"] = scores.map(lambda item: item.get(axis))
+
+    for label in labels[1:]:
+        joined[f"verdict_changed_{label}"] = joined[f"verdict_{label}"] != joined[f"verdict_{baseline_label}"]
+        joined[f"latency_delta_{label}"] = (
+            pd.to_numeric(joined[f"latency_{label}"], errors='coerce')
+            - pd.to_numeric(joined[f"latency_{baseline_label}"], errors='coerce')
+        )
+        for axis in SCORE_AXES:
+            joined[f"score_delta_{axis}_{label}"] = (
+                pd.to_numeric(joined[f"score_{axis}_{label}"], errors='coerce')
+                - pd.to_numeric(joined[f"score_{axis}_{baseline_label}"], errors='coerce')
+            )
+    return joined.reset_index(drop=True)
+
+
+def run_multi_environment(test_cases: pd.DataFrame, environments: Union[Dict[str, str], List[str]],
+                          workers: int = 1, progress_callback=None,
+                          automation_factory: Optional[Callable[[str], TestAutomation]] = None,
+                          return_per_environment: bool = False, baseline_label: Optional[str] = None):
+    """
+    같은 스위트를 여러 환경에 동시에 실행하고 결과를 한 표로 합칩니다.
+
+    Args:
+        test_cases: 테스트 케이스 DataFrame
+        environments: {라벨: base_url} 또는 base_url 리스트
+        workers: 환경별 병렬 워커 수
+        progress_callback: 전체 진행 상황 콜백 (current, total, elapsed_time, estimated_remaining).
+            호출한 스레드에서 실행되므로 UI 요소를 안전하게 갱신할 수 있습니다.
+        automation_factory: base_url -> TestAutomation (기본값: TestAutomation(base_url=base_url))
+        return_per_environment: True이면 (합친 결과, {라벨: 환경별 결과 DataFrame})을 반환
+        baseline_label: 기준 환경 라벨 (기본값: environments의 첫 번째 환경)
+
+    Returns:
+        합친 결과 DataFrame. attrs['environments']에 환경별 base_url, 실행 리포트, 오류가 담깁니다.
+
+    Raises:
+        ValueError: baseline_label이 environments에 없을 때
+        RuntimeError: 기준 환경이 실패했거나 결과가 비어 있을 때 (다른 환경을 기준으로 대신 쓰지 않음)
+    """
+    labels = environment_labels(environments)
+    if baseline_label is None:
+        baseline_label = next(iter(labels))
+    if baseline_label not in labels:
+        raise ValueError(f"기준 환경 {baseline_label}이(가) 실행 환경 목록에 없습니다: {', '.join(labels)}")
+    factory = automation_factory or (lambda base_url: TestAutomation(base_url=base_url))
+    print(f"🌐 다중 환경 실행: {', '.join(f'{label}={url}' for label, url in labels.items())}")
+
+    event_queue = queue.Queue()
+    results: Dict[str, pd.DataFrame] = {}
+    reports: Dict[str, Dict] = {}
+    errors: Dict[str, Exception] = {}
+
+    def run_environment(label: str, base_url: str):
+        automation = None
+        try:
+            automation = factory(base_url)
+            frame = automation.run_tests(
+                test_cases,
+                progress_callback=lambda **progress: event_queue.put(('progress', label, progress)),
+                workers=workers,
+            )
+            event_queue.put(('done', label, (frame, automation.run_report)))
+        except Exception as e:
+            print(f"❌ 환경 {label} 실행 실패: {e}")
+            event_queue.put(('error', label, (e, automation.run_report if automation is not None else {})))
+
+    threads = [
+        threading.Thread(target=run_environment, args=(label, base_url), name=f"naviqa-env-{label}", daemon=True)
+        for label, base_url in labels.items()
+    ]
+    for thread in threads:
+        thread.start()
+
+    # 환경별 진행 상황을 합쳐 호출 스레드에서 콜백 실행
+    env_progress: Dict[str, Dict] = {}
+    remaining = len(threads)
+    while remaining:
+        kind, label, payload = event_queue.get()
+        if kind == 'progress':
+            env_progress[label] = payload
+            if progress_callback:
+                progress_callback(
+                    current=sum(item['current'] for item in env_progress.values()),
+                    total=sum(item['total'] for item in env_progress.values()) * len(labels) // len(env_progress),
+                    elapsed_time=max(item['elapsed_time'] for item in env_progress.values()),
+                    estimated_remaining=max(item['estimated_remaining'] for item in env_progress.values()),
+                )
+        elif kind == 'done':
+            results[label], reports[label] = payload
+            remaining -= 1
+        elif kind == 'error':
+            errors[label], reports[label] = payload
+            remaining -= 1
+    for thread in threads:
+        thread.join()
+
+    if baseline_label not in results or results[baseline_label].empty:
+        baseline_error = errors.get(baseline_label)
+        raise RuntimeError(
+            f"기준 환경 {baseline_label}({labels[baseline_label]}) 결과를 얻지 못했습니다: {baseline_error or '결과 없음'}"
+        ) from baseline_error
+
+    ordered_results = {label: results[label] for label in labels if label in results}
+    joined = join_environment_results(ordered_results, baseline_label)
+    joined.attrs['environments'] = {
+        label: {
+            'base_url': base_url,
+            'run_report': reports.get(label, {}),
+            'error': str(errors[label]) if label in errors else None,
+        }
+        for label, base_url in labels.items()
+    }
+
+    for label in ordered_results:
+        if label == baseline_label:
+            continue
+        changed = int(joined[f"verdict_changed_{label}"].sum())
+        print(f"🌐 {label}: 기준 환경 대비 verdict 변경 {changed}건, "
+              f"평균 latency 차이 {joined[f'latency_delta_{label}'].mean():.0f}ms")
+    if return_per_environment:
+        return joined, ordered_results
+    return joined
@@ -0,0 +1,207 @@
+"""
+동시성 조절 모듈
+공유 개발 서버(예: navi-agent-adk-api.dev.onkakao.net)를 과부하시키지 않도록
+메시지 전송을 초당 요청 수 상한(토큰 버킷)으로 제한하고, 병렬 워커 수를 AIMD 방식으로 조절합니다.
+AIMD는 초당 요청 수 상한이 있는 대상에만 기본으로 적용하며, 상한이 없는 대상은 요청한 워커 수로 바로 실행합니다.
+- 최근 턴 지연 시간이 기준선 대비 안정적이고 오류율이 낮으면 동시 실행 수를 1씩 늘림 (additive increase)
+- 지연 시간이 크게 늘거나 오류율이 높아지면 동시 실행 수를 절반으로 줄임 (multiplicative decrease)
+모든 결정은 report()로 실행 리포트에 남깁니다.
+"""
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+
+# 대상 호스트별 기본 초당 요청 수 상한 (NAVIQA_MAX_RPS로 덮어씀)
+TARGET_RPS_LIMITS = {
+    'navi-agent-adk-api.dev.onkakao.net': 2.0,
+}
+
+# AIMD 판단 기준
+INCREASE_LATENCY_RATIO = 1.3   # 창 중앙값 <= 기준선 x 1.3 이면 증가
+DECREASE_LATENCY_RATIO = 2.0   # 창 중앙값 > 기준선 x 2.0 이면 감소
+INCREASE_MAX_ERROR_RATE = 0.05
+DECREASE_ERROR_RATE = 0.2
+
+
+def default_rps_for(target_url: str) -> Optional[float]:
+    """
+    대상 URL의 초당 요청 수 상한을 반환합니다.
+
+    Args:
+        target_url: 실제로 요청을 받는 URL (UI 드라이버는 base_url, API 드라이버는 api_url)
+
+    Returns:
+        상한 (NAVIQA_MAX_RPS > 호스트별 기본값). 0 이하이거나 없으면 None (제한 없음)
+    """
+    env_rps = os.environ.get('NAVIQA_MAX_RPS')
+    rps = float(env_rps) if env_rps else TARGET_RPS_LIMITS.get(urlparse(target_url).hostname or '')
+    return rps if rps and rps > 0 else None
+
+
+class TokenBucket:
+    """초당 rate개, 최대 capacity개까지 모아 둘 수 있는 토큰 버킷 (스레드 안전)"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else 1.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """토큰 하나를 얻을 때까지 기다립니다. 기다린 시간(초)을 반환합니다."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class ConcurrencyGovernor:
+    """초당 요청 수 상한과 AIMD 동시 실행 수 조절기 (워커 스레드 간 공유)"""
+
+    def __init__(self, max_workers: int, rps: Optional[float] = None, adaptive: Optional[bool] = None,
+                 initial_workers: Optional[int] = None, min_workers: int = 1):
+        """
+        Args:
+            max_workers: 동시 실행 수 상한 (실행 요청한 워커 수)
+            rps: 메시지 전송 초당 요청 수 상한 (None이면 제한 없음)
+            adaptive: AIMD 조절 사용 여부 (기본값: rps 상한이 있고 NAVIQA_ADAPTIVE_WORKERS가 켜져 있으면(기본 켜짐) True)
+            initial_workers: 시작 동시 실행 수 (기본값: AIMD를 쓰면 min(2, max_workers), 아니면 max_workers)
+            min_workers: 동시 실행 수 하한
+        """
+        if adaptive is None:
+            # 상한이 없는 대상은 보호할 공유 서버가 아니므로 요청한 워커 수를 그대로 사용
+            adaptive = rps is not None and os.environ.get('NAVIQA_ADAPTIVE_WORKERS', 'true').lower() in ('1', 'true', 'yes')
+        self.max_workers = max(1, max_workers)
+        self.min_workers = max(1, min(min_workers, self.max_workers))
+        self.adaptive = adaptive and self.max_workers > 1
+        if initial_workers is None:
+            initial_workers = min(2, self.max_workers) if self.adaptive else self.max_workers
+        self.limit = max(self.min_workers, min(initial_workers, self.max_workers))
+        self.initial_workers = self.limit
+        self.rps = rps
+        self._bucket = TokenBucket(rps) if rps else None
+        self._condition = threading.Condition()
+        self._active = 0
+        self._peak_active = 0
+        self._window: List[tuple] = []
+        self._baseline_ms: Optional[float] = None
+        self._throttled_seconds = 0.0
+        self._requests = 0
+        self._started = time.monotonic()
+        self.decisions: List[Dict] = []
+
+    # ------------------------------------------------------------------
+    # 동시 실행 슬롯 (실행 단위 단위)
+    # ------------------------------------------------------------------
+    def acquire_slot(self, should_stop: Callable[[], bool]) -> bool:
+        """
+        동시 실행 수가 상한보다 작아질 때까지 기다렸다가 슬롯을 얻습니다.
+
+        Args:
+            should_stop: True를 반환하면 기다리지 않고 포기 (예: 남은 단위가 없음)
+
+        Returns:
+            슬롯을 얻었으면 True
+        """
+        with self._condition:
+            while self._active >= self.limit:
+                if should_stop():
+                    return False
+                self._condition.wait(timeout=0.5)
+            if should_stop():
+                return False
+            self._active += 1
+            self._peak_active = max(self._peak_active, self._active)
+            return True
+
+    def release_slot(self):
+        with self._condition:
+            self._active -= 1
+            self._condition.notify_all()
+
+    # ------------------------------------------------------------------
+    # 요청 속도 제한 및 관측
+    # ------------------------------------------------------------------
+    def acquire_request(self):
+        """메시지 전송 전에 호출합니다. 초당 요청 수 상한을 넘지 않도록 기다립니다."""
+        if self._bucket is not None:
+            waited = self._bucket.acquire()
+            with self._condition:
+                self._throttled_seconds += waited
+        with self._condition:
+            self._requests += 1
+
+    def observe(self, latency_ms: Optional[float], is_error: bool):
+        """
+        턴 결과를 기록하고, 관측 창이 차면 동시 실행 수를 조절합니다.
+
+        Args:
+            latency_ms: 턴 지연 시간 (오류로 측정하지 못했으면 None)
+            is_error: 인프라 오류 여부
+        """
+        if not self.adaptive:
+            return
+        with self._condition:
+            self._window.append((latency_ms, is_error))
+            if len(self._window) < max(4, self.limit * 2):
+                return
+            window, self._window = self._window, []
+            latencies = sorted(value for value, _ in window if value is not None)
+            error_rate = sum(1 for _, error in window if error) / len(window)
+            median_ms = latencies[len(latencies) // 2] if latencies else None
+            if median_ms is not None and (self._baseline_ms is None or median_ms < self._baseline_ms):
+                self._baseline_ms = median_ms
+
+            before = self.limit
+            if error_rate > DECREASE_ERROR_RATE or (
+                    median_ms is not None and median_ms > self._baseline_ms * DECREASE_LATENCY_RATIO):
+                self.limit = max(self.min_workers, self.limit // 2)
+                action = 'decrease'
+            elif error_rate <= INCREASE_MAX_ERROR_RATE and (
+                    median_ms is None or median_ms <= self._baseline_ms * INCREASE_LATENCY_RATIO):
+                self.limit = min(self.max_workers, self.limit + 1)
+                action = 'increase'
+            else:
+                action = 'hold'
+            if self.limit == before and action != 'hold':
+                action = 'hold'
+            self.decisions.append({
+                'elapsed_s': round(time.monotonic() - self._started, 1),
+                'action': action,
+                'workers_before': before,
+                'workers_after': self.limit,
+                'median_latency_ms': median_ms,
+                'baseline_latency_ms': self._baseline_ms,
+                'error_rate': round(error_rate, 3),
+            })
+            if action != 'hold':
+                print(f"🎛️ 동시 실행 수 {'증가' if action == 'increase' else '감소'}: {before} -> {self.limit} "
+                      f"(지연 중앙값 {median_ms}ms, 기준 {self._baseline_ms}ms, 오류율 {error_rate:.0%})")
+            self._condition.notify_all()
+
+    def report(self) -> Dict:
+        """조절 결정과 속도 제한 통계를 반환합니다."""
+        with self._condition:
+            return {
+                'max_workers': self.max_workers,
+                'initial_workers': self.initial_workers,
+                'final_workers': self.limit,
+                'peak_active_workers': self._peak_active,
+                'adaptive': self.adaptive,
+                'rps_limit': self.rps,
+                'requests': self._requests,
+                'throttled_seconds': round(self._throttled_seconds, 2),
+                'decisions': list(self.decisions),
+            }
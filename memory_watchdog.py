@@ -0,0 +1,309 @@
+"""
+Chromium 메모리 감시 모듈
+이번 실행이 띄운 Chromium 브라우저 프로세스와 그 하위 프로세스들(렌더러, GPU/유틸리티)의 메모리 사용량을 주기적으로 측정하고,
+설정한 임계값을 넘으면 다음 실행 단위(시나리오) 경계에서 컨텍스트 또는 브라우저를 새로 만들도록 요청합니다.
+1Gi 파드에서 긴 멀티턴 실행 중 채팅 DOM이 쌓여 OOM으로 종료되는 것을 막기 위한 용도입니다.
+같은 프로세스의 다른 Chromium(환경 비교 실행, 다른 실행)은 합산하지 않도록, 실행 인자에 넣은 표식으로
+이번 실행의 브라우저 PID를 찾아 그 하위만 측정합니다. 상주 브라우저 풀에서 페이지를 빌린 실행은 풀 브라우저 PID를 측정하며,
+브라우저를 다른 실행과 공유하므로 재시작 대신 빌린 컨텍스트만 재생성합니다.
+
+메모리는 /proc/<pid>/smaps_rollup의 PSS(공유 페이지를 프로세스 수로 나눈 값)를 합산하며,
+읽을 수 없으면 /proc/<pid>/status의 VmRSS를 사용합니다. /proc이 없는 환경(macOS 등)에서는 감시하지 않습니다.
+"""
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+DEFAULT_RECYCLE_MB = float(os.environ.get('NAVIQA_MEMORY_RECYCLE_MB', '650'))
+DEFAULT_RESTART_MB = float(os.environ.get('NAVIQA_MEMORY_RESTART_MB', '800'))
+DEFAULT_SAMPLE_SECONDS = float(os.environ.get('NAVIQA_MEMORY_SAMPLE_SECONDS', '5'))
+
+# Chromium 프로세스로 볼 실행 파일 이름 일부 (chromium, chrome, headless_shell)
+CHROMIUM_PROCESS_MARKERS = ('chrom', 'headless_shell')
+# 리포트에 보관하는 최근 측정값 수
+MAX_SAMPLES = 720
+
+ACTION_CONTEXT = 'context'
+ACTION_BROWSER = 'browser'
+
+
+def _children_map() -> Dict[int, List[int]]:
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'r') as f:
+                # comm에 공백/괄호가 있을 수 있으므로 마지막 ')' 뒤에서 ppid를 읽음
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    return children
+
+
+def _cmdline(pid: int) -> List[str]:
+    try:
+        with open(f'/proc/{pid}/cmdline', 'rb') as f:
+            return [arg.decode('utf-8', 'replace') for arg in f.read().split(b'\0') if arg]
+    except OSError:
+        return []
+
+
+def _is_chromium(pid: int) -> bool:
+    args = _cmdline(pid)
+    if not args:
+        return False
+    name = os.path.basename(args[0]).lower()
+    return any(marker in name for marker in CHROMIUM_PROCESS_MARKERS)
+
+
+def find_browser_pid(marker: str) -> Optional[int]:
+    """
+    실행 인자에 marker가 있는 Chromium 브라우저(최상위) 프로세스를 찾습니다.
+
+    Args:
+        marker: start_browser가 실행 인자에 추가한 표식 (예: '--naviqa-run=<id>')
+
+    Returns:
+        브라우저 PID (/proc이 없거나 찾지 못하면 None)
+    """
+    if not os.path.isdir('/proc'):
+        return None
+    matches = [int(entry) for entry in os.listdir('/proc') if entry.isdigit() and marker in _cmdline(int(entry))]
+    children = _children_map() if len(matches) > 1 else {}
+    for pid in matches:
+        # 하위 프로세스가 같은 인자를 물려받았더라도 부모가 일치하지 않는 프로세스가 브라우저
+        if not any(pid in children.get(other, []) for other in matches):
+            return pid
+    return None
+
+
+def chromium_pids(root_pid: int) -> List[int]:
+    """root_pid(브라우저 프로세스)와 그 하위 프로세스 중 Chromium 프로세스 목록"""
+    children = _children_map()
+    pids, stack = [], [root_pid]
+    while stack:
+        pid = stack.pop()
+        if _is_chromium(pid):
+            pids.append(pid)
+        stack.extend(children.get(pid, []))
+    return pids
+
+
+def _process_memory_kb(pid: int) -> Tuple[int, str]:
+    try:
+        with open(f'/proc/{pid}/smaps_rollup', 'r') as f:
+            for line in f:
+                if line.startswith('Pss:'):
+                    return int(line.split()[1]), 'pss'
+    except (OSError, ValueError):
+        pass
+    try:
+        with open(f'/proc/{pid}/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]), 'rss'
+    except (OSError, ValueError):
+        pass
+    return 0, 'rss'
+
+
+def chromium_memory_mb(root_pid: Optional[int]) -> Optional[Dict]:
+    """
+    브라우저 프로세스(root_pid)와 그 하위 Chromium 프로세스들의 메모리 사용량 합계를 측정합니다.
+
+    Returns:
+        {'mb': 합계(MB), 'processes': 프로세스 수, 'metric': 'pss' 또는 'rss'} (/proc이 없거나 root_pid가 없으면 None)
+    """
+    if root_pid is None or not os.path.isdir('/proc'):
+        return None
+    total_kb, metric = 0, 'pss'
+    pids = chromium_pids(root_pid)
+    for pid in pids:
+        kb, pid_metric = _process_memory_kb(pid)
+        total_kb += kb
+        if pid_metric == 'rss':
+            metric = 'rss'
+    return {'mb': round(total_kb / 1024, 1), 'processes': len(pids), 'metric': metric}
+
+
+class MemoryWatchdog:
+    """Chromium 메모리 감시 및 재생성 요청 (워커 스레드 간 공유, 스레드 안전)"""
+
+    def __init__(self, recycle_mb: Optional[float] = None, restart_mb: Optional[float] = None,
+                 interval_seconds: Optional[float] = None):
+        """
+        Args:
+            recycle_mb: 넘으면 다음 단위 경계에서 브라우저 컨텍스트를 새로 만듦 (기본값: NAVIQA_MEMORY_RECYCLE_MB 또는 650)
+            restart_mb: 넘으면 다음 단위 경계에서 브라우저를 재시작 (기본값: NAVIQA_MEMORY_RESTART_MB 또는 800).
+                병렬 실행/브라우저 풀처럼 브라우저를 공유하는 경우에는 컨텍스트 재생성으로 대체합니다.
+            interval_seconds: 측정 주기 (기본값: NAVIQA_MEMORY_SAMPLE_SECONDS 또는 5초)
+        """
+        self.recycle_mb = recycle_mb if recycle_mb is not None else DEFAULT_RECYCLE_MB
+        self.restart_mb = restart_mb if restart_mb is not None else DEFAULT_RESTART_MB
+        self.interval_seconds = interval_seconds if interval_seconds is not None else DEFAULT_SAMPLE_SECONDS
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.browser_pid: Optional[int] = None
+        self._reset_state()
+
+    def _reset_state(self):
+        self._samples: List[Dict] = []
+        self._peak_mb = 0.0
+        self._metric: Optional[str] = None
+        self._generation = 0
+        self._pending_action: Optional[str] = None
+        self._awaiting_recycle = False
+        # 단위 경계 검사를 하는 워커(스레드 이름)와, 마지막 요청을 아직 처리하지 않은 워커
+        self._workers: set = set()
+        self._pending_workers: set = set()
+        self._recycles: List[Dict] = []
+        self._started = time.monotonic()
+
+    # ------------------------------------------------------------------
+    # 측정
+    # ------------------------------------------------------------------
+    def start(self, browser_pid: Optional[int]):
+        """
+        측정 기록을 초기화하고 백그라운드 측정 스레드를 시작합니다.
+
+        Args:
+            browser_pid: 이번 실행이 사용하는 브라우저 프로세스 PID (직접 띄운 브라우저 또는 상주 풀 브라우저, 없으면 감시하지 않음)
+        """
+        self.stop()
+        with self._lock:
+            self._reset_state()
+        self.browser_pid = browser_pid
+        if chromium_memory_mb(browser_pid) is None:
+            print("⚠️ 이번 실행의 브라우저 프로세스를 찾을 수 없어(/proc 없음 또는 다른 인스턴스가 띄운 브라우저) Chromium 메모리 감시를 사용하지 않습니다.")
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='naviqa-memory-watchdog', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join(timeout=self.interval_seconds + 1)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                self.sample()
+            except Exception as e:
+                print(f"⚠️ Chromium 메모리 측정 실패: {e}")
+
+    def sample(self) -> Optional[float]:
+        """
+        메모리를 측정하고, 임계값을 넘었으면 다음 단위 경계에서의 재생성을 요청합니다.
+
+        Returns:
+            Chromium 메모리 합계 (MB, 측정할 수 없으면 None)
+        """
+        measured = chromium_memory_mb(self.browser_pid)
+        if measured is None:
+            return None
+        memory_mb = measured['mb']
+        with self._lock:
+            self._metric = measured['metric']
+            self._peak_mb = max(self._peak_mb, memory_mb)
+            self._samples.append({
+                'elapsed_s': round(time.monotonic() - self._started, 1),
+                'mb': memory_mb,
+                'processes': measured['processes'],
+            })
+            del self._samples[:-MAX_SAMPLES]
+
+            if memory_mb >= self.restart_mb:
+                action = ACTION_BROWSER
+            elif memory_mb >= self.recycle_mb:
+                action = ACTION_CONTEXT
+            else:
+                action = None
+            # 모든 워커가 재생성을 마친 뒤의 측정값으로만 다음 요청을 판단 (같은 초과로 연속 요청하지 않음)
+            if action and not self._awaiting_recycle:
+                self._generation += 1
+                self._pending_action = action
+                self._pending_workers = set(self._workers)
+                self._awaiting_recycle = bool(self._pending_workers)
+                print(f"🧠 Chromium 메모리 {memory_mb:.0f}MB (임계값 {self.recycle_mb:.0f}/{self.restart_mb:.0f}MB) "
+                      f"- 다음 시나리오 경계에서 {'브라우저 재시작' if action == ACTION_BROWSER else '컨텍스트 재생성'}")
+        return memory_mb
+
+    # ------------------------------------------------------------------
+    # 단위 경계에서의 재생성
+    # ------------------------------------------------------------------
+    @property
+    def generation(self) -> int:
+        """지금까지 요청된 재생성 번호"""
+        with self._lock:
+            return self._generation
+
+    def pending_action(self, seen_generation: int) -> Tuple[Optional[str], int]:
+        """
+        seen_generation 이후에 요청된 재생성이 있는지 확인합니다.
+
+        Args:
+            seen_generation: 호출한 워커가 마지막으로 처리한 요청 번호
+
+        Returns:
+            (재생성 종류 'context'/'browser' 또는 None, 현재 요청 번호)
+        """
+        with self._lock:
+            if self._generation > seen_generation:
+                return self._pending_action, self._generation
+            return None, self._generation
+
+    def attach_worker(self, worker: str):
+        """단위 경계에서 재생성 요청을 확인하는 워커를 등록합니다. (요청은 등록된 워커가 모두 처리해야 끝남)"""
+        with self._lock:
+            self._workers.add(worker)
+
+    def detach_worker(self, worker: str):
+        """끝난 워커를 등록 해제합니다. 처리하지 않은 요청이 있으면 처리한 것으로 봅니다."""
+        with self._lock:
+            self._workers.discard(worker)
+            self._acknowledge(worker)
+
+    def _acknowledge(self, worker: str):
+        self._pending_workers.discard(worker)
+        if not self._pending_workers:
+            self._awaiting_recycle = False
+
+    def set_browser_pid(self, browser_pid: Optional[int]):
+        """브라우저를 재시작한 뒤 새 브라우저 프로세스를 감시합니다."""
+        with self._lock:
+            self.browser_pid = browser_pid
+
+    def record_recycle(self, action: str, before_mb: Optional[float], after_mb: Optional[float],
+                       worker: str, error: Optional[str] = None):
+        """수행한 재생성을 기록합니다. (모든 워커가 처리하면 다음 측정부터 새 요청 가능)"""
+        with self._lock:
+            self._acknowledge(worker)
+            self._recycles.append({
+                'elapsed_s': round(time.monotonic() - self._started, 1),
+                'action': action,
+                'worker': worker,
+                'before_mb': before_mb,
+                'after_mb': after_mb,
+                'error': error,
+            })
+        freed = f", {before_mb - after_mb:.0f}MB 감소" if before_mb is not None and after_mb is not None else ""
+        print(f"🧠 {'브라우저 재시작' if action == ACTION_BROWSER else '컨텍스트 재생성'} 완료 ({worker}{freed})")
+
+    def report(self) -> Dict:
+        """측정값과 재생성 내역을 반환합니다."""
+        with self._lock:
+            return {
+                'metric': self._metric,
+                'recycle_mb': self.recycle_mb,
+                'restart_mb': self.restart_mb,
+                'peak_mb': self._peak_mb,
+                'samples': list(self._samples),
+                'recycles': list(self._recycles),
+            }
@@ -0,0 +1,197 @@
+"""
+로컬 모의 에이전트 서버
+실제 에이전트 API 대신 사용할 수 있는 오프라인 HTTP 서버입니다.
+ApiTestAutomation(직접 API 호출 드라이버)과 평가 파이프라인을 네트워크 없이 테스트할 때 사용합니다.
+
+요청 (POST /chat, JSON):
+    {"session_id": str, "user_id": str, "lat": float, "lng": float, "is_driving": bool, "message": str}
+
+응답 (JSON):
+    {"tts": str, "action": [{"name": str, "data": str}], "next_step": str}
+
+세션 복제 (POST /sessions/clone, JSON):
+    {"source_session_id": str, "session_id": str}
+    원본 세션의 대화 상태를 새 세션으로 복사합니다. (멀티턴 prefix 공유 실행에서 분기점의 대화를 fork할 때 사용)
+    원본 세션이 없으면 404
+"""
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Tuple
+
+
+# 메시지 키워드별 응답 규칙 (앞에서부터 먼저 매칭되는 규칙 사용)
+RESPONSE_RULES = [
+    {
+        'keywords': ['길안내', '안내해', '가자', '가줘'],
+        'tts': '{destination}(으)로 길안내를 시작할게요.',
+        'action_name': 'deepLink',
+        'action_data': {'type': 'route', 'params': {'destination': '{destination}'}},
+        'next_step': 'END',
+    },
+    {
+        'keywords': ['검색', '찾아', '어디'],
+        'tts': '{destination} 검색 결과를 보여드릴게요. 어디로 안내할까요?',
+        'action_name': 'deepLink',
+        'action_data': {'type': 'search', 'params': {'query': '{destination}'}},
+        'next_step': 'CONTINUE',
+    },
+    {
+        'keywords': ['취소', '그만'],
+        'tts': '길안내를 종료할게요.',
+        'action_name': 'deepLink',
+        'action_data': {'type': 'cancel', 'params': {}},
+        'next_step': 'END',
+    },
+]
+
+DEFAULT_RESPONSE = {
+    'tts': '죄송해요, 다시 한 번 말씀해 주세요.',
+    'action_name': '',
+    'action_data': None,
+    'next_step': 'END',
+}
+
+
+def _fill(value, destination: str):
+    """응답 템플릿의 {destination}을 채웁니다."""
+    if isinstance(value, str):
+        return value.replace('{destination}', destination)
+    if isinstance(value, dict):
+        return {key: _fill(item, destination) for key, item in value.items()}
+    return value
+
+
+def build_agent_response(message: str, session_turn: int = 1) -> Dict:
+    """
+    메시지에 대한 결정적(deterministic) 모의 응답을 만듭니다.
+
+    Args:
+        message: 사용자 메시지
+        session_turn: 세션 내 몇 번째 턴인지 (1부터)
+
+    Returns:
+        에이전트 응답 딕셔너리
+    """
+    text = str(message or '').strip()
+    # 첫 단어를 목적지로 간주 (예: "강남역 길안내 해줘" -> "강남역")
+    destination = text.split()[0] if text else ''
+
+    rule = DEFAULT_RESPONSE
+    for candidate in RESPONSE_RULES:
+        if any(keyword in text for keyword in candidate['keywords']):
+            rule = candidate
+            break
+
+    action = []
+    if rule['action_name']:
+        action_data = _fill(rule['action_data'], destination)
+        action_data['turn'] = session_turn
+        action.append({
+            'name': rule['action_name'],
+            'data': json.dumps({'payload': action_data}, ensure_ascii=False),
+        })
+
+    return {
+        'tts': _fill(rule['tts'], destination),
+        'action': action,
+        'next_step': rule['next_step'],
+    }
+
+
+class MockAgentHandler(BaseHTTPRequestHandler):
+    """모의 에이전트 요청 처리기 (HTTP/1.1 keep-alive 지원)"""
+
+    protocol_version = 'HTTP/1.1'
+    # 응답 지연 시뮬레이션 (ms)
+    latency_ms = int(os.environ.get('MOCK_AGENT_LATENCY_MS', '0'))
+    sessions: Dict[str, int] = {}
+    sessions_lock = threading.Lock()
+
+    def _send_json(self, status: int, body: Dict):
+        payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._send_json(200, {'status': 'healthy'})
+        else:
+            self._send_json(404, {'error': 'not found'})
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', '0'))
+        raw_body = self.rfile.read(length) if length else b''
+
+        path = self.path.rstrip('/')
+        if path not in ('/chat', '/sessions/clone'):
+            self._send_json(404, {'error': 'not found'})
+            return
+
+        try:
+            request = json.loads(raw_body or b'{}')
+        except json.JSONDecodeError:
+            self._send_json(400, {'error': 'invalid json'})
+            return
+
+        if path == '/sessions/clone':
+            self._clone_session(request)
+            return
+
+        session_id = str(request.get('session_id', ''))
+        with self.sessions_lock:
+            session_turn = self.sessions.get(session_id, 0) + 1
+            self.sessions[session_id] = session_turn
+
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+
+        self._send_json(200, build_agent_response(request.get('message', ''), session_turn))
+
+    def _clone_session(self, request: Dict):
+        source_id = str(request.get('source_session_id', ''))
+        session_id = str(request.get('session_id', ''))
+        with self.sessions_lock:
+            if source_id not in self.sessions or not session_id:
+                self._send_json(404, {'error': 'unknown source session'})
+                return
+            self.sessions[session_id] = self.sessions[source_id]
+            session_turn = self.sessions[session_id]
+        self._send_json(200, {'session_id': session_id, 'turns': session_turn})
+
+    def log_message(self, format, *args):
+        # 요청 로그는 출력하지 않음
+        pass
+
+
+def start_mock_agent_server(host: str = '127.0.0.1', port: int = 0) -> Tuple[ThreadingHTTPServer, str]:
+    """
+    백그라운드 스레드에서 모의 에이전트 서버를 시작합니다.
+
+    Args:
+        host: 바인딩 주소
+        port: 포트 (0이면 빈 포트 자동 선택)
+
+    Returns:
+        (server, chat_url) 튜플. 종료 시 server.shutdown() 호출
+    """
+    server = ThreadingHTTPServer((host, port), MockAgentHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    chat_url = f"http://{host}:{server.server_address[1]}/chat"
+    return server, chat_url
+
+
+if __name__ == '__main__':
+    # 직접 실행 시 모의 에이전트 서버 시작
+    port = int(os.environ.get('MOCK_AGENT_PORT', '8765'))
+    server = ThreadingHTTPServer(('0.0.0.0', port), MockAgentHandler)
+    server.daemon_threads = True
+    print(f"🤖 모의 에이전트 서버 실행 중: http://0.0.0.0:{port}/chat")
+    server.serve_forever()
@@ -0,0 +1,262 @@
+"""
+명령줄 배치 실행기
+Streamlit 업로드 화면 없이 테스트 스위트를 실행합니다. (야간 CI, 대규모 스위트)
+결과 파일과 함께 판정 요약과 실행 리포트(run_report: 단계별 소요 시간, makespan, 재시도 등)를 JSON으로 저장하고,
+판정 기준에 따라 종료 코드를 반환합니다.
+
+사용 예:
+    python -m naviqa run suite.xlsx --workers 8 --out results.parquet
+    python -m naviqa run suite.xlsx --shard 3/10 --out shard3.csv --min-pass-rate 0.95 --max-fail 5
+    python -m naviqa run suite.xlsx --driver api --api-url http://127.0.0.1:8765/chat --out results.jsonl
+
+종료 코드:
+    0  판정 기준 통과
+    1  판정 기준 미달 (FAIL 수 초과 또는 통과율 미달)
+    2  입력 오류 (파일 없음, 필수 컬럼 누락, 잘못된 옵션)
+    3  실행 오류 (브라우저/에이전트 연결 실패, 결과 저장 실패 등)
+"""
+import argparse
+import importlib.util
+import json
+import os
+import sys
+import time
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from suite_loader import load_suite, parse_shard, shard_suite, validate_excel_file
+
+
+EXIT_OK = 0
+EXIT_THRESHOLD = 1
+EXIT_INVALID = 2
+EXIT_ERROR = 3
+
+RESULT_FORMATS = ('.parquet', '.csv', '.xlsx', '.jsonl', '.json')
+
+DEFAULT_BASE_URL = 'https://navi-agent-adk-api.dev.onkakao.net/streamlit/'
+
+
+def build_automation(args: argparse.Namespace):
+    """실행 방식(--driver)에 맞는 테스트 자동화 인스턴스를 만듭니다."""
+    if args.driver == 'replay':
+        from replay_driver import ReplayTestAutomation
+        return ReplayTestAutomation(archive_dir=args.archive_dir, base_url=args.base_url)
+    if args.driver == 'api':
+        from api_driver import ApiTestAutomation
+        from timing_profile import TimingProfile
+        automation = ApiTestAutomation(api_url=args.api_url or None, base_url=args.base_url)
+        automation.timing_profile = TimingProfile(args.base_url, args.timing_preset)
+        return automation
+    from test_automation import TestAutomation
+    return TestAutomation(base_url=args.base_url, timing_preset=args.timing_preset)
+
+
+def verdict_summary(results_df: pd.DataFrame, partial_as_pass: bool = False) -> Dict:
+    """
+    결과 행의 판정 집계
+
+    Args:
+        results_df: run_tests 결과
+        partial_as_pass: PARTIAL_PASS를 통과로 셀지 여부
+
+    Returns:
+        total, pass, partial_pass, fail, infra_fail, pass_rate
+    """
+    column = 'verdict' if 'verdict' in results_df.columns else 'pass/fail'
+    verdicts = results_df[column].fillna('FAIL') if column in results_df.columns else pd.Series(dtype=str)
+    total = len(verdicts)
+    passed = int((verdicts == 'PASS').sum())
+    partial = int((verdicts == 'PARTIAL_PASS').sum())
+    failed = int((verdicts == 'FAIL').sum())
+    infra = int((results_df['failure_class'] == 'infra').sum()) if 'failure_class' in results_df.columns else 0
+    passing = passed + (partial if partial_as_pass else 0)
+    return {
+        'total': total,
+        'pass': passed,
+        'partial_pass': partial,
+        'fail': failed,
+        'infra_fail': infra,
+        'pass_rate': round(passing / total, 4) if total else None,
+    }
+
+
+def threshold_violations(summary: Dict, max_fail: Optional[int], min_pass_rate: Optional[float]) -> List[str]:
+    """판정 기준을 벗어난 항목 (비어 있으면 통과)"""
+    violations = []
+    if max_fail is not None and summary['fail'] > max_fail:
+        violations.append(f"FAIL {summary['fail']}개 > 허용 {max_fail}개")
+    if min_pass_rate is not None and summary['pass_rate'] is not None and summary['pass_rate'] < min_pass_rate:
+        violations.append(f"통과율 {summary['pass_rate']:.1%} < 기준 {min_pass_rate:.1%}")
+    return violations
+
+
+def _parquet_safe(df: pd.DataFrame) -> pd.DataFrame:
+    """값 타입이 섞인 object 컬럼(예: 오류 행의 빈 문자열과 숫자)을 문자열로 통일합니다."""
+    df = df.copy()
+    for column in df.columns[df.dtypes == object]:
+        types = {type(value) for value in df[column] if value is not None and not (isinstance(value, float) and pd.isna(value))}
+        if len(types) > 1:
+            df[column] = df[column].map(lambda value: None if value is None or (isinstance(value, float) and pd.isna(value)) else str(value))
+    return df
+
+
+def write_results(results_df: pd.DataFrame, path: str):
+    """
+    결과를 확장자에 맞는 형식으로 저장합니다.
+
+    Args:
+        results_df: run_tests 결과
+        path: .parquet(pyarrow 필요), .csv, .xlsx, .jsonl 중 하나
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.parquet':
+        _parquet_safe(results_df).to_parquet(path, index=False)
+    elif extension == '.csv':
+        results_df.to_csv(path, index=False, encoding='utf-8-sig')
+    elif extension == '.xlsx':
+        results_df.to_excel(path, index=False)
+    elif extension in ('.jsonl', '.json'):
+        results_df.to_json(path, orient='records', lines=True, force_ascii=False)
+    else:
+        raise ValueError(f"지원하지 않는 결과 파일 형식입니다: {path} ({', '.join(RESULT_FORMATS)})")
+
+
+def check_output_path(path: str):
+    """실행 전에 결과 형식을 확인합니다. (실행이 끝난 뒤 저장 단계에서 결과를 잃지 않도록)"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in RESULT_FORMATS:
+        raise ValueError(f"지원하지 않는 결과 파일 형식입니다: {path} ({', '.join(RESULT_FORMATS)})")
+    if extension == '.parquet' and not any(importlib.util.find_spec(engine) for engine in ('pyarrow', 'fastparquet')):
+        raise ValueError("parquet 저장에는 pyarrow가 필요합니다: pip install pyarrow (또는 --out을 .csv/.jsonl로 지정)")
+
+
+def default_report_path(out_path: str) -> str:
+    """결과 파일 옆의 리포트 경로 (results.parquet -> results.report.json)"""
+    return f"{os.path.splitext(out_path)[0]}.report.json"
+
+
+def run_command(args: argparse.Namespace) -> int:
+    """run 하위 명령: 스위트 로딩/검증 -> 샤딩 -> 실행 -> 결과/리포트 저장 -> 판정 기준 확인"""
+    report_path = args.report or default_report_path(args.out)
+    report = {
+        'suite': args.suite,
+        'shard': args.shard,
+        'driver': args.driver,
+        'base_url': args.base_url,
+        'workers': args.workers,
+        'results_path': args.out,
+        'started_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+    }
+
+    try:
+        shard_index, shard_count = parse_shard(args.shard) if args.shard else (1, 1)
+        check_output_path(args.out)
+        if not os.path.exists(args.suite):
+            raise ValueError(f"테스트 케이스 파일이 없습니다: {args.suite}")
+        test_cases = load_suite(args.suite)
+        is_valid, error_message = validate_excel_file(test_cases)
+        if not is_valid:
+            raise ValueError(error_message)
+    except Exception as e:
+        print(f"❌ 입력 오류: {e}", file=sys.stderr)
+        return EXIT_INVALID
+
+    shard_cases = shard_suite(test_cases, shard_index, shard_count)
+    report['suite_rows'] = len(test_cases)
+    report['shard_rows'] = len(shard_cases)
+    if args.shard:
+        print(f"🧩 샤드 {shard_index}/{shard_count}: 전체 {len(test_cases)}개 행 중 {len(shard_cases)}개 실행")
+
+    exit_code = EXIT_OK
+    start = time.time()
+    automation = None
+    try:
+        if shard_cases.empty:
+            results_df = pd.DataFrame()
+        else:
+            automation = build_automation(args)
+            results_df = automation.run_tests(shard_cases, workers=args.workers, run_id=args.run_id, resume=args.resume)
+        write_results(results_df, args.out)
+        print(f"💾 결과 저장: {args.out} ({len(results_df)}개 행)")
+        summary = verdict_summary(results_df, args.partial_as_pass)
+        violations = threshold_violations(summary, args.max_fail, args.min_pass_rate)
+        report['summary'] = summary
+        report['violations'] = violations
+        if violations:
+            exit_code = EXIT_THRESHOLD
+        print(f"📊 판정: PASS {summary['pass']}, PARTIAL_PASS {summary['partial_pass']}, FAIL {summary['fail']} "
+              f"(인프라 오류 {summary['infra_fail']}), 통과율 {summary['pass_rate'] if summary['pass_rate'] is not None else '-'}")
+        for violation in violations:
+            print(f"❌ 판정 기준 미달: {violation}")
+    except Exception as e:
+        print(f"❌ 실행 오류: {e}", file=sys.stderr)
+        report['error'] = str(e)
+        exit_code = EXIT_ERROR
+
+    report['wall_ms'] = round((time.time() - start) * 1000, 1)
+    report['thresholds'] = {
+        'max_fail': args.max_fail,
+        'min_pass_rate': args.min_pass_rate,
+        'partial_as_pass': args.partial_as_pass,
+    }
+    report['exit_code'] = exit_code
+    report['run_report'] = automation.run_report if automation is not None else {}
+    try:
+        directory = os.path.dirname(report_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2, default=str)
+        print(f"🧾 실행 리포트: {report_path}")
+    except OSError as e:
+        print(f"❌ 실행 리포트 저장 실패: {e}", file=sys.stderr)
+        exit_code = EXIT_ERROR if exit_code == EXIT_OK else exit_code
+    return exit_code
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='naviqa', description='Navi QA 테스트 스위트 명령줄 실행기')
+    subcommands = parser.add_subparsers(dest='command', required=True)
+
+    run = subcommands.add_parser('run', help='테스트 스위트 실행')
+    run.add_argument('suite', help='테스트 케이스 파일 (.xlsx 또는 .csv)')
+    run.add_argument('--out', required=True, help='결과 파일 (.parquet, .csv, .xlsx, .jsonl)')
+    run.add_argument('--report', help='실행 리포트 JSON 경로 (기본값: <결과 파일 이름>.report.json)')
+    run.add_argument('--workers', type=int, default=int(os.environ.get('NAVIQA_WORKERS', '1')),
+                     help='병렬 워커 수 (기본값: NAVIQA_WORKERS 또는 1)')
+    run.add_argument('--shard', help="스위트를 N개로 나눈 것 중 K번째만 실행 ('K/N', 예: 3/10)")
+    run.add_argument('--driver', choices=['ui', 'api', 'replay'], default=os.environ.get('NAVIQA_DRIVER', 'ui'),
+                     help='실행 방식 (기본값: NAVIQA_DRIVER 또는 ui)')
+    run.add_argument('--base-url', default=os.environ.get('TEST_BASE_URL', DEFAULT_BASE_URL),
+                     help='테스트 대상 URL (기본값: TEST_BASE_URL)')
+    run.add_argument('--api-url', default=os.environ.get('NAVIQA_AGENT_API_URL', ''),
+                     help='API 직접 호출 모드의 에이전트 엔드포인트 (기본값: NAVIQA_AGENT_API_URL)')
+    run.add_argument('--archive-dir', help='녹화 응답 재생 모드의 아카이브 디렉터리 (기본값: NAVIQA_ARCHIVE_DIR)')
+    run.add_argument('--timing-preset', choices=['fast', 'balanced', 'debug'],
+                     help='타이밍 프리셋 (기본값: NAVIQA_TIMING_PRESET 또는 balanced)')
+    run.add_argument('--run-id', help='결과 저널 실행 ID (기본값: 스위트 해시-시작 시각, --resume이면 같은 스위트의 가장 최근 저널)')
+    run.add_argument('--resume', action='store_true', help='저널에 완료된 시나리오는 다시 실행하지 않음')
+    run.add_argument('--max-fail', type=int, default=0, help='허용하는 FAIL 행 수 (기본값: 0)')
+    run.add_argument('--min-pass-rate', type=float, help='최소 통과율 0~1 (기본값: 확인 안 함)')
+    run.add_argument('--partial-as-pass', action='store_true', help='통과율 계산 시 PARTIAL_PASS를 통과로 셈')
+    run.set_defaults(handler=run_command)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit as e:
+        # argparse 사용법 오류는 입력 오류 코드로 통일 (--help는 0)
+        return EXIT_OK if e.code == 0 else EXIT_INVALID
+    return args.handler(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
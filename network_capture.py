@@ -0,0 +1,157 @@
+"""
+네트워크 캡처 모듈
+Playwright request/response 및 websocket 이벤트를 구독하여
+"Send Message" 한 번에 대응하는 에이전트 응답 본문과 타이밍을 턴 단위로 기록합니다.
+Raw JSON expander를 클릭하고 화면 텍스트를 다시 파싱하는 과정 없이 원본 응답을 얻기 위한 용도입니다.
+"""
+import json
+import os
+import re
+import time
+from typing import Dict, List, Optional
+
+
+# 에이전트 응답으로 판단할 때 확인하는 키 (하나 이상 포함되어야 함)
+AGENT_RESPONSE_KEYS = ('tts', 'action', 'next_step')
+
+# 브라우저에서 직접 에이전트 API를 호출하는 경우 매칭할 URL 패턴
+DEFAULT_AGENT_URL_PATTERN = os.environ.get('NAVIQA_AGENT_URL_PATTERN', r'/(chat|agent|invoke|run|message)s?\b')
+
+
+def _has_agent_keys(obj, depth: int = 0) -> bool:
+    """객체(또는 3단계 이내의 중첩 객체)에 에이전트 응답 키가 있는지 확인합니다."""
+    if isinstance(obj, dict):
+        if any(key in obj for key in AGENT_RESPONSE_KEYS):
+            return True
+        if depth < 3:
+            return any(_has_agent_keys(value, depth + 1) for value in obj.values())
+    elif isinstance(obj, list) and depth < 3:
+        return any(_has_agent_keys(item, depth + 1) for item in obj)
+    return False
+
+
+def find_agent_json(text: str) -> Optional[str]:
+    """
+    텍스트(HTTP 본문 또는 Streamlit websocket 프레임)에서 에이전트 응답 JSON을 찾습니다.
+    Streamlit은 st.json 본문을 protobuf 문자열 필드에 그대로 담아 보내므로,
+    프레임 안의 '{"' 위치마다 JSON 디코딩을 시도하고 에이전트 키를 가진 가장 큰 객체를 반환합니다.
+
+    Args:
+        text: 검색할 텍스트
+
+    Returns:
+        원본 JSON 문자열 또는 None
+    """
+    if not text:
+        return None
+
+    decoder = json.JSONDecoder()
+    best = None
+    start = text.find('{"')
+    while start != -1:
+        try:
+            obj, end = decoder.raw_decode(text, start)
+        except (json.JSONDecodeError, ValueError):
+            start = text.find('{"', start + 1)
+            continue
+        if isinstance(obj, dict) and _has_agent_keys(obj):
+            candidate = text[start:end]
+            if best is None or len(candidate) > len(best):
+                best = candidate
+        start = text.find('{"', end)
+    return best
+
+
+class NetworkCapture:
+    """페이지의 네트워크 이벤트에서 턴별 에이전트 응답을 수집하는 클래스"""
+
+    def __init__(self, page, url_pattern: Optional[str] = None):
+        """
+        Args:
+            page: Playwright Page (goto 이전에 attach해야 websocket을 놓치지 않음)
+            url_pattern: 에이전트 API HTTP 호출로 간주할 URL 정규식
+        """
+        self.page = page
+        self.url_pattern = re.compile(url_pattern or DEFAULT_AGENT_URL_PATTERN, re.IGNORECASE)
+        self.turn_started_at: Optional[float] = None
+        self._responses: List[tuple] = []
+        self._frames: List[tuple] = []
+        self._request_sent_at: Optional[float] = None
+
+    def attach(self):
+        """페이지 이벤트 핸들러를 등록합니다."""
+        self.page.on('request', self._on_request)
+        self.page.on('response', self._on_response)
+        self.page.on('websocket', self._on_websocket)
+
+    def begin_turn(self):
+        """새 턴 시작 (Send 클릭 직전에 호출). 이전 턴의 버퍼를 비웁니다."""
+        self._responses = []
+        self._frames = []
+        self._request_sent_at = None
+        self.turn_started_at = time.time()
+
+    def _on_request(self, request):
+        if self.turn_started_at is None or self._request_sent_at is not None:
+            return
+        if request.resource_type in ('xhr', 'fetch') and self.url_pattern.search(request.url):
+            self._request_sent_at = time.time()
+
+    def _on_response(self, response):
+        if self.turn_started_at is None:
+            return
+        request = response.request
+        if request.resource_type in ('xhr', 'fetch') and self.url_pattern.search(response.url):
+            # 본문은 collect_turn에서 읽음 (이벤트 핸들러 안에서는 참조만 보관)
+            self._responses.append((time.time(), response))
+
+    def _on_websocket(self, websocket):
+        websocket.on('framereceived', self._on_frame)
+
+    def _on_frame(self, payload):
+        if self.turn_started_at is None:
+            return
+        self._frames.append((time.time(), payload))
+
+    def collect_turn(self) -> Dict:
+        """
+        현재 턴에서 캡처된 에이전트 응답을 반환합니다.
+
+        Returns:
+            raw_json(원본 본문), source('http'/'websocket'/''), latency_ms, url 을 담은 딕셔너리
+        """
+        result = {'raw_json': '', 'source': '', 'latency_ms': None, 'url': ''}
+        if self.turn_started_at is None:
+            return result
+
+        # 1) 브라우저가 직접 호출한 에이전트 API 응답 (가장 정확)
+        for received_at, response in reversed(self._responses):
+            try:
+                body = response.text()
+            except Exception:
+                continue
+            raw_json = find_agent_json(body)
+            if raw_json:
+                sent_at = self._request_sent_at or self.turn_started_at
+                result.update({
+                    'raw_json': raw_json,
+                    'source': 'http',
+                    'latency_ms': round((received_at - sent_at) * 1000, 1),
+                    'url': response.url,
+                })
+                return result
+
+        # 2) Streamlit websocket 프레임 (서버 측에서 에이전트를 호출하는 경우)
+        # rerun 시 이전 턴의 요소도 다시 전송되므로 가장 마지막에 렌더링된 응답을 사용
+        for received_at, payload in reversed(self._frames):
+            text = payload.decode('utf-8', errors='ignore') if isinstance(payload, (bytes, bytearray)) else payload
+            raw_json = find_agent_json(text)
+            if raw_json:
+                result.update({
+                    'raw_json': raw_json,
+                    'source': 'websocket',
+                    'latency_ms': round((received_at - self.turn_started_at) * 1000, 1),
+                })
+                return result
+
+        return result
@@ -0,0 +1,94 @@
+"""
+녹화 응답 재생 드라이버
+NAVIQA_RECORD_RESPONSES=true로 실행할 때 아카이브(response_archive.ResponseArchive)에 기록된 응답을
+브라우저와 에이전트 호출 없이 그대로 돌려주어 추출/평가 코드만 다시 실행합니다.
+TestAutomation과 같은 run_tests 인터페이스를 제공하므로 평가기를 고칠 때 큰 스위트를 몇 초 만에 다시 평가할 수 있습니다.
+"""
+from typing import Dict, Optional
+
+from retry_policy import RetryPolicy
+from response_archive import ResponseArchive
+from test_automation import TestAutomation
+from timing_profile import TimingProfile
+
+
+class ReplayTestAutomation(TestAutomation):
+    """녹화된 응답으로 평가만 다시 실행하는 테스트 자동화 클래스 (Chromium, 네트워크 미사용)"""
+
+    # 대상 서버에 요청을 보내지 않으므로 초당 요청 수 상한/AIMD 조절 불필요
+    throttle_requests = False
+    # 녹화 키는 Request Fields와 이전 메시지로 정해지므로 대화 상태 복원만으로 분기 가능
+    supports_conversation_fork = True
+
+    def __init__(self, archive_dir: Optional[str] = None,
+                 base_url: str = "https://navi-agent-adk-api.dev.onkakao.net/streamlit/"):
+        """
+        Args:
+            archive_dir: 녹화 아카이브 디렉터리 (기본값: NAVIQA_ARCHIVE_DIR 또는 /tmp/naviqa/archive)
+            base_url: 녹화할 때 사용한 대상 URL (아카이브 키의 일부)
+        """
+        super().__init__(base_url=base_url, capture_mode='replay')
+        self.resource_blocker = None  # 브라우저를 쓰지 않으므로 리소스 차단 불필요
+        self.failure_tracer = None  # 트레이스할 브라우저 컨텍스트 없음
+        self.memory_watchdog = None  # 감시할 Chromium 프로세스 없음
+        self.archive_mode = 'replay'
+        self.response_archive = ResponseArchive(archive_dir)
+        # 재생 소요 시간이 실제 턴 소요 시간 기록(타임아웃 산출, 스케줄러 추정)에 섞이지 않도록 별도 키 사용
+        self.timing_profile = TimingProfile(f"{base_url}::replay")
+        # 녹화가 없는 턴은 다시 실행해도 결과가 같으므로 재시도하지 않음
+        self.retry_policy = RetryPolicy(max_attempts=1)
+        # 재생은 금방 끝나므로 중단 후 재개용 저널을 쓰지 않음
+        self.journal_enabled = False
+
+    def start_browser(self, remote_debugging: bool = False):
+        """재생 모드는 브라우저를 띄우지 않습니다."""
+        print(f"✅ 녹화 응답 재생 준비 완료: {self.response_archive.directory}")
+
+    def attach_browser(self, cdp_endpoint: Optional[str] = None):
+        """병렬 워커: 연결할 브라우저 없음"""
+
+    def close_browser(self):
+        """종료할 브라우저 없음"""
+
+    def reset_page(self):
+        """대화 상태는 _initialize_chat_for_row에서 초기화됩니다."""
+
+    def initialize_chat(self, user_id: str, lat: float, lng: float, is_driving: bool):
+        """Request Fields는 아카이브 키 계산용으로 _initialize_chat_for_row에서 이미 기록됩니다."""
+
+    def start_new_conversation(self) -> bool:
+        """세션 재사용: 대화 기록은 _reuse_session에서 초기화됩니다."""
+        return True
+
+    def restore_conversation(self, state: Dict, fork: bool = False):
+        """저장한 Request Fields와 이전 메시지로 대화 상태를 되돌립니다. (재전송 불필요)"""
+        self._conversation_fields = dict(state['fields'])
+        self._conversation_history = list(state['history'])
+
+    def send_message_and_collect_results(self, message: str, message_index: int = 0) -> Dict:
+        """
+        현재 대화의 턴 입력에 해당하는 녹화 응답을 돌려줍니다.
+
+        Args:
+            message: 메시지
+            message_index: 메시지 인덱스 (디버깅용)
+
+        Returns:
+            결과 딕셔너리 (latency, response_structured, raw_json, tts). 녹화가 없으면 error 포함
+        """
+        results = {
+            'latency': '',
+            'response_structured': '',
+            'raw_json': '',
+            'tts': '',
+            'capture_source': 'replay',
+        }
+        outputs = self.response_archive.load(self._current_turn_inputs(message))
+        if outputs is None:
+            print(f"  ⚠️ 녹화된 응답 없음: {str(message)[:50]}")
+            results['error'] = "녹화된 응답 없음 (NAVIQA_RECORD_RESPONSES=true로 먼저 실행하세요)"
+            return results
+
+        results.update({key: value for key, value in outputs.items() if key != 'capture_source'})
+        results['capture_source'] = f"replay:{outputs.get('capture_source') or 'dom'}"
+        return results
@@ -0,0 +1,139 @@
+"""
+리소스 차단 모듈
+자동화 실행 중 테스트에 필요 없는 리소스(이미지, 폰트, 미디어, 분석/트래킹 스크립트)를
+Playwright 컨텍스트 라우팅으로 차단하여 페이지 로드와 networkidle 대기를 줄입니다.
+Streamlit JS 번들(script), 문서, XHR/fetch, websocket은 차단하지 않습니다.
+
+라우팅은 차단 대상 리소스 타입의 URL 확장자와 차단 호스트 패턴에만 등록합니다. 라우팅된 요청은 Python 핸들러를 거치고
+HTTP 캐시를 쓰지 못하므로, 앱의 JS/CSS와 websocket 핸드셰이크 같은 나머지 요청은 브라우저가 그대로 처리하게 둡니다.
+"""
+import os
+import re
+import threading
+from typing import Dict, List, Optional
+
+
+# 기본 차단 리소스 타입
+DEFAULT_BLOCKED_TYPES = ('image', 'font', 'media')
+
+# 기본 차단 URL 패턴 (외부 폰트 CSS, 분석/트래킹, Streamlit 사용 통계)
+DEFAULT_BLOCKED_URL_PATTERNS = (
+    r'fonts\.googleapis\.com',
+    r'fonts\.gstatic\.com',
+    r'cdn\.jsdelivr\.net/gh/orioncactus/pretendard',
+    r'google-analytics\.com',
+    r'googletagmanager\.com',
+    r'api\.segment\.(io|com)',
+    r'webhooks\.fivetran\.com',
+    r'sentry\.io',
+    r'mixpanel\.com',
+    r'hotjar\.com',
+)
+
+# 리소스 타입별 라우팅 URL 패턴 (라우팅은 URL로만 거를 수 있으므로 확장자로 좁히고, 핸들러에서 타입을 다시 확인)
+TYPE_URL_PATTERNS = {
+    'image': r'\.(?:png|jpe?g|gif|webp|avif|svg|ico|bmp)(?:[?#]|$)',
+    'font': r'\.(?:woff2?|ttf|otf|eot)(?:[?#]|$)',
+    'media': r'\.(?:mp4|webm|ogg|ogv|mp3|wav|m4a|mov)(?:[?#]|$)',
+    'stylesheet': r'\.css(?:[?#]|$)',
+    'script': r'\.m?js(?:[?#]|$)',
+}
+
+# 차단한 요청의 절감 바이트 추정치 (응답을 받지 않으므로 실제 크기는 알 수 없음)
+ESTIMATED_BYTES_BY_TYPE = {
+    'image': 20 * 1024,
+    'font': 60 * 1024,
+    'media': 200 * 1024,
+    'stylesheet': 10 * 1024,
+    'script': 40 * 1024,
+}
+DEFAULT_ESTIMATED_BYTES = 5 * 1024
+
+
+class ResourceBlocker:
+    """컨텍스트 라우팅 기반 리소스 차단기 (여러 컨텍스트/워커 스레드에서 공유 가능)"""
+
+    def __init__(self, resource_types: Optional[List[str]] = None, url_patterns: Optional[List[str]] = None):
+        """
+        Args:
+            resource_types: 차단할 Playwright resource_type 목록
+                (기본값: 환경 변수 NAVIQA_BLOCK_RESOURCE_TYPES 또는 image, font, media)
+            url_patterns: 차단할 URL 정규식 목록 (기본값: DEFAULT_BLOCKED_URL_PATTERNS + NAVIQA_BLOCK_URL_PATTERNS)
+        """
+        if resource_types is None:
+            env_types = os.environ.get('NAVIQA_BLOCK_RESOURCE_TYPES')
+            resource_types = [t.strip() for t in env_types.split(',') if t.strip()] if env_types else list(DEFAULT_BLOCKED_TYPES)
+        if url_patterns is None:
+            url_patterns = list(DEFAULT_BLOCKED_URL_PATTERNS)
+            env_patterns = os.environ.get('NAVIQA_BLOCK_URL_PATTERNS', '')
+            url_patterns += [p.strip() for p in env_patterns.split(',') if p.strip()]
+
+        self.resource_types = set(resource_types)
+        self.url_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in url_patterns]
+        # 컨텍스트에 등록할 라우팅 패턴 (차단 타입의 확장자 + 차단 URL 패턴)
+        self.route_patterns = [
+            re.compile(TYPE_URL_PATTERNS[resource_type], re.IGNORECASE)
+            for resource_type in sorted(self.resource_types) if resource_type in TYPE_URL_PATTERNS
+        ] + self.url_patterns
+        unmapped = sorted(self.resource_types - set(TYPE_URL_PATTERNS))
+        if unmapped:
+            # URL로 구분할 수 없는 타입(xhr, fetch 등)은 모든 요청을 라우팅해야 차단 가능
+            print(f"⚠️ URL로 구분할 수 없는 리소스 타입 차단({', '.join(unmapped)}) - 모든 요청을 라우팅합니다 (HTTP 캐시 비활성)")
+            self.route_patterns = ['**/*']
+        self._lock = threading.Lock()
+        self._stats = {
+            'allowed_requests': 0,
+            'blocked_requests': 0,
+            'stubbed_requests': 0,
+            'estimated_bytes_saved': 0,
+            'blocked_by_type': {},
+        }
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        """요청을 차단할지 판단합니다. 문서/스크립트 본체/XHR/websocket은 URL 패턴이 맞을 때만 차단합니다."""
+        if resource_type in ('document', 'websocket'):
+            return False
+        if resource_type in self.resource_types:
+            return True
+        return any(pattern.search(url) for pattern in self.url_patterns)
+
+    def attach(self, context):
+        """차단 대상 패턴(route_patterns)에 맞는 요청에만 라우팅 핸들러를 등록합니다."""
+        for pattern in self.route_patterns:
+            context.route(pattern, self._handle_route)
+
+    def detach(self, context):
+        """attach로 등록한 라우팅 핸들러를 제거합니다. (상주 풀의 컨텍스트를 다른 차단 설정의 실행에 빌려줄 때)"""
+        for pattern in self.route_patterns:
+            context.unroute(pattern, self._handle_route)
+
+    def _handle_route(self, route):
+        request = route.request
+        resource_type = request.resource_type
+        if not self.should_block(resource_type, request.url):
+            with self._lock:
+                self._stats['allowed_requests'] += 1
+            route.continue_()
+            return
+
+        with self._lock:
+            self._stats['blocked_requests'] += 1
+            self._stats['estimated_bytes_saved'] += ESTIMATED_BYTES_BY_TYPE.get(resource_type, DEFAULT_ESTIMATED_BYTES)
+            by_type = self._stats['blocked_by_type']
+            by_type[resource_type] = by_type.get(resource_type, 0) + 1
+
+        # 스타일시트/스크립트는 빈 본문으로 응답하여 로드 오류 처리 경로를 피함
+        if resource_type in ('stylesheet', 'script'):
+            with self._lock:
+                self._stats['stubbed_requests'] += 1
+            content_type = 'text/css' if resource_type == 'stylesheet' else 'application/javascript'
+            route.fulfill(status=200, content_type=content_type, body='')
+        else:
+            route.abort()
+
+    def stats(self) -> Dict:
+        """차단/허용 요청 수와 절감 바이트 추정치를 반환합니다. (허용 수는 라우팅 패턴에 걸렸지만 차단하지 않은 요청만 셈)"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['blocked_by_type'] = dict(self._stats['blocked_by_type'])
+        return stats
@@ -0,0 +1,133 @@
+"""
+응답 녹화/재생 아카이브 모듈
+턴 입력(대상 URL, Request Fields, 이전 대화 메시지, 현재 메시지)의 해시를 주소로 하여
+수집된 응답(raw_json, response_structured, latency 등)을 gzip JSON 파일로 저장합니다.
+평가/추출 코드만 바뀐 경우 녹화된 응답을 재생(replay_driver.ReplayTestAutomation)하면
+브라우저와 에이전트 없이 같은 스위트를 다시 평가할 수 있습니다.
+
+파일 구조:
+    <아카이브 디렉터리>/<키 앞 2자리>/<키>.json.gz
+    {"key": ..., "inputs": {...}, "outputs": {...}, "recorded_at": ...}
+"""
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+DEFAULT_ARCHIVE_DIR = os.environ.get(
+    'NAVIQA_ARCHIVE_DIR',
+    os.path.join(tempfile.gettempdir(), 'naviqa', 'archive'),
+)
+
+# send_message_and_collect_results 결과 중 녹화할 필드
+CAPTURED_FIELDS = ('latency', 'response_structured', 'raw_json', 'tts', 'capture_source', 'response_timed_out')
+
+
+def turn_inputs(target: str, request_fields: Dict, history: List[str], message: str) -> Dict:
+    """
+    응답을 결정하는 턴 입력을 정리합니다.
+
+    Args:
+        target: 대상 URL
+        request_fields: Request Fields (user_id, lat, lng, is_driving)
+        history: 같은 대화에서 앞서 보낸 메시지 리스트
+        message: 현재 메시지
+
+    Returns:
+        아카이브 키 계산과 기록에 사용하는 입력 딕셔너리
+    """
+    return {
+        'target': target,
+        'request_fields': dict(request_fields),
+        'history': [str(item) for item in history],
+        'message': str(message),
+    }
+
+
+def turn_key(inputs: Dict) -> str:
+    """턴 입력의 SHA-256 해시 (아카이브 주소)"""
+    canonical = json.dumps(inputs, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class ResponseArchive:
+    """턴 입력 해시로 주소를 정하는 응답 아카이브 (스레드 안전)"""
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Args:
+            directory: 아카이브 디렉터리 (기본값: NAVIQA_ARCHIVE_DIR 또는 /tmp/naviqa/archive)
+        """
+        self.directory = directory or DEFAULT_ARCHIVE_DIR
+        self._lock = threading.Lock()
+        self._stored = 0
+        self._hits = 0
+        self._misses = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json.gz")
+
+    def store(self, inputs: Dict, results: Dict) -> str:
+        """
+        턴 입력과 수집된 응답을 기록합니다. 같은 입력을 다시 녹화하면 최신 응답으로 덮어씁니다.
+
+        Args:
+            inputs: turn_inputs()로 만든 턴 입력
+            results: send_message_and_collect_results 결과
+
+        Returns:
+            아카이브 키
+        """
+        key = turn_key(inputs)
+        path = self._path(key)
+        record = {
+            'key': key,
+            'inputs': inputs,
+            'outputs': {field: results.get(field) for field in CAPTURED_FIELDS if field in results},
+            'recorded_at': time.time(),
+        }
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 다른 워커가 같은 키를 읽는 중에도 완성된 파일만 보이도록 임시 파일에 쓴 뒤 교체
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with gzip.open(temp_path, 'wt', encoding='utf-8') as f:
+            json.dump(record, f, ensure_ascii=False, default=str)
+        os.replace(temp_path, path)
+        with self._lock:
+            self._stored += 1
+        return key
+
+    def load(self, inputs: Dict) -> Optional[Dict]:
+        """
+        턴 입력에 해당하는 녹화 응답을 불러옵니다.
+
+        Args:
+            inputs: turn_inputs()로 만든 턴 입력
+
+        Returns:
+            녹화된 응답 필드 딕셔너리 (없으면 None)
+        """
+        try:
+            with gzip.open(self._path(turn_key(inputs)), 'rt', encoding='utf-8') as f:
+                outputs = json.load(f)['outputs']
+        except (OSError, ValueError, KeyError):
+            with self._lock:
+                self._misses += 1
+            return None
+        with self._lock:
+            self._hits += 1
+        return outputs
+
+    def stats(self) -> Dict:
+        """녹화/재생 통계 (stored, hits, misses)"""
+        with self._lock:
+            return {
+                'directory': self.directory,
+                'stored': self._stored,
+                'hits': self._hits,
+                'misses': self._misses,
+            }
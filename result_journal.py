@@ -0,0 +1,171 @@
+"""
+실행 결과 저널 모듈
+완료된 턴 결과를 실행 ID별 JSONL 파일에 즉시 추가 기록(fsync)합니다.
+Chromium OOM이나 파드 재시작으로 실행이 중단되어도 기록된 결과는 남으며,
+같은 실행 ID로 재개(resume)하면 이미 완료된 시나리오(test_case_id)는 다시 실행하지 않습니다.
+실행 ID는 실행마다 새로 만들고(스위트 해시-시작 시각-임의 접미사), 재개할 때는 같은 스위트 해시의 가장 최근 저널을 찾으므로
+같은 스위트를 다른 세션이나 샤드에서 동시에 실행해도 서로의 저널을 덮어쓰지 않습니다.
+
+파일 형식 (한 줄에 JSON 하나):
+    {"type": "header", "run_id": ..., "suite_hash": ..., "base_url": ..., "created_at": ...}
+    {"type": "row", "unit_key": ..., "turn_pos": 0, "row": {...}}
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+from typing import Dict, Optional
+
+import pandas as pd
+
+
+DEFAULT_JOURNAL_DIR = os.environ.get(
+    'NAVIQA_JOURNAL_DIR',
+    os.path.join(tempfile.gettempdir(), 'naviqa', 'journal'),
+)
+
+
+def suite_hash(test_cases: pd.DataFrame, base_url: str) -> str:
+    """
+    테스트 스위트 내용과 대상 URL로 해시를 만듭니다. (같은 파일을 다시 올리면 같은 값)
+
+    Args:
+        test_cases: 테스트 케이스 DataFrame
+        base_url: 테스트 대상 URL
+
+    Returns:
+        16자리 16진수 해시
+    """
+    digest = hashlib.sha256(base_url.encode('utf-8'))
+    digest.update(test_cases.to_csv(index=False).encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+def new_run_id(suite_hash_value: str) -> str:
+    """스위트 해시에 시작 시각과 임의 접미사를 붙인 새 실행 ID를 만듭니다."""
+    return f"{suite_hash_value}-{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+
+def latest_run_id(suite_hash_value: str, directory: Optional[str] = None) -> Optional[str]:
+    """
+    스위트 해시의 저널 중 가장 최근에 기록된 저널의 실행 ID를 찾습니다.
+
+    Args:
+        suite_hash_value: suite_hash 값
+        directory: 저널 저장 디렉터리 (기본값: NAVIQA_JOURNAL_DIR 또는 /tmp/naviqa/journal)
+
+    Returns:
+        실행 ID (저널이 없으면 None)
+    """
+    directory = directory or DEFAULT_JOURNAL_DIR
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return None
+    candidates = [
+        name for name in names
+        if name.endswith('.jsonl') and (name == f"{suite_hash_value}.jsonl" or name.startswith(f"{suite_hash_value}-"))
+    ]
+    if not candidates:
+        return None
+    latest = max(candidates, key=lambda name: os.path.getmtime(os.path.join(directory, name)))
+    return latest[:-len('.jsonl')]
+
+
+class ResultJournal:
+    """실행 ID별 JSONL 결과 저널 (메인 스레드에서 기록, 스레드 안전)"""
+
+    def __init__(self, run_id: str, directory: Optional[str] = None):
+        """
+        Args:
+            run_id: 실행 ID (파일 이름으로 사용)
+            directory: 저널 저장 디렉터리 (기본값: NAVIQA_JOURNAL_DIR 또는 /tmp/naviqa/journal)
+        """
+        self.run_id = run_id
+        self.path = os.path.join(directory or DEFAULT_JOURNAL_DIR, f"{run_id}.jsonl")
+        self._file = None
+        self._lock = threading.Lock()
+
+    def _read_records(self):
+        records = []
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        # 기록 도중 중단된 마지막 줄은 무시
+                        continue
+        except OSError:
+            pass
+        return records
+
+    def open(self, header: Dict, resume: bool = False) -> Dict[str, Dict[int, Dict]]:
+        """
+        저널을 엽니다. resume이 아니면 새 저널을 만듭니다. (기록이 있는 저널은 덮어쓰지 않음)
+
+        Args:
+            header: 실행 정보 (suite_hash, base_url 등)
+            resume: 기존 기록을 이어서 사용할지 여부
+
+        Returns:
+            {unit_key: {turn_pos: row}} 형태의 기존 기록 (resume이 아니면 빈 딕셔너리)
+
+        Raises:
+            ValueError: 재개하려는 저널의 스위트가 현재 스위트와 다를 때, 또는 재개가 아닌데 같은 실행 ID의 기록이 있을 때
+        """
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        if not resume and os.path.exists(self.path) and os.path.getsize(self.path) > 0:
+            raise ValueError(
+                f"실행 ID {self.run_id}의 저널이 이미 있습니다. 이어서 실행하려면 재개를 사용하고, 아니면 새 실행 ID를 사용하세요."
+            )
+        recorded: Dict[str, Dict[int, Dict]] = {}
+        if resume:
+            records = self._read_records()
+            existing_header = next((r for r in records if r.get('type') == 'header'), None)
+            if existing_header and existing_header.get('suite_hash') != header.get('suite_hash'):
+                raise ValueError(
+                    f"실행 ID {self.run_id}의 저널은 다른 테스트 스위트의 기록입니다. 새 실행 ID를 사용하세요."
+                )
+            for record in records:
+                if record.get('type') == 'row':
+                    recorded.setdefault(record['unit_key'], {})[int(record['turn_pos'])] = record['row']
+
+        self._file = open(self.path, 'a' if resume else 'w', encoding='utf-8')
+        if resume and self._ends_with_partial_line():
+            # 기록 도중 중단된 줄 뒤에 이어 쓰지 않도록 줄바꿈 추가
+            self._file.write('\n')
+        if not recorded:
+            self._write({'type': 'header', 'run_id': self.run_id, 'created_at': time.time(), **header})
+        return recorded
+
+    def _ends_with_partial_line(self) -> bool:
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() == 0:
+                    return False
+                f.seek(-1, os.SEEK_END)
+                return f.read(1) != b'\n'
+        except OSError:
+            return False
+
+    def _write(self, record: Dict):
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def append(self, unit_key: str, turn_pos: int, row: Dict):
+        """완료된 턴 결과 하나를 기록합니다."""
+        self._write({'type': 'row', 'unit_key': unit_key, 'turn_pos': turn_pos, 'row': row})
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
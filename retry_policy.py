@@ -0,0 +1,82 @@
+"""
+불안정 턴 재시도 정책 모듈
+턴 결과의 FAIL을 인프라 오류(응답 타임아웃, 빈 Raw JSON, 입력창 미검출, 실행 예외)와
+실제 평가 결과(verdict)로 분류하고, 인프라 오류가 난 실행 단위만 별도 재시도 레인에서 다시 실행합니다.
+멀티턴 시나리오는 대화 세션을 이어갈 수 없으므로 시나리오 전체를 다시 실행합니다.
+"""
+import math
+import os
+import re
+from typing import Dict, Optional
+
+
+# 인프라 오류로 간주할 turn_error (앞부분 고정 패턴. 실패 사유/에이전트 응답 문구에는 적용하지 않음)
+# Playwright 오류는 'Locator.click: Timeout ...'처럼 메서드 이름이 앞에 붙을 수 있음
+_PLAYWRIGHT_PREFIX = r'^(?:[A-Za-z]+\.[A-Za-z]+: )?'
+INFRA_ERROR_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'^메시지 입력창을 찾을 수 없음',
+    r'^메시지 입력 실패',
+    r'^녹화된 응답 없음',
+    r'^대화 상태 재구성 실패',
+    _PLAYWRIGHT_PREFIX + r'Timeout \d+ms exceeded',
+    _PLAYWRIGHT_PREFIX + r'Target (?:page, context or browser has been )?closed',
+    _PLAYWRIGHT_PREFIX + r'net::ERR_',
+    r'^HTTPS?ConnectionPool\(',  # requests 연결 실패/읽기 타임아웃
+    r'^HTTP 5\d\d\b',
+))
+
+# 실제 평가 실패로 간주할 turn_error (에이전트가 요청을 거절한 4xx 응답)
+PRODUCT_ERROR_PATTERN = re.compile(r'^HTTP 4\d\d\b')
+
+FAILURE_INFRA = 'infra'
+FAILURE_VERDICT = 'verdict'
+
+
+def classify_failure(row: Dict) -> Optional[str]:
+    """
+    턴 결과 행의 실패 유형을 분류합니다.
+    turn_error가 알려진 인프라 오류(입력창 미검출, 브라우저/네트워크 오류, 타임아웃, 5xx)면 'infra',
+    4xx 응답이나 응답 본문이 있는 그 밖의 오류는 'verdict'입니다.
+
+    Args:
+        row: _execute_turn 결과 행
+
+    Returns:
+        'infra'(재시도 대상), 'verdict'(실제 평가 실패), 또는 None(FAIL이 아님)
+    """
+    if row.get('verdict', row.get('pass/fail')) != 'FAIL':
+        return None
+    turn_error = str(row.get('turn_error') or '').strip()
+    if turn_error:
+        if PRODUCT_ERROR_PATTERN.match(turn_error):
+            return FAILURE_VERDICT
+        if any(pattern.match(turn_error) for pattern in INFRA_ERROR_PATTERNS):
+            return FAILURE_INFRA
+    # 응답 본문을 전혀 받지 못했거나 응답 완료 전에 타임아웃된 경우
+    if not str(row.get('raw_json') or '').strip():
+        return FAILURE_INFRA
+    if row.get('response_timed_out'):
+        return FAILURE_INFRA
+    return FAILURE_VERDICT
+
+
+class RetryPolicy:
+    """인프라 오류 재시도 횟수/예산 정책"""
+
+    def __init__(self, max_attempts: Optional[int] = None, budget: Optional[int] = None):
+        """
+        Args:
+            max_attempts: 실행 단위당 최대 실행 횟수 (첫 실행 포함, 기본값: NAVIQA_RETRY_MAX_ATTEMPTS 또는 3)
+            budget: 실행 전체의 재시도 단위 수 상한 (기본값: NAVIQA_RETRY_BUDGET 또는 전체 단위의 10%, 최소 3)
+        """
+        self.max_attempts = max_attempts if max_attempts is not None else int(os.environ.get('NAVIQA_RETRY_MAX_ATTEMPTS', '3'))
+        env_budget = os.environ.get('NAVIQA_RETRY_BUDGET')
+        self._budget = budget if budget is not None else (int(env_budget) if env_budget else None)
+
+    def budget(self, unit_count: int) -> int:
+        """실행 단위 수에 맞는 재시도 예산을 반환합니다."""
+        if self.max_attempts <= 1:
+            return 0
+        if self._budget is not None:
+            return self._budget
+        return max(3, math.ceil(unit_count * 0.1))
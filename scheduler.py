@@ -0,0 +1,104 @@
+"""
+시나리오 스케줄러 모듈
+턴 수와 메시지별 과거 소요 시간(TimingProfile)으로 실행 단위의 소요 시간을 추정하고,
+병렬 실행 시 가장 오래 걸리는 단위부터 배정(LPT, longest processing time first)합니다.
+워커는 공유 큐에서 먼저 끝난 순서대로 다음 단위를 가져가므로 남은 작업은 실행 중에 자동으로 재분배됩니다.
+실행 후에는 실제 makespan(메인 레인 전체 소요 시간)과 이상적인 makespan(하한)을 비교해 리포트합니다.
+"""
+import heapq
+from typing import Dict, List
+
+from timing_profile import TimingProfile
+
+
+# 관측값이 없을 때 사용하는 기본 추정치 (ms)
+DEFAULT_TURN_MS = 8000
+DEFAULT_UNIT_SETUP_MS = 3000
+
+
+def estimate_unit_ms(unit: Dict, profile: TimingProfile, get_message) -> float:
+    """
+    실행 단위의 소요 시간을 추정합니다.
+    (단위 준비 시간 중앙값) + 턴별 (메시지 과거 소요 시간 또는 전체 턴 소요 시간 중앙값)
+
+    Args:
+        unit: _build_units가 만든 실행 단위
+        profile: 타이밍 프로필
+        get_message: row -> 메시지 문자열
+
+    Returns:
+        추정 소요 시간 (ms)
+    """
+    turn_default = profile.typical_ms('turn') or DEFAULT_TURN_MS
+    estimate = profile.typical_ms('unit_setup') or DEFAULT_UNIT_SETUP_MS
+    for _, row in unit['turns']:
+        estimate += profile.message_estimate_ms(get_message(row)) or turn_default
+    return estimate
+
+
+def order_longest_first(units: List[Dict], estimates: Dict[int, float]) -> List[Dict]:
+    """추정 소요 시간이 긴 단위부터 정렬합니다. (같으면 원래 순서)"""
+    return sorted(units, key=lambda unit: (-estimates[unit['index']], unit['index']))
+
+
+def group_by_key(units: List[Dict], key) -> List[Dict]:
+    """
+    key(unit)가 같은 단위를 연속되도록 모읍니다. (그룹 순서는 처음 나온 순서, 그룹 안에서는 기존 순서 유지)
+
+    Args:
+        units: 실행 단위 리스트
+        key: unit -> 그룹 키 (예: 채팅 초기화 fingerprint)
+
+    Returns:
+        재정렬된 단위 리스트
+    """
+    groups: Dict = {}
+    for unit in units:
+        groups.setdefault(key(unit), []).append(unit)
+    return [unit for group in groups.values() for unit in group]
+
+
+def simulate_makespan(durations: List[float], workers: int) -> float:
+    """주어진 순서대로 먼저 빈 워커에 배정했을 때의 makespan"""
+    if not durations:
+        return 0.0
+    loads = [0.0] * max(1, workers)
+    for duration in durations:
+        heapq.heappush(loads, heapq.heappop(loads) + duration)
+    return max(loads)
+
+
+def makespan_report(unit_durations_ms: Dict[int, float], estimates: Dict[int, float],
+                    workers: int, achieved_ms: float, policy: str) -> Dict:
+    """
+    실제 makespan과 이상적인 makespan(하한)을 비교합니다.
+
+    Args:
+        unit_durations_ms: {단위 index: 실제 소요 시간}
+        estimates: {단위 index: 추정 소요 시간}
+        workers: 워커 수
+        achieved_ms: 메인 레인 실제 소요 시간
+        policy: 스케줄링 방식 ('lpt' 또는 'fifo')
+
+    Returns:
+        achieved_ms, ideal_ms(max(총합/워커 수, 가장 긴 단위)), efficiency, estimated_ms, estimate_error 등
+    """
+    durations = list(unit_durations_ms.values())
+    ideal_ms = max(sum(durations) / max(1, workers), max(durations)) if durations else 0.0
+    measured = [index for index in unit_durations_ms if index in estimates]
+    estimate_error = None
+    if measured:
+        estimate_error = sum(abs(estimates[i] - unit_durations_ms[i]) / unit_durations_ms[i]
+                             for i in measured if unit_durations_ms[i] > 0) / len(measured)
+    return {
+        'policy': policy,
+        'workers': workers,
+        'units': len(durations),
+        'achieved_ms': round(achieved_ms, 1),
+        'ideal_ms': round(ideal_ms, 1),
+        'efficiency': round(ideal_ms / achieved_ms, 3) if achieved_ms > 0 else None,
+        'estimated_ms': round(simulate_makespan(
+            sorted(estimates.values(), reverse=True) if policy == 'lpt' else [estimates[i] for i in sorted(estimates)],
+            workers), 1),
+        'mean_estimate_error': round(estimate_error, 3) if estimate_error is not None else None,
+    }
@@ -0,0 +1,95 @@
+"""
+셀렉터 전략 메모이제이션 모듈
+메시지 입력창, 체크박스, 버튼처럼 여러 셀렉터를 순서대로 시도해 찾는 요소에 대해
+대상 페이지 버전에서 실제로 맞았던 전략을 기억해 두고, 페이지별로 찾은 locator를 캐시합니다.
+캐시된 locator가 더 이상 매칭되지 않을 때만 전체 후보 목록(cascade)을 다시 탐색합니다.
+"""
+import threading
+import weakref
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# (전략 이름, page -> locator 또는 None) 목록. 앞에서부터 시도합니다.
+Strategies = List[Tuple[str, Callable]]
+
+
+class SelectorResolver:
+    """대상별 셀렉터 전략 학습 및 페이지별 locator 캐시 (워커 스레드 간 공유 가능)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # 대상 -> 마지막으로 성공한 전략 이름 (페이지가 바뀌어도 유지)
+        self._learned: Dict[str, str] = {}
+        # page -> {대상: locator}. 페이지가 닫혀 사라지면 캐시도 함께 정리됨
+        self._page_cache: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+        self._stats = {'cache_hits': 0, 'learned_hits': 0, 'cascade_runs': 0, 'misses': 0}
+
+    @staticmethod
+    def _matches(locator) -> bool:
+        try:
+            return locator is not None and locator.count() > 0
+        except Exception:
+            return False
+
+    def _count(self, key: str):
+        with self._lock:
+            self._stats[key] += 1
+
+    def resolve(self, page, target: str, strategies: Strategies) -> Optional[Tuple[str, object]]:
+        """
+        대상 요소의 locator를 찾습니다.
+        1) 이 페이지에서 캐시된 locator가 아직 매칭되면 그대로 사용
+        2) 학습된 전략을 먼저 시도
+        3) 실패하면 나머지 전략을 순서대로 시도하고, 성공한 전략을 학습
+
+        Args:
+            page: Playwright Page
+            target: 대상 이름 (예: 'message_input', 'checkbox:is_driving')
+            strategies: (전략 이름, page를 받아 locator 또는 None을 반환하는 함수) 목록
+
+        Returns:
+            (전략 이름, locator) 튜플. 어떤 전략으로도 찾지 못하면 None
+        """
+        with self._lock:
+            cached = self._page_cache.get(page, {}).get(target)
+            learned_name = self._learned.get(target)
+
+        if cached is not None and self._matches(cached[1]):
+            self._count('cache_hits')
+            return cached
+
+        ordered = list(strategies)
+        if learned_name is not None:
+            ordered.sort(key=lambda strategy: strategy[0] != learned_name)
+
+        for position, (name, build) in enumerate(ordered):
+            try:
+                locator = build(page)
+            except Exception:
+                locator = None
+            if not self._matches(locator):
+                continue
+            if position == 0 and learned_name == name:
+                self._count('learned_hits')
+            else:
+                self._count('cascade_runs')
+            with self._lock:
+                self._learned[target] = name
+                self._page_cache.setdefault(page, {})[target] = (name, locator)
+            return name, locator
+
+        self._count('misses')
+        self.invalidate(page, target)
+        return None
+
+    def invalidate(self, page, target: str):
+        """페이지의 캐시된 locator를 버립니다. (요소 조작이 실패했을 때 호출)"""
+        with self._lock:
+            self._page_cache.get(page, {}).pop(target, None)
+
+    def stats(self) -> Dict:
+        """캐시 적중/전체 탐색 횟수와 학습된 전략을 반환합니다."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['learned'] = dict(self._learned)
+        return stats
@@ -0,0 +1,119 @@
+"""
+단계별 소요 시간 측정 모듈
+브라우저 시작, 세션 리셋, 채팅 초기화, 메시지 입력, 전송, 응답 대기, 결과 추출, 평가, 고정 대기(sleep) 구간을
+span으로 측정하고, 실행이 끝나면 단계별 총합/백분위수와 전체 시간 대비 비중을 리포트합니다.
+구간이 중첩되면 바깥 구간에는 안쪽 구간을 뺀 시간만 기록하므로(자기 시간) 단계별 합계가 중복되지 않습니다.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from timing_profile import percentile
+
+
+# 리포트에 표시하는 단계 순서
+PHASES = (
+    'browser_start',
+    'reset_page',
+    'initialize_chat',
+    'input_fill',
+    'send',
+    'wait_response',
+    'extraction',
+    'evaluation',
+    'sleep',
+)
+
+
+class StepTimer:
+    """단계별 소요 시간 span 기록기 (워커 스레드 간 공유, 스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._samples: Dict[str, List[float]] = {}
+
+    def reset(self):
+        """실행 시작 시 이전 실행의 기록을 지웁니다."""
+        with self._lock:
+            self._samples = {}
+
+    def record(self, phase: str, duration_ms: float):
+        """단계 소요 시간 하나를 기록합니다."""
+        with self._lock:
+            self._samples.setdefault(phase, []).append(duration_ms)
+
+    @contextmanager
+    def span(self, phase: str):
+        """
+        with 블록의 소요 시간을 phase로 기록합니다. (안쪽 span 시간은 제외)
+
+        Args:
+            phase: 단계 이름 (PHASES 참고)
+        """
+        stack = self._local.__dict__.setdefault('stack', [])
+        frame = [phase, 0.0]  # [단계, 안쪽 span 소요 시간]
+        stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            stack.pop()
+            self.record(phase, elapsed_ms - frame[1])
+            if stack:
+                stack[-1][1] += elapsed_ms
+
+    def sleep(self, seconds: float):
+        """고정 대기. 대기 시간을 'sleep' 단계로 기록합니다."""
+        if seconds <= 0:
+            return
+        with self.span('sleep'):
+            time.sleep(seconds)
+
+    def report(self, wall_ms: Optional[float] = None) -> Dict:
+        """
+        단계별 소요 시간 리포트를 만듭니다.
+
+        Args:
+            wall_ms: 실행 전체 소요 시간 (병렬 실행이면 단계 합계가 이보다 클 수 있음)
+
+        Returns:
+            wall_ms, measured_ms(단계 합계), sleep_ms, wait_response_ms,
+            phases: {단계: count, total_ms, share(단계 합계 대비), p50_ms, p90_ms, p99_ms, max_ms}
+        """
+        with self._lock:
+            samples = {phase: list(values) for phase, values in self._samples.items()}
+        measured_ms = sum(sum(values) for values in samples.values())
+        ordered = [phase for phase in PHASES if phase in samples] + sorted(set(samples) - set(PHASES))
+        phases = {}
+        for phase in ordered:
+            values = sorted(samples[phase])
+            total_ms = sum(values)
+            phases[phase] = {
+                'count': len(values),
+                'total_ms': round(total_ms, 1),
+                'share': round(total_ms / measured_ms, 3) if measured_ms > 0 else None,
+                'p50_ms': round(percentile(values, 0.5), 1),
+                'p90_ms': round(percentile(values, 0.9), 1),
+                'p99_ms': round(percentile(values, 0.99), 1),
+                'max_ms': round(values[-1], 1),
+            }
+        return {
+            'wall_ms': round(wall_ms, 1) if wall_ms is not None else None,
+            'measured_ms': round(measured_ms, 1),
+            'sleep_ms': phases.get('sleep', {}).get('total_ms', 0.0),
+            'wait_response_ms': phases.get('wait_response', {}).get('total_ms', 0.0),
+            'phases': phases,
+        }
+
+    @staticmethod
+    def format_report(report: Dict) -> str:
+        """report()를 로그용 표 문자열로 만듭니다."""
+        lines = [f"{'phase':<16}{'count':>6}{'total(s)':>10}{'share':>8}{'p50(ms)':>10}{'p90(ms)':>10}{'p99(ms)':>10}"]
+        for phase, stats in report['phases'].items():
+            share = f"{stats['share']:.0%}" if stats['share'] is not None else '-'
+            lines.append(f"{phase:<16}{stats['count']:>6}{stats['total_ms'] / 1000:>10.1f}{share:>8}"
+                         f"{stats['p50_ms']:>10.0f}{stats['p90_ms']:>10.0f}{stats['p99_ms']:>10.0f}")
+        return '\n'.join(lines)
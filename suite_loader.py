@@ -0,0 +1,134 @@
+"""
+테스트 스위트 로딩/검증 모듈
+엑셀(또는 CSV) 테스트 케이스 파일을 읽고 필수 컬럼과 멀티턴 turn_number 순서를 검증합니다.
+Streamlit 앱(app.py)과 명령줄 실행기(naviqa.py)가 같은 검증을 사용하며,
+여러 머신에 나눠 실행할 수 있도록 실행 단위(시나리오 또는 단일 턴 행) 기준으로 스위트를 샤딩합니다.
+"""
+import os
+from typing import Tuple
+
+import pandas as pd
+
+
+def prepare_suite(df: pd.DataFrame) -> pd.DataFrame:
+    """읽어 들인 테스트 케이스를 실행용으로 정리합니다. (user_id를 문자열로 변환)"""
+    if 'user_id' in df.columns:
+        df['user_id'] = df['user_id'].astype(str)
+    return df
+
+
+def load_suite(path: str) -> pd.DataFrame:
+    """
+    테스트 케이스 파일을 읽습니다.
+
+    Args:
+        path: 엑셀(.xlsx, .xls) 또는 CSV(.csv) 파일 경로
+
+    Returns:
+        테스트 케이스 DataFrame
+    """
+    if os.path.splitext(path)[1].lower() == '.csv':
+        df = pd.read_csv(path)
+    else:
+        df = pd.read_excel(path)
+    return prepare_suite(df)
+
+
+def validate_excel_file(df: pd.DataFrame) -> tuple[bool, str]:
+    """
+    엑셀 파일의 필수 컬럼을 검증합니다.
+    대소문자 구분 없이 검증합니다.
+    멀티턴 시나리오를 지원합니다 (test_case_id, turn_number).
+    
+    Args:
+        df: 업로드된 DataFrame
+    
+    Returns:
+        (is_valid: bool, error_message: str)
+    """
+    required_columns = ['user_id', 'lat', 'lng', 'is_driving', 'message']
+    # 선택적 컬럼 (기대값 - 있으면 평가에 사용, 없어도 됨)
+    optional_columns = ['tts_expected', 'action_name_expected', 'action_data_expected', 'next_step_expected']
+    
+    df_columns_lower = {col.lower(): col for col in df.columns}
+    missing_columns = []
+    
+    for req_col in required_columns:
+        if req_col.lower() not in df_columns_lower:
+            missing_columns.append(req_col)
+    
+    if missing_columns:
+        return False, f"필수 컬럼이 없습니다: {', '.join(missing_columns)}"
+    
+    # 선택적 컬럼 확인 (정보만 출력)
+    found_optional = []
+    for opt_col in optional_columns:
+        if opt_col.lower() in df_columns_lower:
+            found_optional.append(opt_col)
+    
+    if found_optional:
+        print(f"ℹ️ 기대값 컬럼 발견: {', '.join(found_optional)}", flush=True)
+    
+    if df.empty:
+        return False, "테스트 케이스가 없습니다."
+    
+    # 멀티턴 시나리오 검증 (test_case_id와 turn_number가 모두 있는 경우)
+    has_test_case_id = 'test_case_id' in df_columns_lower or 'TEST_CASE_ID' in df.columns
+    has_turn_number = 'turn_number' in df_columns_lower or 'TURN_NUMBER' in df.columns
+    
+    if has_test_case_id and has_turn_number:
+        # test_case_id별로 turn_number가 1부터 순차적으로 있는지 확인
+        test_case_id_col = df_columns_lower.get('test_case_id') or 'TEST_CASE_ID'
+        turn_number_col = df_columns_lower.get('turn_number') or 'TURN_NUMBER'
+        
+        for test_case_id in df[test_case_id_col].unique():
+            case_turns = df[df[test_case_id_col] == test_case_id][turn_number_col].sort_values()
+            expected_turns = list(range(1, len(case_turns) + 1))
+            if not case_turns.tolist() == expected_turns:
+                return False, f"test_case_id '{test_case_id}'의 turn_number가 순차적이지 않습니다. (1, 2, 3, ... 순서여야 함)"
+    
+    return True, ""
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """
+    샤드 지정 문자열을 해석합니다.
+
+    Args:
+        value: 'K/N' 형식 (1 <= K <= N)
+
+    Returns:
+        (K, N) 튜플
+    """
+    try:
+        index, count = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise ValueError(f"샤드는 'K/N' 형식이어야 합니다: {value}")
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"샤드 번호는 1 이상 {count} 이하여야 합니다: {value}")
+    return index, count
+
+
+def shard_suite(df: pd.DataFrame, shard_index: int, shard_count: int) -> pd.DataFrame:
+    """
+    스위트를 shard_count개로 나눈 것 중 shard_index번째(1부터)를 반환합니다.
+    멀티턴이면 test_case_id 단위로(시나리오의 턴은 나뉘지 않음), 단일 턴이면 행 단위로
+    원래 순서에서 번갈아 배정하므로 같은 파일이면 어느 머신에서 실행해도 같은 샤드가 됩니다.
+
+    Args:
+        df: 테스트 케이스 DataFrame
+        shard_index: 샤드 번호 (1부터)
+        shard_count: 전체 샤드 수
+
+    Returns:
+        해당 샤드의 테스트 케이스 DataFrame (원래 행 순서 유지)
+    """
+    if shard_count <= 1:
+        return df
+    df_columns_lower = {col.lower(): col for col in df.columns}
+    if 'test_case_id' in df_columns_lower and 'turn_number' in df_columns_lower:
+        test_case_id_col = df_columns_lower['test_case_id']
+        case_ids = list(dict.fromkeys(df[test_case_id_col].tolist()))
+        selected = {case_id for position, case_id in enumerate(case_ids) if position % shard_count == shard_index - 1}
+        return df[df[test_case_id_col].isin(selected)]
+    return df.iloc[[position for position in range(len(df)) if position % shard_count == shard_index - 1]]
@@ -2,30 +2,424 @@
 Playwright 기반 테스트 자동화 모듈
 웹 UI에 접속하여 테스트를 수행하고 결과를 수집합니다.
 """
+import os
 import time
+import uuid
+import queue
+import threading
 import pandas as pd
 from playwright.sync_api import sync_playwright, Page, TimeoutError as PlaywrightTimeoutError
-from typing import Dict, Optional
+from typing import Dict, Iterator, List, Optional
 from similarity import calculate_similarity, determine_pass_fail
+from network_capture import NetworkCapture
+from timing_profile import TimingProfile
+from resource_blocker import DEFAULT_ESTIMATED_BYTES, ESTIMATED_BYTES_BY_TYPE, ResourceBlocker
+from selector_resolver import SelectorResolver
+from result_journal import ResultJournal, latest_run_id, new_run_id, suite_hash
+from retry_policy import RetryPolicy, classify_failure
+from scheduler import estimate_unit_ms, group_by_key, makespan_report, order_longest_first
+from conversation_trie import build_prefix_units, sharing_report
+from governor import ConcurrencyGovernor, default_rps_for
+from response_archive import ResponseArchive, turn_inputs
+from failure_tracer import FailureTracer
+from step_timer import StepTimer
+from memory_watchdog import ACTION_BROWSER, ACTION_CONTEXT, MemoryWatchdog, find_browser_pid
+
+
+# 응답 완료 감지용 in-page 스크립트
+# 전송 직전에 이미 화면에 있는 응답 요소를 이전 턴으로 표시하고 DOM 변경 시각을 추적합니다.
+_MUTATION_TRACKER_JS = """
+    if (!window.__naviqaMutationObserver && document.body) {
+        window.__naviqaLastMutation = Date.now();
+        window.__naviqaMutationObserver = new MutationObserver(() => {
+            window.__naviqaLastMutation = Date.now();
+        });
+        window.__naviqaMutationObserver.observe(document.body, {
+            childList: true, subtree: true, characterData: true
+        });
+    }
+"""
+
+# 이전 턴 요소 표시 속성. 표시되지 않은 요소만 새 턴의 응답으로 보므로 대기/추출이 대화 길이와 무관하게
+# 최신 턴 요소만 읽고, 이전 턴의 응답을 새 응답으로 오인하지 않습니다.
+_TURN_MARKER_ATTR = 'data-naviqa-turn'
+_FRESH_MARKDOWN_SELECTOR = f'div[data-testid="stMarkdownContainer"]:not([{_TURN_MARKER_ATTR}])'
+_FRESH_EXPANDER_SELECTOR = f'div[data-testid="stExpander"]:not([{_TURN_MARKER_ATTR}])'
+
+_RESPONSE_STATE_JS = """
+() => {
+""" + _MUTATION_TRACKER_JS + """
+    // 아직 표시되지 않은 요소(직전 턴에 새로 생긴 요소)에만 표시하므로 턴마다 비용이 일정함
+    const turn = (window.__naviqaTurn || 0) + 1;
+    window.__naviqaTurn = turn;
+    let marked = 0;
+    for (const el of document.querySelectorAll('""" + _FRESH_MARKDOWN_SELECTOR + ', ' + _FRESH_EXPANDER_SELECTOR + """')) {
+        el.setAttribute('""" + _TURN_MARKER_ATTR + """', String(turn - 1));
+        marked += 1;
+    }
+    return { turn, marked };
+}
+"""
+
+
+# Request Fields(user_id, lat, lng, is_driving)를 한 번에 설정하고 "Save & Start Chat"을 누르는 in-page 스크립트
+# React 제어 컴포넌트가 값을 인식하도록 네이티브 setter + input/blur 이벤트를 사용합니다.
+_BULK_INIT_JS = """
+async (fields) => {
+""" + _MUTATION_TRACKER_JS + """
+    const nextFrame = () => new Promise((resolve) => requestAnimationFrame(() => setTimeout(resolve, 30)));
+    const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    const status = {};
+
+    for (const [label, value] of Object.entries(fields.inputs)) {
+        const input = document.querySelector(`input[aria-label="${label}"]`);
+        if (!input) { status[label] = { found: false }; continue; }
+        input.focus();
+        setter.call(input, String(value));
+        input.dispatchEvent(new Event('input', { bubbles: true }));
+        input.dispatchEvent(new Event('change', { bubbles: true }));
+        // Streamlit text/number input은 blur 시점에 값을 확정
+        input.dispatchEvent(new FocusEvent('focusout', { bubbles: true }));
+        input.blur();
+        status[label] = { found: true, value: input.value };
+    }
+
+    const label = fields.checkbox.label;
+    const normalized = label.replace(/_/g, ' ').toLowerCase();
+    let checkbox = document.querySelector(`input[type="checkbox"][aria-label="${label}"]`)
+        || document.querySelector(`input[type="checkbox"][name="${label}"]`);
+    if (!checkbox) {
+        for (const el of document.querySelectorAll('label')) {
+            const text = (el.innerText || '').toLowerCase();
+            if (text.includes(label.toLowerCase()) || text.includes(normalized)) {
+                checkbox = (el.htmlFor && document.getElementById(el.htmlFor))
+                    || el.querySelector('input[type="checkbox"]')
+                    || (el.parentElement && el.parentElement.querySelector('input[type="checkbox"]'));
+                if (checkbox) break;
+            }
+        }
+    }
+    if (checkbox) {
+        if (checkbox.checked !== fields.checkbox.value) checkbox.click();
+        status[label] = { found: true, value: checkbox.checked };
+    } else {
+        status[label] = { found: false };
+    }
+
+    // 위젯 값 확정이 반영되도록 한 프레임 대기 후 저장 버튼 클릭
+    await nextFrame();
+    const button = Array.from(document.querySelectorAll('button'))
+        .find((el) => (el.innerText || '').includes('Save & Start Chat'));
+    let clickedAt = null;
+    if (button) {
+        clickedAt = Date.now();
+        button.click();
+    }
+    return { status, clickedAt };
+}
+"""
+
+# 채팅이 시작되었는지 판단합니다.
+# (저장 클릭 이후 DOM 변경 발생 + 메시지 입력창 활성 + Streamlit 실행 중 아님 + quietMs 동안 DOM 변경 없음)
+_CHAT_READY_JS = """
+([clickedAt, quietMs]) => {
+    const input = document.querySelector('textarea[aria-label="Your Message"]')
+        || Array.from(document.querySelectorAll('textarea')).pop();
+    const status = document.querySelector('[data-testid="stStatusWidget"]');
+    const running = !!status && /running/i.test(status.innerText || '');
+    const lastMutation = window.__naviqaLastMutation || 0;
+    return !!input && !input.disabled && !running
+        && lastMutation > clickedAt && Date.now() - lastMutation >= quietMs;
+}
+"""
+
+# 최신 턴의 결과 필드를 한 번의 page.evaluate로 추출하는 in-page 스크립트
+# latency 텍스트, Response (structured), Raw JSON, expander 펼침 상태를 함께 반환합니다.
+_EXTRACT_TURN_JS = """
+async (titles) => {
+    const textOf = (el) => (el ? (el.innerText || el.textContent || '') : '');
+    const expanderTitle = (exp) => {
+        const summary = exp.querySelector('summary');
+        return textOf(summary || exp);
+    };
+    const isOpen = (exp) => {
+        const details = exp.querySelector('details');
+        if (details) return details.open;
+        const icon = exp.querySelector('span[data-testid="stIconMaterial"]');
+        return !(icon && icon.innerText.trim() === 'keyboard_arrow_right');
+    };
+    // 전송 전에 표시된 이전 턴 요소는 제외하고 새 턴 요소 중 마지막 것을 사용
+    const findLatest = (title) => {
+        const matches = Array.from(document.querySelectorAll('""" + _FRESH_EXPANDER_SELECTOR + """'))
+            .filter((exp) => expanderTitle(exp).includes(title));
+        return matches.length ? matches[matches.length - 1] : null;
+    };
+
+    // 1) 접힌 expander를 한꺼번에 펼친 뒤 한 프레임만 렌더 대기
+    const expanders = {};
+    const states = {};
+    let clicked = false;
+    for (const title of titles) {
+        const exp = findLatest(title);
+        expanders[title] = exp;
+        states[title] = { found: !!exp, expanded_before: exp ? isOpen(exp) : false };
+        if (exp && !states[title].expanded_before) {
+            const toggle = exp.querySelector('summary')
+                || exp.querySelector('span[data-testid="stIconMaterial"]');
+            if (toggle) { toggle.click(); clicked = true; }
+        }
+    }
+    if (clicked) {
+        await new Promise((resolve) => requestAnimationFrame(() => setTimeout(resolve, 50)));
+    }
+
+    // 2) 내용 추출 우선순위: code block > react-json-view > markdown > 상세 영역 전체
+    const contents = {};
+    for (const title of titles) {
+        const exp = findLatest(title) || expanders[title];
+        let text = '';
+        if (exp) {
+            const selectors = [
+                'pre code',
+                'div.react-json-view',
+                'div[data-testid*="stMarkdownContainer"]',
+                'div[data-testid="stExpanderDetails"]',
+            ];
+            for (const selector of selectors) {
+                const el = exp.querySelector(selector);
+                const candidate = textOf(el);
+                if (candidate && candidate.trim()) { text = candidate; break; }
+            }
+            states[title].expanded_after = isOpen(exp);
+        }
+        contents[title] = text;
+    }
+
+    // 3) latency: 새 턴의 "Response received" 표시, 없으면 새 턴 텍스트 중 "123 ms" 형태의 마지막 텍스트
+    const freshMarkdown = Array.from(document.querySelectorAll('""" + _FRESH_MARKDOWN_SELECTOR + """'));
+    const latencies = freshMarkdown.filter((el) => textOf(el).includes('Response received'));
+    let latency = latencies.length ? textOf(latencies[latencies.length - 1]) : '';
+    if (!latency) {
+        const withMs = freshMarkdown.filter((el) => /\\d+\\s*ms/.test(el.textContent || ''));
+        if (withMs.length) latency = textOf(withMs[withMs.length - 1]).trim();
+    }
+
+    window.scrollTo(0, document.body.scrollHeight);
+    return { latency, contents, expanders: states };
+}
+"""
+
+# 새 턴의 응답이 렌더링되고 페이지가 idle 상태가 되었는지 판단합니다.
+# (새 턴의 latency 표시 + 새 턴의 Raw JSON expander + Streamlit 실행 중 아님 + quietMs 동안 DOM 변경 없음)
+# 전송 전에 표시된 이전 턴 요소는 셀렉터에서 제외되므로 폴링마다 새 턴 요소의 텍스트만 확인합니다.
+_RESPONSE_COMPLETE_JS = """
+([before, quietMs]) => {
+    // 전송 후 페이지가 다시 로드되어 표시가 사라졌으면 새 턴 요소를 구분할 수 없으므로 완료로 보지 않음
+    if (before.turn != null && (window.__naviqaTurn || 0) !== before.turn) return false;
+    const titleOf = (exp) => {
+        const summary = exp.querySelector('summary');
+        return (summary || exp).textContent || '';
+    };
+    const newLatency = Array.from(document.querySelectorAll('""" + _FRESH_MARKDOWN_SELECTOR + """'))
+        .some((el) => (el.textContent || '').includes('Response received'));
+    const hasRawJson = Array.from(document.querySelectorAll('""" + _FRESH_EXPANDER_SELECTOR + """'))
+        .some((exp) => titleOf(exp).includes('Raw JSON'));
+    const status = document.querySelector('[data-testid="stStatusWidget"]');
+    const running = !!status && /running/i.test(status.innerText || '');
+    const quiet = Date.now() - (window.__naviqaLastMutation || 0) >= quietMs;
+    return newLatency && hasRawJson && !running && quiet;
+}
+"""
 
 
 class TestAutomation:
     """웹 UI 테스트 자동화 클래스"""
     
-    def __init__(self, base_url: str = "https://navi-agent-adk-api.dev.onkakao.net/streamlit/"):
+    # 채팅 초기화 후 첫 메시지 전송 전 추가 대기 (초). initialize_chat이 DOM 조건으로 시작을 확인하므로 기본 0
+    chat_settle_seconds = 0
+    
+    # 실제 대상 서버에 요청을 보내는지 여부 (False면 초당 요청 수 상한과 AIMD 조절을 적용하지 않음)
+    throttle_requests = True
+    
+    # 대화 상태를 복제(fork)할 수 있는지 여부. True인 드라이버만 멀티턴 시나리오를 prefix 공유로 실행
+    # (브라우저 UI는 대화를 분기할 수 없어 공유 prefix를 다시 보내야 하므로 절감 효과가 없음)
+    supports_conversation_fork = False
+    
+    # 셀렉터 전략 (SelectorResolver가 앞에서부터 시도하고 성공한 전략을 기억)
+    _MESSAGE_INPUT_STRATEGIES = [
+        ('aria-label', lambda page: page.locator('textarea[aria-label="Your Message"]')),
+        ('마지막 textarea', lambda page: page.locator('textarea').last),
+        ('placeholder', lambda page: page.locator('textarea[placeholder*="message" i]')),
+    ]
+    _SEND_BUTTON_STRATEGIES = [
+        ('text', lambda page: page.locator('button:has-text("Send Message")')),
+        ('role', lambda page: page.get_by_role('button', name='Send Message')),
+    ]
+    _SAVE_BUTTON_STRATEGIES = [
+        ('text', lambda page: page.locator('button:has-text("Save & Start Chat")')),
+        ('role', lambda page: page.get_by_role('button', name='Save & Start Chat')),
+    ]
+    # 세션 재사용 시 대화 기록만 초기화하는 앱 내 버튼 (없으면 페이지 리셋으로 대체)
+    _NEW_CONVERSATION_STRATEGIES = [
+        ('new chat', lambda page: page.locator('button:has-text("New Chat")')),
+        ('new conversation', lambda page: page.locator('button:has-text("New Conversation")')),
+        ('clear chat', lambda page: page.locator('button:has-text("Clear Chat")')),
+        ('새 대화', lambda page: page.locator('button:has-text("새 대화")')),
+    ]
+    
+    # 병렬 워커 인스턴스에 그대로 복사할 실행 설정
+    _WORKER_CONFIG_ATTRS = (
+        'capture_mode',
+        'reset_mode',
+        'response_timeout_ms',
+        'response_idle_ms',
+        'chat_ready_timeout_ms',
+        'timing_profile',  # 워커 간 공유 (관측값을 함께 기록)
+        'resource_blocker',  # 워커 간 공유 (차단 통계를 함께 집계)
+        'selector_resolver',  # 워커 간 공유 (학습한 셀렉터 전략을 함께 사용)
+        'retry_policy',
+        'governor',  # 워커 간 공유 (초당 요청 수 상한, 동시 실행 수 조절)
+        'archive_mode',
+        'response_archive',  # 워커 간 공유 (녹화/재생 통계를 함께 집계)
+        'failure_tracer',  # 워커 간 공유 (실행당 트레이스 저장 용량을 함께 집계)
+        'step_timer',  # 워커 간 공유 (단계별 소요 시간을 함께 집계)
+        'memory_watchdog',  # 워커 간 공유 (메모리 초과 시 워커마다 다음 단위 경계에서 컨텍스트 재생성)
+        'session_reuse',
+        'prefix_sharing',
+    )
+    
+    def __init__(self, base_url: str = "https://navi-agent-adk-api.dev.onkakao.net/streamlit/",
+                 capture_mode: Optional[str] = None, browser_pool=None,
+                 timing_preset: Optional[str] = None):
         """
         Args:
             base_url: 테스트 대상 웹 UI URL
+            capture_mode: 응답 수집 방식. 'dom'(Raw JSON expander 스크래핑, 기본값) 또는
+                'network'(Playwright 네트워크 이벤트에서 원본 응답 본문 캡처)
+            browser_pool: 상주 브라우저 풀 (browser_pool.BrowserPool). 지정하면 브라우저를 새로 띄우지 않고
+                warm 페이지를 빌려 쓰며, run_tests는 pool.run()/pool.submit()으로 실행해야 합니다.
+            timing_preset: 타이밍 프리셋 'fast', 'balanced', 'debug' (기본값: NAVIQA_TIMING_PRESET 또는 'balanced').
+                관측된 단계별 소요 시간으로 타임아웃을 산출하며, slow_mo는 'debug'에서만 사용합니다.
         """
         self.base_url = base_url
         self.page: Optional[Page] = None
         self.playwright = None
         self.browser = None
         self.context = None
+        self.cdp_endpoint: Optional[str] = None
+        # 응답 완료 감지 설정 (최대 대기 시간, DOM 변경이 멈춘 것으로 볼 시간)
+        self.response_timeout_ms = int(os.environ.get('NAVIQA_RESPONSE_TIMEOUT_MS', '25000'))
+        self.response_idle_ms = int(os.environ.get('NAVIQA_RESPONSE_IDLE_MS', '300'))
+        self.chat_ready_timeout_ms = int(os.environ.get('NAVIQA_CHAT_READY_TIMEOUT_MS', '10000'))
+        self.page_load_timeout_ms = 60000
+        self.timing_profile = TimingProfile(base_url, timing_preset)
+        self.capture_mode = (capture_mode or os.environ.get('NAVIQA_CAPTURE_MODE', 'dom')).lower()
+        self.network_capture: Optional[NetworkCapture] = None
+        self.browser_pool = browser_pool
+        self._pool_slot: Optional[Dict] = None
+        # 세션 리셋 방식: 'recycle'(예비 컨텍스트 교체) 또는 'reload'(페이지 전체 리로드)
+        self.reset_mode = os.environ.get('NAVIQA_RESET_MODE', 'recycle').lower()
+        self._spare: Optional[Dict] = None
+        # 불필요 리소스(이미지, 폰트, 미디어, 분석 스크립트) 차단. NAVIQA_BLOCK_RESOURCES=false로 끔
+        block_resources = os.environ.get('NAVIQA_BLOCK_RESOURCES', 'true').lower() in ('1', 'true', 'yes')
+        self.resource_blocker: Optional[ResourceBlocker] = ResourceBlocker() if block_resources else None
+        # 메시지 입력창/체크박스/버튼 셀렉터 전략 학습 및 페이지별 locator 캐시
+        self.selector_resolver = SelectorResolver()
+        # 완료된 턴을 실행 ID별 JSONL 저널에 기록 (중단 후 재개용). NAVIQA_JOURNAL=false로 끔
+        self.journal_enabled = os.environ.get('NAVIQA_JOURNAL', 'true').lower() in ('1', 'true', 'yes')
+        # 인프라 오류(타임아웃, 빈 Raw JSON, 입력창 미검출 등)로 FAIL한 단위의 재시도 정책
+        self.retry_policy = RetryPolicy()
+        # 병렬 실행 단위 배정 순서: 'lpt'(추정 소요 시간이 긴 단위부터) 또는 'fifo'(원래 순서)
+        self.schedule_policy = os.environ.get('NAVIQA_SCHEDULER', 'lpt').lower()
+        # 실행마다 만드는 동시성 조절기 (초당 요청 수 상한 + AIMD 워커 수 조절)
+        self.governor: Optional[ConcurrencyGovernor] = None
+        # 응답 녹화: NAVIQA_RECORD_RESPONSES=true이면 턴 입력/응답을 아카이브에 기록 (재생은 replay_driver 사용)
+        record_responses = os.environ.get('NAVIQA_RECORD_RESPONSES', 'false').lower() in ('1', 'true', 'yes')
+        self.archive_mode: Optional[str] = 'record' if record_responses else None
+        self.response_archive: Optional[ResponseArchive] = ResponseArchive() if record_responses else None
+        # 단계별(브라우저 시작, 리셋, 초기화, 입력, 전송, 응답 대기, 추출, 평가, sleep) 소요 시간 측정
+        self.step_timer = StepTimer()
+        # Chromium 메모리 감시: 임계값을 넘으면 다음 단위 경계에서 컨텍스트/브라우저 재생성. NAVIQA_MEMORY_WATCHDOG=false로 끔
+        watch_memory = os.environ.get('NAVIQA_MEMORY_WATCHDOG', 'true').lower() in ('1', 'true', 'yes')
+        self.memory_watchdog: Optional[MemoryWatchdog] = MemoryWatchdog() if watch_memory else None
+        self._memory_generation = 0
+        # 메모리 감시 대상 브라우저 프로세스 PID (직접 띄운 브라우저 또는 빌린 풀 브라우저, 병렬 워커면 None)
+        self.browser_pid: Optional[int] = None
+        # FAIL/오류가 난 시나리오의 Playwright 트레이스만 저장. 기록 비용이 있으므로 NAVIQA_TRACE_FAILURES=true로 켬
+        trace_failures = os.environ.get('NAVIQA_TRACE_FAILURES', 'false').lower() in ('1', 'true', 'yes')
+        self.failure_tracer: Optional[FailureTracer] = FailureTracer() if trace_failures else None
+        self._trace_context = None
+        # 현재 대화의 Request Fields와 앞서 보낸 메시지 (아카이브 키 계산용)
+        self._conversation_fields: Dict = {}
+        self._conversation_history: List[str] = []
+        # 단일 턴 세션 재사용: Request Fields가 같은 케이스를 모아 한 채팅 세션에서 새 대화만 시작해 실행.
+        # NAVIQA_SESSION_REUSE=true로 켬. 결과 행에 session_id(채팅 세션)와 session_case(세션 내 순번)를 기록
+        self.session_reuse = os.environ.get('NAVIQA_SESSION_REUSE', 'false').lower() in ('1', 'true', 'yes')
+        self._session_id: Optional[str] = None
+        self._session_fingerprint: Optional[tuple] = None
+        self._session_page = None
+        self._session_case = 0
+        self._new_conversation_warned = False
+        # 멀티턴 prefix 공유 실행: Request Fields와 앞부분 메시지가 같은 시나리오는 공통 턴을 한 번만 전송하고
+        # 분기점에서 대화를 복제해 이어서 실행 (supports_conversation_fork 드라이버). NAVIQA_PREFIX_SHARING=false로 끔
+        self.prefix_sharing = os.environ.get('NAVIQA_PREFIX_SHARING', 'true').lower() in ('1', 'true', 'yes')
+        # 단위 index별 실제 소요 시간 (ms, makespan 리포트용)
+        self._unit_durations: Dict[int, float] = {}
+        # 마지막 run_tests 실행 리포트 (리소스 차단 통계 등)
+        self.run_report: Dict = {}
     
-    def start_browser(self):
-        """브라우저 시작"""
+    @property
+    def target_url(self) -> str:
+        """실제로 요청을 받는 URL (초당 요청 수 상한 조회용). 브라우저 UI 드라이버는 base_url"""
+        return self.base_url
+    
+    def _get_proxy_config(self) -> Optional[Dict]:
+        """
+        환경 변수에서 프록시 설정을 읽습니다. (사외망에서 사내망 접근용)
+        
+        Returns:
+            Playwright proxy 설정 딕셔너리 또는 None
+        """
+        import os
+        http_proxy = os.environ.get('HTTP_PROXY') or os.environ.get('http_proxy')
+        https_proxy = os.environ.get('HTTPS_PROXY') or os.environ.get('https_proxy')
+        
+        if not (http_proxy or https_proxy):
+            return None
+        
+        proxy_config = {
+            'server': http_proxy or https_proxy,
+        }
+        # 프록시 인증 정보가 있으면 추가
+        proxy_user = os.environ.get('PROXY_USER')
+        proxy_pass = os.environ.get('PROXY_PASS')
+        if proxy_user and proxy_pass:
+            proxy_config['username'] = proxy_user
+            proxy_config['password'] = proxy_pass
+        
+        return proxy_config
+    
+    @staticmethod
+    def _find_free_port() -> int:
+        """CDP 원격 디버깅용으로 비어 있는 로컬 포트를 찾습니다."""
+        import socket
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(('127.0.0.1', 0))
+            return sock.getsockname()[1]
+    
+    def start_browser(self, remote_debugging: bool = False):
+        """
+        브라우저 시작
+        
+        Args:
+            remote_debugging: True이면 CDP 포트를 열어 병렬 워커가
+                같은 Chromium에 접속할 수 있게 합니다 (self.cdp_endpoint).
+        """
         import os
+        if self.browser_pool is not None:
+            self._lease_from_pool()
+            return
+        
         print("🚀 브라우저 시작 중...")
         
         try:
@@ -42,21 +436,8 @@ class TestAutomation:
         headless_mode = headless_env.lower() == 'true'
         
         # 프록시 설정 (사외망에서 사내망 접근용)
-        proxy_config = None
-        http_proxy = os.environ.get('HTTP_PROXY') or os.environ.get('http_proxy')
-        https_proxy = os.environ.get('HTTPS_PROXY') or os.environ.get('https_proxy')
-        
-        if http_proxy or https_proxy:
-            proxy_config = {
-                'server': http_proxy or https_proxy,
-            }
-            # 프록시 인증 정보가 있으면 추가
-            proxy_user = os.environ.get('PROXY_USER')
-            proxy_pass = os.environ.get('PROXY_PASS')
-            if proxy_user and proxy_pass:
-                proxy_config['username'] = proxy_user
-                proxy_config['password'] = proxy_pass
-            
+        proxy_config = self._get_proxy_config()
+        if proxy_config:
             print(f"🔧 프록시 설정: {proxy_config['server']}")
         
         print(f"🔧 브라우저 설정: headless={headless_mode}, chromium_path={chromium_path}")
@@ -65,7 +446,7 @@ class TestAutomation:
         # 메모리 최적화를 위한 옵션 추가
         launch_options = {
             'headless': headless_mode,
-            'slow_mo': 100,  # 디버깅을 위해 동작을 천천히
+            'slow_mo': self.timing_profile.slow_mo,  # 'debug' 프리셋에서만 동작을 천천히
             'args': [
                 '--no-sandbox',
                 '--disable-setuid-sandbox',
@@ -83,6 +464,17 @@ class TestAutomation:
             ]
         }
         
+        # 병렬 실행 시 워커들이 같은 Chromium에 CDP로 접속
+        if remote_debugging:
+            cdp_port = self._find_free_port()
+            launch_options['args'].append(f'--remote-debugging-port={cdp_port}')
+            self.cdp_endpoint = f'http://127.0.0.1:{cdp_port}'
+            print(f"🔧 CDP 원격 디버깅 활성화: {self.cdp_endpoint}")
+        
+        # 메모리 감시가 이 브라우저 프로세스만 찾을 수 있도록 실행 인자에 표식 추가 (Chromium은 모르는 인자를 무시)
+        browser_marker = f'--naviqa-run={uuid.uuid4().hex[:12]}'
+        launch_options['args'].append(browser_marker)
+        
         # 시스템 chromium 경로 확인 (여러 경로 시도)
         chromium_paths = [
             chromium_path,
@@ -106,26 +498,109 @@ class TestAutomation:
         
         try:
             self.browser = self.playwright.chromium.launch(**launch_options)
+            self.browser_pid = find_browser_pid(browser_marker)
             print("✅ 브라우저 실행 완료")
         except Exception as e:
             print(f"❌ 브라우저 실행 실패: {e}")
             raise
         
+        self._open_page(proxy_config)
+    
+    def _lease_from_pool(self):
+        """상주 브라우저 풀에서 base_url에 접속해 둔 warm 컨텍스트/페이지를 빌립니다."""
+        print("🚀 상주 브라우저 풀에서 페이지 할당 중...")
+        self._pool_slot = self.browser_pool.acquire(self.base_url, self.capture_mode,
+                                                    resource_blocker=self.resource_blocker,
+                                                    timing_profile=self.timing_profile)
+        self.browser = self.browser_pool.browser
+        self.cdp_endpoint = self.browser_pool.cdp_endpoint
+        # 메모리 감시는 풀 브라우저 프로세스를 대상으로 함 (재생성은 컨텍스트 단위로만)
+        self.browser_pid = self.browser_pool.browser_pid
+        self.context = self._pool_slot['context']
+        self.page = self._pool_slot['page']
+        self.network_capture = self._pool_slot['network_capture']
+        print("✅ 페이지 할당 완료")
+    
+    def attach_browser(self, cdp_endpoint: str):
+        """
+        다른 인스턴스가 실행한 Chromium에 CDP로 접속하여 독립된 컨텍스트를 엽니다.
+        병렬 실행 워커용이며, Playwright sync API는 스레드별로 인스턴스가 필요하므로
+        워커 스레드 안에서 호출해야 합니다.
+        
+        Args:
+            cdp_endpoint: start_browser(remote_debugging=True)가 설정한 self.cdp_endpoint
+        """
+        try:
+            self.playwright = sync_playwright().start()
+            self.browser = self.playwright.chromium.connect_over_cdp(cdp_endpoint, slow_mo=self.timing_profile.slow_mo)
+            print(f"✅ 공유 브라우저 접속 완료: {cdp_endpoint}")
+        except Exception as e:
+            print(f"❌ 공유 브라우저 접속 실패: {e}")
+            raise
+        
+        self._open_page(self._get_proxy_config())
+    
+    def _load_base_url(self, page: Page):
+        """
+        base_url을 로드하고 networkidle까지 기다립니다.
+        타임아웃은 타이밍 프로필에서 산출하며, 성공한 로드 시간은 프로필에 기록합니다.
+        """
+        timeout_ms = self.timing_profile.timeout_ms('page_load', self.page_load_timeout_ms)
+        load_start = time.time()
         try:
-            # 메모리 최적화를 위한 컨텍스트 옵션 (256MB 제한 환경 대응)
-            context_options = {
-                'viewport': {'width': 1280, 'height': 720},  # 작은 뷰포트로 메모리 절약
-                'ignore_https_errors': True,
-                'java_script_enabled': True,
-                'bypass_csp': True,
-            }
-            
-            # 프록시 설정이 있으면 컨텍스트에 추가
-            if proxy_config:
-                context_options['proxy'] = proxy_config
-            
-            self.context = self.browser.new_context(**context_options)
-            self.page = self.context.new_page()
+            page.goto(self.base_url, timeout=timeout_ms)
+            page.wait_for_load_state("networkidle", timeout=timeout_ms)
+        except PlaywrightTimeoutError:
+            self.timing_profile.record_timeout('page_load', timeout_ms)
+            raise
+        self.timing_profile.record('page_load', (time.time() - load_start) * 1000)
+        if self.timing_profile.settle_seconds:
+            self.step_timer.sleep(self.timing_profile.settle_seconds)  # 페이지 로드 후 안정화 대기
+    
+    def _new_context(self, proxy_config: Optional[Dict] = None) -> tuple:
+        """
+        공유 브라우저에 새 컨텍스트와 페이지를 만듭니다. (접속은 하지 않음)
+        
+        Args:
+            proxy_config: 컨텍스트에 적용할 프록시 설정
+        
+        Returns:
+            (context, page, network_capture) 튜플. 캡처 모드가 아니면 network_capture는 None
+        """
+        # 메모리 최적화를 위한 컨텍스트 옵션 (256MB 제한 환경 대응)
+        context_options = {
+            'viewport': {'width': 1280, 'height': 720},  # 작은 뷰포트로 메모리 절약
+            'ignore_https_errors': True,
+            'java_script_enabled': True,
+            'bypass_csp': True,
+        }
+        
+        # 프록시 설정이 있으면 컨텍스트에 추가
+        if proxy_config:
+            context_options['proxy'] = proxy_config
+        
+        context = self.browser.new_context(**context_options)
+        if self.resource_blocker:
+            self.resource_blocker.attach(context)
+        page = context.new_page()
+        
+        # 네트워크 캡처 모드: websocket 생성을 놓치지 않도록 goto 전에 핸들러 등록
+        network_capture = None
+        if self.capture_mode == 'network':
+            network_capture = NetworkCapture(page)
+            network_capture.attach()
+            print("🔧 네트워크 캡처 모드 활성화")
+        return context, page, network_capture
+    
+    def _open_page(self, proxy_config: Optional[Dict] = None):
+        """
+        새 브라우저 컨텍스트와 페이지를 만들고 base_url에 접속합니다.
+        
+        Args:
+            proxy_config: 컨텍스트에 적용할 프록시 설정
+        """
+        try:
+            self.context, self.page, self.network_capture = self._new_context(proxy_config)
             print(f"🌐 페이지 접속 중: {self.base_url}")
             
             # 네트워크 연결 확인 (DNS 해석 실패 시 명확한 에러 메시지)
@@ -133,9 +608,7 @@ class TestAutomation:
                 print(f"🌐 페이지 접속 시도: {self.base_url}")
                 print(f"   프록시 설정: {proxy_config['server'] if proxy_config else '없음'}")
                 
-                self.page.goto(self.base_url, timeout=60000)  # 타임아웃 60초로 증가
-                self.page.wait_for_load_state("networkidle", timeout=60000)
-                time.sleep(1)
+                self._load_base_url(self.page)
                 print("✅ 페이지 로드 완료")
             except Exception as goto_error:
                 error_msg = str(goto_error)
@@ -206,7 +679,16 @@ class TestAutomation:
             raise
     
     def close_browser(self):
-        """브라우저 종료"""
+        """브라우저 종료 (풀에서 빌린 경우 컨텍스트만 반납)"""
+        self._discard_spare_page()
+        if self.browser_pool is not None and self._pool_slot is not None:
+            self.browser_pool.release(self._pool_slot, self.base_url, self.capture_mode)
+            self._pool_slot = None
+            self.browser_pid = None
+            self.browser = None
+            self.context = None
+            self.page = None
+            return
         if self.browser:
             self.browser.close()
         if self.playwright:
@@ -220,13 +702,71 @@ class TestAutomation:
             label: aria-label 값
             value: 입력할 값
         """
+        target = f"input:{label}"
         try:
-            input_locator = self.page.locator(f'input[aria-label="{label}"]')
-            input_locator.wait_for(state="visible", timeout=5000)
-            input_locator.fill(str(value))
+            resolved = self.selector_resolver.resolve(self.page, target, [
+                ('aria-label', lambda page: page.locator(f'input[aria-label="{label}"]')),
+                ('name', lambda page: page.locator(f'input[name="{label}"]')),
+            ])
+            # 아직 렌더링 전이면 기본 셀렉터로 표시될 때까지 대기
+            input_locator = resolved[1] if resolved else self.page.locator(f'input[aria-label="{label}"]')
+            input_locator.first.wait_for(state="visible", timeout=5000)
+            input_locator.first.fill(str(value))
         except Exception as e:
+            self.selector_resolver.invalidate(self.page, target)
             print(f"입력 필드 '{label}' 채우기 실패: {e}")
     
+    @staticmethod
+    def _checkbox_strategies(label: str) -> list:
+        """
+        체크박스 탐색 전략 목록 (앞에서부터 시도)
+        
+        Args:
+            label: 체크박스 레이블 (aria-label, name, 또는 주변 텍스트)
+        
+        Returns:
+            (전략 이름, page -> locator 또는 None) 리스트
+        """
+        label_variants = (label.lower(), label.replace('_', ' ').lower())
+        
+        def by_label_element(page):
+            # label 요소의 for 속성 또는 label 부모 요소에서 체크박스 찾기
+            labels = page.locator('label')
+            for i in range(labels.count()):
+                label_element = labels.nth(i)
+                label_text = label_element.inner_text().lower()
+                if not any(variant in label_text for variant in label_variants):
+                    continue
+                for_id = label_element.get_attribute('for')
+                if for_id:
+                    checkbox_locator = page.locator(f'input#{for_id}[type="checkbox"]')
+                    if checkbox_locator.count() > 0:
+                        return checkbox_locator.first
+                checkbox_locator = label_element.locator('..').locator('input[type="checkbox"]')
+                if checkbox_locator.count() > 0:
+                    return checkbox_locator.first
+            return None
+        
+        def by_nearby_text(page):
+            # 모든 체크박스를 순회하며 부모 요소 텍스트로 찾기
+            all_checkboxes = page.locator('input[type="checkbox"]')
+            for i in range(all_checkboxes.count()):
+                cb = all_checkboxes.nth(i)
+                try:
+                    parent_text = cb.locator('..').inner_text().lower()
+                except Exception:
+                    continue
+                if any(variant in parent_text for variant in label_variants):
+                    return cb
+            return None
+        
+        return [
+            ('aria-label', lambda page: page.locator(f'input[aria-label="{label}"][type="checkbox"]').first),
+            ('name', lambda page: page.locator(f'input[name="{label}"][type="checkbox"]').first),
+            ('label', by_label_element),
+            ('주변 텍스트', by_nearby_text),
+        ]
+    
     def toggle_checkbox(self, label: str, target_value: bool):
         """
         여러 방법으로 체크박스를 찾아 토글합니다.
@@ -237,65 +777,10 @@ class TestAutomation:
         """
         try:
             print(f"  🔍 체크박스 찾기: '{label}', 목표값: {target_value}")
-            checkbox = None
-            
-            # 방법 1: aria-label로 찾기
-            checkbox_locator = self.page.locator(f'input[aria-label="{label}"][type="checkbox"]')
-            if checkbox_locator.count() > 0:
-                checkbox = checkbox_locator.first
-                print(f"  ✅ 체크박스 찾음 (aria-label): {label}")
-            
-            # 방법 2: name 속성으로 찾기
-            if not checkbox or checkbox_locator.count() == 0:
-                checkbox_locator = self.page.locator(f'input[name="{label}"][type="checkbox"]')
-                if checkbox_locator.count() > 0:
-                    checkbox = checkbox_locator.first
-                    print(f"  ✅ 체크박스 찾음 (name): {label}")
-            
-            # 방법 3: label 텍스트로 찾기
-            if not checkbox or checkbox_locator.count() == 0:
-                # label 요소에서 찾기
-                labels = self.page.locator('label')
-                for i in range(labels.count()):
-                    label_element = labels.nth(i)
-                    label_text = label_element.inner_text().lower()
-                    if label.lower() in label_text or label.replace('_', ' ').lower() in label_text:
-                        # label의 for 속성으로 input 찾기
-                        for_id = label_element.get_attribute('for')
-                        if for_id:
-                            checkbox_locator = self.page.locator(f'input#{for_id}[type="checkbox"]')
-                            if checkbox_locator.count() > 0:
-                                checkbox = checkbox_locator.first
-                                print(f"  ✅ 체크박스 찾음 (label for): {label}")
-                                break
-                        
-                        # label 부모 요소에서 체크박스 찾기
-                        if not checkbox or checkbox_locator.count() == 0:
-                            parent = label_element.locator('..')
-                            checkbox_locator = parent.locator('input[type="checkbox"]')
-                            if checkbox_locator.count() > 0:
-                                checkbox = checkbox_locator.first
-                                print(f"  ✅ 체크박스 찾음 (label parent): {label}")
-                                break
-            
-            # 방법 4: 모든 체크박스를 순회하며 주변 텍스트로 찾기
-            if not checkbox or checkbox_locator.count() == 0:
-                all_checkboxes = self.page.locator('input[type="checkbox"]')
-                for i in range(all_checkboxes.count()):
-                    cb = all_checkboxes.nth(i)
-                    # 체크박스 주변 텍스트 확인
-                    try:
-                        # 부모 요소에서 텍스트 확인
-                        parent = cb.locator('..')
-                        parent_text = parent.inner_text().lower()
-                        if label.lower() in parent_text or label.replace('_', ' ').lower() in parent_text:
-                            checkbox = cb
-                            print(f"  ✅ 체크박스 찾음 (주변 텍스트): {label}")
-                            break
-                    except:
-                        continue
+            # 학습된 전략(또는 이 페이지에서 캐시된 locator)부터 시도하고, 실패할 때만 전체 탐색
+            resolved = self.selector_resolver.resolve(self.page, f"checkbox:{label}", self._checkbox_strategies(label))
             
-            if not checkbox or checkbox_locator.count() == 0:
+            if resolved is None:
                 # 디버깅: 모든 체크박스 정보 출력
                 all_checkboxes = self.page.locator('input[type="checkbox"]')
                 print(f"  ⚠️ 체크박스를 찾을 수 없습니다: {label}")
@@ -311,6 +796,9 @@ class TestAutomation:
                         pass
                 raise Exception(f"체크박스를 찾을 수 없습니다: {label}")
             
+            strategy_name, checkbox = resolved
+            print(f"  ✅ 체크박스 찾음 ({strategy_name}): {label}")
+            
             # 체크박스 상태 확인 및 토글
             # Streamlit 체크박스는 React로 관리되므로 특별한 처리가 필요
             try:
@@ -324,7 +812,7 @@ class TestAutomation:
                         # 여러 방법으로 스크롤 시도
                         # 방법 1-1: scroll_into_view_if_needed
                         checkbox.scroll_into_view_if_needed()
-                        time.sleep(0.3)
+                        self.step_timer.sleep(0.3)
                         
                         # 방법 1-2: JavaScript로 직접 스크롤
                         checkbox.evaluate("""
@@ -353,7 +841,7 @@ class TestAutomation:
                                 }
                             }
                         """)
-                        time.sleep(0.5)  # 스크롤 완료 대기
+                        self.step_timer.sleep(0.5)  # 스크롤 완료 대기
                         
                         # 방법 1-3: 페이지 전체를 스크롤하면서 체크박스 찾기
                         # 체크박스가 여전히 보이지 않으면 페이지를 위에서 아래로 스크롤
@@ -369,7 +857,7 @@ class TestAutomation:
                                     window.scrollBy(0, {300 * (scroll_attempt + 1)});
                                 }}
                             """)
-                            time.sleep(0.3)
+                            self.step_timer.sleep(0.3)
                         
                         # 체크박스를 다시 찾기 (스크롤 후 DOM이 변경되었을 수 있음)
                         checkbox = self.page.locator(f'input[aria-label="{label}"][type="checkbox"]').first
@@ -479,7 +967,7 @@ class TestAutomation:
                             }}
                         }}
                     """)
-                    time.sleep(0.5)
+                    self.step_timer.sleep(0.5)
                     
                     # 방법 3: 실제 클릭도 시도 (보이는 경우)
                     try:
@@ -488,18 +976,18 @@ class TestAutomation:
                         if is_visible:
                             print(f"  🔧 체크박스가 보이므로 실제 클릭 시도...")
                             checkbox.click(force=False)  # 실제 클릭
-                            time.sleep(0.3)
+                            self.step_timer.sleep(0.3)
                             print(f"  ✅ 실제 클릭 완료")
                         else:
                             print(f"  🔧 체크박스가 보이지 않으므로 Force 클릭 시도...")
                             checkbox.click(force=True)  # 강제 클릭
-                            time.sleep(0.3)
+                            self.step_timer.sleep(0.3)
                             print(f"  ✅ Force 클릭 완료")
                     except Exception as click_error:
                         print(f"  ℹ️ 실제 클릭은 스킵 (이미 JavaScript로 설정됨): {click_error}")
                     
                     # 최종 확인
-                    time.sleep(0.3)
+                    self.step_timer.sleep(0.3)
                     final_checked = checkbox.is_checked()
                     final_aria_checked = checkbox.get_attribute('aria-checked')
                     print(f"  📊 최종 체크 상태: checked={final_checked}, aria-checked={final_aria_checked}, 목표: {target_value}")
@@ -512,7 +1000,7 @@ class TestAutomation:
                         try:
                             print(f"  🔧 Force 클릭으로 최종 시도...")
                             checkbox.click(force=True)
-                            time.sleep(0.5)
+                            self.step_timer.sleep(0.5)
                             final_checked3 = checkbox.is_checked()
                             if final_checked3 == target_value:
                                 print(f"  ✅ Force 클릭 후 성공: {target_value}")
@@ -535,6 +1023,46 @@ class TestAutomation:
     def initialize_chat(self, user_id: str, lat: float, lng: float, is_driving: bool):
         """
         최초 1회 채팅 초기화 (Request Fields 입력 및 save & start chat 클릭)
+        한 번의 in-page 호출로 모든 필드를 설정하고, 고정 sleep 대신 DOM 조건으로 채팅 시작을 확인합니다.
+        일괄 설정에 실패한 필드가 있으면 필드별 입력 방식으로 대체합니다.
+        
+        Args:
+            user_id: 사용자 ID
+            lat: 위도
+            lng: 경도
+            is_driving: 운전 여부
+        """
+        try:
+            outcome = self.page.evaluate(_BULK_INIT_JS, {
+                'inputs': {'user_id': str(user_id), 'lat': str(lat), 'lng': str(lng)},
+                'checkbox': {'label': 'is_driving', 'value': bool(is_driving)},
+            })
+            missing = [label for label, state in outcome['status'].items() if not state.get('found')]
+            if not missing:
+                if outcome['clickedAt'] is not None:
+                    ready_timeout_ms = self.timing_profile.timeout_ms('chat_ready', self.chat_ready_timeout_ms)
+                    try:
+                        ready_start = time.time()
+                        self.page.wait_for_function(
+                            _CHAT_READY_JS,
+                            arg=[outcome['clickedAt'], self.response_idle_ms],
+                            timeout=ready_timeout_ms,
+                            polling=100,
+                        )
+                        self.timing_profile.record('chat_ready', (time.time() - ready_start) * 1000)
+                    except PlaywrightTimeoutError:
+                        self.timing_profile.record_timeout('chat_ready', ready_timeout_ms)
+                        print(f"  ⚠️ 채팅 시작 확인 타임아웃 (계속 진행)")
+                return
+            print(f"  ⚠️ 일괄 초기화에서 찾지 못한 필드: {missing} - 필드별 입력으로 대체")
+        except Exception as e:
+            print(f"  ⚠️ 일괄 초기화 실패 - 필드별 입력으로 대체: {e}")
+        
+        self._initialize_chat_per_field(user_id, lat, lng, is_driving)
+    
+    def _initialize_chat_per_field(self, user_id: str, lat: float, lng: float, is_driving: bool):
+        """
+        필드별 채팅 초기화 (일괄 초기화 실패 시 대체 경로)
         
         Args:
             user_id: 사용자 ID
@@ -545,23 +1073,23 @@ class TestAutomation:
         try:
             # aria-label을 사용하여 입력 필드 채우기
             self.fill_input('user_id', user_id)
-            time.sleep(0.3)
+            self.step_timer.sleep(0.3)
             
             self.fill_input('lat', lat)
-            time.sleep(0.3)
+            self.step_timer.sleep(0.3)
             
             self.fill_input('lng', lng)
-            time.sleep(0.3)
+            self.step_timer.sleep(0.3)
             
             # is_driving 체크박스 토글
             self.toggle_checkbox('is_driving', is_driving)
-            time.sleep(0.3)
+            self.step_timer.sleep(0.3)
             
             # "Save & Start Chat" 버튼 클릭
-            save_button = self.page.locator('button:has-text("Save & Start Chat")')
-            if save_button.count() > 0:
-                save_button.click()
-                time.sleep(1.5)  # 채팅 초기화 대기
+            resolved_button = self.selector_resolver.resolve(self.page, 'save_button', self._SAVE_BUTTON_STRATEGIES)
+            if resolved_button:
+                resolved_button[1].first.click()
+                self.step_timer.sleep(3.5)  # 채팅 초기화 및 안정화 대기
             
         except Exception as e:
             print(f"채팅 초기화 중 오류 발생: {e}")
@@ -579,9 +1107,10 @@ class TestAutomation:
             추출된 내용
         """
         try:
-            # 1) expander 블록 찾기 (titleText를 포함한 expander) - XPath 사용
-            expander_xpath = f'xpath=//div[@data-testid="stExpander" and contains(., "{title_text}")]'
-            expander = self.page.locator(expander_xpath)
+            # 1) expander 블록 찾기 (titleText를 포함한 새 턴의 마지막 expander) - XPath 사용
+            expander_xpath = (f'xpath=//div[@data-testid="stExpander" and not(@{_TURN_MARKER_ATTR})'
+                              f' and contains(., "{title_text}")]')
+            expander = self.page.locator(expander_xpath).last
             
             if expander.count() == 0:
                 return ''
@@ -592,8 +1121,8 @@ class TestAutomation:
                 if icon_locator.count() > 0:
                     icon_text = icon_locator.first.inner_text().strip()
                     if icon_text == 'keyboard_arrow_right':
+                        # 렌더 대기는 아래 각 추출 단계의 wait_for(visible)가 담당
                         icon_locator.first.click()
-                        time.sleep(0.5)  # 렌더 대기
             except Exception:
                 pass
             
@@ -657,23 +1186,41 @@ class TestAutomation:
             latency 문자열 (예: "Response received in 123ms")
         """
         try:
-            # "Response received" 텍스트가 포함된 마크다운 컨테이너 찾기
-            latency_locator = self.page.locator('div[data-testid="stMarkdownContainer"]:has-text("Response received")')
+            # 새 턴의 "Response received" 텍스트가 포함된 마지막 마크다운 컨테이너 찾기
+            latency_locator = self.page.locator(f'{_FRESH_MARKDOWN_SELECTOR}:has-text("Response received")')
             if latency_locator.count() > 0:
-                return latency_locator.first.inner_text()
+                return latency_locator.last.inner_text()
         except Exception:
             pass
         
         try:
-            # 대체: 숫자와 "ms"가 포함된 텍스트 찾기
-            any_ms = self.page.locator('text=/\\d+\\s*ms/')
+            # 대체: 새 턴의 마크다운 중 숫자와 "ms"가 포함된 텍스트 찾기
+            import re
+            any_ms = self.page.locator(_FRESH_MARKDOWN_SELECTOR).filter(has_text=re.compile(r'\d+\s*ms'))
             if any_ms.count() > 0:
-                return any_ms.first.inner_text()
+                return any_ms.last.inner_text()
         except Exception:
             pass
         
         return ''
     
+    def extract_turn_snapshot(self) -> Dict:
+        """
+        최신 턴의 latency, Response (structured), Raw JSON과 expander 상태를
+        한 번의 page.evaluate 호출로 추출합니다. (턴당 브라우저 왕복 1회)
+        전송 직전 _snapshot_response_state()가 표시한 이전 턴 요소는 읽지 않습니다.
+        
+        Returns:
+            latency, response_structured, raw_json, expanders(제목별 found/expanded_before/expanded_after)
+        """
+        snapshot = self.page.evaluate(_EXTRACT_TURN_JS, ['Response (structured)', 'Raw JSON'])
+        return {
+            'latency': snapshot.get('latency', ''),
+            'response_structured': snapshot['contents'].get('Response (structured)', ''),
+            'raw_json': snapshot['contents'].get('Raw JSON', ''),
+            'expanders': snapshot.get('expanders', {}),
+        }
+    
     def extract_tts_from_raw_json(self, raw_json: str) -> str:
         """
         Raw JSON에서 TTS 필드를 추출합니다.
@@ -1174,6 +1721,51 @@ class TestAutomation:
         
         return ''
     
+    def _snapshot_response_state(self) -> Dict:
+        """
+        메시지 전송 직전에 화면의 응답 요소를 이전 턴으로 표시합니다.
+        wait_for_response_complete와 결과 추출은 표시되지 않은 새 턴 요소만 확인하므로
+        대화가 길어져도 턴당 비용이 일정하고 이전 턴의 응답을 읽지 않습니다.
+        
+        Returns:
+            {'turn': 턴 번호, 'marked': 이번에 표시한 요소 수}
+        """
+        try:
+            return self.page.evaluate(_RESPONSE_STATE_JS)
+        except Exception as e:
+            print(f"  ⚠️ 응답 상태 기록 실패 (계속 진행): {e}")
+            return {'turn': None, 'marked': 0}
+    
+    def wait_for_response_complete(self, before_state: Dict, timeout_ms: Optional[int] = None) -> bool:
+        """
+        새 턴의 응답이 완전히 렌더링되고 페이지가 idle 상태가 될 때까지 기다립니다.
+        고정 sleep 대신 DOM 신호(새 latency 표시, Raw JSON expander, Streamlit 실행 상태,
+        DOM 변경 정지)를 폴링하므로 실제 백엔드 지연 시간만큼만 대기합니다.
+        
+        Args:
+            before_state: 전송 직전 _snapshot_response_state() 결과
+            timeout_ms: 최대 대기 시간 (기본값: 타이밍 프로필이 산출한 'response' 타임아웃,
+                관측값이 부족하면 self.response_timeout_ms)
+        
+        Returns:
+            제한 시간 안에 완료되면 True, 타임아웃이면 False
+        """
+        if timeout_ms is None:
+            timeout_ms = self.timing_profile.timeout_ms('response', self.response_timeout_ms)
+        try:
+            wait_start = time.time()
+            self.page.wait_for_function(
+                _RESPONSE_COMPLETE_JS,
+                arg=[before_state, self.response_idle_ms],
+                timeout=timeout_ms,
+                polling=100,
+            )
+            self.timing_profile.record('response', (time.time() - wait_start) * 1000)
+            return True
+        except PlaywrightTimeoutError:
+            self.timing_profile.record_timeout('response', timeout_ms)
+            return False
+    
     def send_message_and_collect_results(self, message: str, message_index: int = 0) -> Dict:
         """
         메시지를 전송하고 결과를 수집합니다.
@@ -1195,171 +1787,156 @@ class TestAutomation:
         try:
             print(f"  📤 메시지 {message_index + 1} 전송 시작: {message[:50]}...")
             
-            # 이전 응답이 완전히 끝날 때까지 대기 (latency 최대 7초 고려)
-            print(f"  ⏳ 이전 응답 완료 대기 중...")
-            time.sleep(2)  # 기본 대기
+            with self.step_timer.span('input_fill'):
+                # 메시지 입력창 찾기. 학습된 전략(또는 이 페이지에서 캐시된 locator)부터 시도하고,
+                # 매칭되지 않을 때만 전체 후보(aria-label -> 마지막 textarea -> placeholder)를 탐색
+                message_input = None
+                max_input_retries = 5
             
-            # 메시지 입력창 찾기 (더 정확하게, 여러 방법 시도)
-            message_input = None
-            max_input_retries = 5
-            
-            for retry in range(max_input_retries):
-                try:
-                    # 방법 1: aria-label로 찾기
-                    message_input = self.page.locator('textarea[aria-label="Your Message"]')
-                    if message_input.count() > 0:
-                        print(f"  ✅ 메시지 입력창 찾음 (aria-label, 시도 {retry + 1})")
-                        break
-                    
-                    # 방법 2: 모든 textarea 중 마지막 것 (가장 최근)
-                    all_textareas = self.page.locator('textarea')
-                    if all_textareas.count() > 0:
-                        message_input = all_textareas.last
-                        print(f"  ✅ 메시지 입력창 찾음 (마지막 textarea, 시도 {retry + 1})")
-                        break
-                    
-                    # 방법 3: placeholder로 찾기
-                    message_input = self.page.locator('textarea[placeholder*="message" i], textarea[placeholder*="Message" i]')
-                    if message_input.count() > 0:
-                        print(f"  ✅ 메시지 입력창 찾음 (placeholder, 시도 {retry + 1})")
-                        break
+                for retry in range(max_input_retries):
+                    try:
+                        resolved = self.selector_resolver.resolve(self.page, 'message_input', self._MESSAGE_INPUT_STRATEGIES)
+                        if resolved:
+                            strategy_name, message_input = resolved
+                            print(f"  ✅ 메시지 입력창 찾음 ({strategy_name}, 시도 {retry + 1})")
+                            break
                     
-                    if retry < max_input_retries - 1:
-                        print(f"  ⚠️ 메시지 입력창 찾기 실패, 재시도 중... (시도 {retry + 1}/{max_input_retries})")
-                        time.sleep(1)
+                        if retry < max_input_retries - 1:
+                            print(f"  ⚠️ 메시지 입력창 찾기 실패, 재시도 중... (시도 {retry + 1}/{max_input_retries})")
+                            self.step_timer.sleep(1)
                         
-                except Exception as e:
-                    print(f"  ⚠️ 입력창 찾기 오류 (시도 {retry + 1}): {e}")
-                    if retry < max_input_retries - 1:
-                        time.sleep(1)
+                    except Exception as e:
+                        print(f"  ⚠️ 입력창 찾기 오류 (시도 {retry + 1}): {e}")
+                        if retry < max_input_retries - 1:
+                            self.step_timer.sleep(1)
             
-            if message_input is None or message_input.count() == 0:
-                print(f"  ❌ 메시지 입력창을 찾을 수 없습니다 (최대 시도 횟수 초과)")
-                results['error'] = "메시지 입력창을 찾을 수 없음"
-                return results
+                if message_input is None:
+                    print(f"  ❌ 메시지 입력창을 찾을 수 없습니다 (최대 시도 횟수 초과)")
+                    results['error'] = "메시지 입력창을 찾을 수 없음"
+                    return results
             
-            # 입력 필드가 활성화될 때까지 대기
-            print(f"  ⏳ 입력 필드 활성화 대기 중...")
-            try:
-                message_input.first.wait_for(state="visible", timeout=5000)
-                message_input.first.wait_for(state="attached", timeout=5000)
-            except Exception as e:
-                print(f"  ⚠️ 입력 필드 활성화 대기 중 오류: {e}")
+                # 이전 응답이 끝나 입력 필드가 다시 활성화될 때까지 대기 (고정 sleep 대신)
+                print(f"  ⏳ 입력 필드 활성화 대기 중...")
+                try:
+                    message_input.first.wait_for(state="visible", timeout=5000)
+                    message_input.first.wait_for(state="attached", timeout=5000)
+                    message_input.first.evaluate(
+                        """(el, timeout) => new Promise((resolve) => {
+                            const start = Date.now();
+                            const check = () => (!el.disabled || Date.now() - start > timeout)
+                                ? resolve() : setTimeout(check, 50);
+                            check();
+                        })""",
+                        5000
+                    )
+                except Exception as e:
+                    print(f"  ⚠️ 입력 필드 활성화 대기 중 오류: {e}")
             
-            # 기존 내용 클리어 후 새 메시지 입력 (더 확실하게)
-            print(f"  ✏️ 메시지 입력 중...")
-            try:
-                # 클릭하여 포커스
-                message_input.first.click()
-                time.sleep(0.3)
-                
-                # 전체 선택 후 삭제 (더 확실한 클리어)
-                message_input.first.press('Control+a')  # Mac/Linux
-                time.sleep(0.2)
-                message_input.first.press('Meta+a')  # Mac 대체
-                time.sleep(0.2)
-                message_input.first.fill('')  # 클리어
-                time.sleep(0.3)
-                
-                # 새 메시지 입력
-                message_input.first.fill(str(message))
-                time.sleep(0.5)
-                
-                # 입력 확인
-                current_value = message_input.first.input_value()
-                if current_value != str(message):
-                    print(f"  ⚠️ 입력값 불일치, 재입력 시도...")
-                    message_input.first.fill('')
-                    time.sleep(0.2)
+                # 기존 내용 클리어 후 새 메시지 입력 (fill은 기존 값을 대체함)
+                print(f"  ✏️ 메시지 입력 중...")
+                try:
+                    message_input.first.click()
                     message_input.first.fill(str(message))
-                    time.sleep(0.5)
                 
-                print(f"  ✅ 메시지 입력 완료: '{current_value[:50]}...'")
+                    # 입력 확인
+                    current_value = message_input.first.input_value()
+                    if current_value != str(message):
+                        print(f"  ⚠️ 입력값 불일치, 재입력 시도...")
+                        message_input.first.fill('')
+                        message_input.first.fill(str(message))
+                        current_value = message_input.first.input_value()
                 
-            except Exception as e:
-                print(f"  ❌ 메시지 입력 중 오류: {e}")
-                # 대체 방법: type 사용
-                try:
-                    message_input.first.fill('')
-                    message_input.first.type(str(message), delay=50)
-                    time.sleep(0.5)
-                    print(f"  ✅ 메시지 입력 완료 (type 방법)")
-                except Exception as e2:
-                    print(f"  ❌ 메시지 입력 실패: {e2}")
-                    results['error'] = f"메시지 입력 실패: {str(e2)}"
-                    return results
-            
-            # "Send Message" 버튼 클릭
-            send_button = self.page.locator('button:has-text("Send Message")')
-            if send_button.count() > 0:
-                send_button.first.click()
-                print(f"  ✅ Send 버튼 클릭")
+                    print(f"  ✅ 메시지 입력 완료: '{current_value[:50]}...'")
+                
+                except Exception as e:
+                    print(f"  ❌ 메시지 입력 중 오류: {e}")
+                    self.selector_resolver.invalidate(self.page, 'message_input')
+                    # 대체 방법: type 사용
+                    try:
+                        message_input.first.fill('')
+                        message_input.first.type(str(message), delay=50)
+                        print(f"  ✅ 메시지 입력 완료 (type 방법)")
+                    except Exception as e2:
+                        print(f"  ❌ 메시지 입력 실패: {e2}")
+                        results['error'] = f"메시지 입력 실패: {str(e2)}"
+                        return results
+            
+            with self.step_timer.span('send'):
+                # 전송 직전 응답 상태 기록 (이전 턴의 응답을 완료로 오인하지 않기 위함)
+                before_state = self._snapshot_response_state()
+                if self.network_capture:
+                    self.network_capture.begin_turn()
+            
+                # "Send Message" 버튼 클릭
+                resolved_button = self.selector_resolver.resolve(self.page, 'send_button', self._SEND_BUTTON_STRATEGIES)
+                if resolved_button:
+                    resolved_button[1].first.click()
+                    print(f"  ✅ Send 버튼 클릭")
+                else:
+                    # Enter 키로 전송 시도
+                    message_input.first.press('Enter')
+                    print(f"  ✅ Enter 키로 전송")
+            
+            # 새 응답이 렌더링되고 페이지가 idle 상태가 될 때까지 대기 (상한: 타이밍 프로필의 response 타임아웃)
+            response_timeout_ms = self.timing_profile.timeout_ms('response', self.response_timeout_ms)
+            print(f"  ⏳ 응답 대기 중... (최대 {response_timeout_ms / 1000:.1f}초)")
+            wait_start = time.time()
+            with self.step_timer.span('wait_response'):
+                response_completed = self.wait_for_response_complete(before_state, response_timeout_ms)
+            if response_completed:
+                print(f"  ✅ 응답 완료 감지 ({time.time() - wait_start:.2f}초)")
             else:
-                # Enter 키로 전송 시도
-                message_input.first.press('Enter')
-                print(f"  ✅ Enter 키로 전송")
-            
-            # 응답이 완전히 로드될 때까지 대기 (latency 최대 7초 + 여유시간 고려)
-            print(f"  ⏳ 응답 대기 중... (latency 최대 7초 고려)")
-            
-            # 1. latency 표시 대기 (최대 15초 = 7초 latency + 8초 여유)
-            try:
-                self.page.wait_for_selector(
-                    'div[data-testid="stMarkdownContainer"]:has-text("Response received")',
-                    timeout=15000
-                )
-                print(f"  ✅ Response received 표시 확인")
-            except PlaywrightTimeoutError:
-                print(f"  ⚠️ Response received 표시 타임아웃 (계속 진행)")
-            
-            # 2. Raw JSON expander가 나타날 때까지 대기 (추가 확인, 최대 10초)
-            try:
-                self.page.wait_for_selector(
-                    'div[data-testid="stExpander"]:has-text("Raw JSON")',
-                    timeout=10000,
-                    state="visible"
-                )
-                print(f"  ✅ Raw JSON expander 확인")
-            except PlaywrightTimeoutError:
-                print(f"  ⚠️ Raw JSON expander 타임아웃 (계속 진행)")
-            
-            # 3. 충분한 렌더링 대기 (latency 7초 + 추가 처리 시간 고려)
-            print(f"  ⏳ 응답 렌더링 대기 중... (8초)")
-            time.sleep(8)  # latency 최대 7초 + 렌더링 시간 고려
-            
-            # 4. 스크롤을 맨 아래로 (최신 응답 확인)
-            self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            time.sleep(1)
-            
-            print(f"  📥 결과 추출 시작...")
-            
-            # 결과 추출 (여러 번 시도)
-            max_retries = 3
-            for retry in range(max_retries):
-                try:
-                    results['latency'] = self.extract_latency()
-                    results['response_structured'] = self.extract_expander_content('Response (structured)')
-                    results['raw_json'] = self.extract_expander_content('Raw JSON')
-                    results['tts'] = self.extract_tts_from_raw_json(results['raw_json'])
+                results['response_timed_out'] = True
+                print(f"  ⚠️ 응답 완료 감지 타임아웃 (계속 진행)")
+            
+            with self.step_timer.span('extraction'):
+                # 네트워크 캡처 모드: 원본 응답 본문을 그대로 사용 (expander 클릭/텍스트 재파싱 생략)
+                if self.network_capture:
+                    captured = self.network_capture.collect_turn()
+                    if captured['raw_json']:
+                        results['raw_json'] = captured['raw_json']
+                        results['tts'] = self.extract_tts_from_raw_json(captured['raw_json'])
+                        results['capture_source'] = captured['source']
+                        if captured['latency_ms'] is not None:
+                            results['latency'] = f"Response received in {captured['latency_ms']:.0f}ms ({captured['source']})"
+                        print(f"  ✅ 네트워크 캡처 성공: source={captured['source']}, latency={captured['latency_ms']}ms, raw_json_len={len(captured['raw_json'])}")
+                        return results
+                    print(f"  ⚠️ 네트워크 캡처 결과 없음, DOM 추출로 대체")
+            
+                print(f"  📥 결과 추출 시작...")
+                results['capture_source'] = 'dom'
+            
+                # 결과 추출 (여러 번 시도). in-page 일괄 추출이 실패하면 개별 locator 방식으로 대체
+                max_retries = 3
+                for retry in range(max_retries):
+                    try:
+                        try:
+                            snapshot = self.extract_turn_snapshot()
+                            results['latency'] = snapshot['latency']
+                            results['response_structured'] = snapshot['response_structured']
+                            results['raw_json'] = snapshot['raw_json']
+                            results['expanders'] = snapshot['expanders']
+                        except Exception as snapshot_error:
+                            print(f"  ⚠️ 일괄 추출 실패, 개별 추출로 대체: {snapshot_error}")
+                            results['latency'] = self.extract_latency()
+                            results['response_structured'] = self.extract_expander_content('Response (structured)')
+                            results['raw_json'] = self.extract_expander_content('Raw JSON')
+                        results['tts'] = self.extract_tts_from_raw_json(results['raw_json'])
                     
-                    # 결과가 있는지 확인
-                    if results['raw_json'] or results['response_structured']:
-                        print(f"  ✅ 결과 추출 성공 (시도 {retry + 1}/{max_retries})")
-                        break
-                    else:
-                        print(f"  ⚠️ 결과가 비어있음, 재시도 중... (시도 {retry + 1}/{max_retries})")
-                        time.sleep(2)
-                except Exception as e:
-                    print(f"  ⚠️ 결과 추출 오류 (시도 {retry + 1}/{max_retries}): {e}")
-                    if retry < max_retries - 1:
-                        time.sleep(2)
+                        # 결과가 있는지 확인
+                        if results['raw_json'] or results['response_structured']:
+                            print(f"  ✅ 결과 추출 성공 (시도 {retry + 1}/{max_retries})")
+                            break
+                        else:
+                            print(f"  ⚠️ 결과가 비어있음, 재시도 중... (시도 {retry + 1}/{max_retries})")
+                            self.step_timer.sleep(1)
+                    except Exception as e:
+                        print(f"  ⚠️ 결과 추출 오류 (시도 {retry + 1}/{max_retries}): {e}")
+                        if retry < max_retries - 1:
+                            self.step_timer.sleep(1)
             
             print(f"  📊 추출된 결과: latency={results['latency'][:30] if results['latency'] else 'N/A'}, raw_json_len={len(results['raw_json'])}, tts_len={len(results['tts'])}")
             
-            # 다음 테스트를 위한 대기 (입력 필드가 다시 활성화될 때까지)
-            print(f"  ⏳ 다음 테스트 준비 대기 중... (3초)")
-            time.sleep(3)
-            
         except Exception as e:
             import traceback
             error_trace = traceback.format_exc()
@@ -1376,8 +1953,8 @@ class TestAutomation:
                 return df_row[key]
         return df_row.get(col_name, default)
     
-    def _initialize_chat_for_row(self, row):
-        """행 데이터에서 채팅을 초기화합니다."""
+    def _request_fields(self, row) -> Dict:
+        """행 데이터의 Request Fields (user_id, lat, lng, is_driving)"""
         # is_driving 값 처리
         is_driving_value = self._get_column_value(row, 'is_driving', False)
         if isinstance(is_driving_value, str):
@@ -1387,56 +1964,161 @@ class TestAutomation:
         else:
             is_driving_value = bool(is_driving_value)
         
-        self.initialize_chat(
-            user_id=str(self._get_column_value(row, 'user_id', '')),
-            lat=float(self._get_column_value(row, 'lat', 0)),
-            lng=float(self._get_column_value(row, 'lng', 0)),
-            is_driving=is_driving_value
-        )
+        return {
+            'user_id': str(self._get_column_value(row, 'user_id', '')),
+            'lat': float(self._get_column_value(row, 'lat', 0)),
+            'lng': float(self._get_column_value(row, 'lng', 0)),
+            'is_driving': is_driving_value,
+        }
+    
+    def _session_key(self, row) -> tuple:
+        """채팅 초기화 fingerprint. 같으면 같은 채팅 세션에서 새 대화만 시작해 실행할 수 있습니다."""
+        return tuple(self._request_fields(row).items())
+    
+    def _initialize_chat_for_row(self, row):
+        """행 데이터에서 채팅을 초기화하고 새 채팅 세션으로 기록합니다."""
+        self._conversation_fields = self._request_fields(row)
+        self._conversation_history = []
+        with self.step_timer.span('initialize_chat'):
+            self.initialize_chat(**self._conversation_fields)
+        self._session_id = uuid.uuid4().hex[:12]
+        self._session_fingerprint = tuple(self._conversation_fields.items())
+        self._session_page = self.page
+        self._session_case = 1
+    
+    def _reuse_session(self, row) -> bool:
+        """
+        세션 재사용이 켜져 있고 현재 채팅 세션의 Request Fields가 행과 같으면
+        페이지 리셋/채팅 초기화 대신 앱 안에서 새 대화만 시작합니다.
+        
+        Args:
+            row: 실행할 단일 턴 케이스 행
+        
+        Returns:
+            현재 세션에서 새 대화를 시작했으면 True (호출자가 전체 리셋/초기화를 생략)
+        """
+        if not self.session_reuse or self._session_fingerprint is None or self._session_page is not self.page:
+            return False
+        if self._session_key(row) != self._session_fingerprint:
+            return False
+        with self.step_timer.span('reset_page'):
+            started = self.start_new_conversation()
+        if not started:
+            self._session_fingerprint = None
+            return False
+        self._conversation_fields = dict(self._session_fingerprint)
+        self._conversation_history = []
+        self._session_case += 1
+        return True
+    
+    def start_new_conversation(self) -> bool:
+        """
+        페이지를 다시 로드하지 않고 앱의 새 대화 버튼으로 대화 기록만 초기화합니다. (Request Fields 유지)
+        
+        Returns:
+            새 대화가 시작되었으면 True (버튼이 없거나 확인에 실패하면 False)
+        """
+        resolved = self.selector_resolver.resolve(self.page, 'new_conversation', self._NEW_CONVERSATION_STRATEGIES)
+        if not resolved:
+            if not self._new_conversation_warned:
+                print("  ⚠️ 새 대화 버튼을 찾지 못해 세션 재사용 없이 페이지를 리셋합니다.")
+                self._new_conversation_warned = True
+            return False
+        try:
+            clicked_at = self.page.evaluate("() => {" + _MUTATION_TRACKER_JS + " return Date.now(); }")
+            resolved[1].first.click()
+            ready_start = time.time()
+            self.page.wait_for_function(
+                _CHAT_READY_JS,
+                arg=[clicked_at, self.response_idle_ms],
+                timeout=self.timing_profile.timeout_ms('chat_ready', self.chat_ready_timeout_ms),
+                polling=100,
+            )
+            self.timing_profile.record('chat_ready', (time.time() - ready_start) * 1000)
+            return True
+        except Exception as e:
+            print(f"  ⚠️ 새 대화 시작 실패 (페이지 리셋으로 대체): {e}")
+            self.selector_resolver.invalidate(self.page, 'new_conversation')
+            return False
+    
+    def _current_turn_inputs(self, message: str) -> Dict:
+        """현재 대화에서 message를 보낼 때의 턴 입력 (응답 아카이브 키)"""
+        return turn_inputs(self.base_url, self._conversation_fields, self._conversation_history, message)
+    
+    def _collect_turn_results(self, message: str) -> Dict:
+        """
+        메시지를 전송하고 결과를 수집합니다. 녹화 모드면 오류 없이 수집된 응답을 아카이브에 기록합니다.
+        
+        Args:
+            message: 전송할 메시지
+        
+        Returns:
+            send_message_and_collect_results 결과 딕셔너리
+        """
+        inputs = self._current_turn_inputs(message)
+        test_results = self.send_message_and_collect_results(message, 0)
+        if self.archive_mode == 'record' and self.response_archive is not None and not test_results.get('error'):
+            try:
+                self.response_archive.store(inputs, test_results)
+            except OSError as e:
+                print(f"  ⚠️ 응답 녹화 실패: {e}")
+        self._conversation_history.append(message)
+        return test_results
     
-    def _execute_turn(self, row, turn_number, test_case_id=None):
-        """한 턴을 실행하고 결과를 반환합니다."""
+    def _execute_turn(self, row, turn_number, test_case_id=None, test_results: Optional[Dict] = None):
+        """
+        한 턴을 실행하고 결과를 반환합니다.
+        
+        Args:
+            row: 턴 행
+            turn_number: 턴 번호 (단일 턴이면 None)
+            test_case_id: 시나리오 ID (단일 턴이면 None)
+            test_results: 이미 수집한 응답 (prefix 공유 실행에서 한 번 보낸 턴을 여러 시나리오 행으로 평가할 때).
+                None이면 메시지를 전송해 수집합니다.
+        """
         from similarity import calculate_similarity, determine_pass_fail
         from evaluator import evaluate_comprehensive
         
         try:
             # 메시지 전송 및 결과 수집
             message_value = self._get_column_value(row, 'message', '')
-            test_results = self.send_message_and_collect_results(str(message_value), 0)
-            
-            # Raw JSON에서 TTS 추출
-            tts_from_raw_json = self.extract_tts_from_raw_json(test_results['raw_json'])
-            
-            # Raw JSON에서 action 필드 추출
-            # 디버깅: raw_json 실제 내용 확인
-            raw_json_content = test_results.get('raw_json', '')
-            print(f"  🔍 Raw JSON 전체 내용 ({len(raw_json_content)}자):\n{raw_json_content}", flush=True)
-            
-            # raw_json에서 먼저 추출 시도
-            action_name, action_data, next_step = self.extract_action_fields_from_raw_json(test_results['raw_json'])
-            import sys
-            
-            # raw_json에서 추출 실패한 경우 response_structured에서 시도
-            if not action_name or not action_data or not next_step:
-                print(f"  ⚠️ raw_json에서 일부 필드 추출 실패, response_structured에서 시도...", flush=True)
-                response_structured_content = test_results.get('response_structured', '')
-                print(f"  🔍 Response (structured) 전체 내용 ({len(response_structured_content)}자):\n{response_structured_content}", flush=True)
+            if test_results is None:
+                test_results = self._collect_turn_results(str(message_value))
+            
+            with self.step_timer.span('extraction'):
+                # Raw JSON에서 TTS 추출
+                tts_from_raw_json = self.extract_tts_from_raw_json(test_results['raw_json'])
+            
+                # Raw JSON에서 action 필드 추출
+                # 디버깅: raw_json 실제 내용 확인
+                raw_json_content = test_results.get('raw_json', '')
+                print(f"  🔍 Raw JSON 전체 내용 ({len(raw_json_content)}자):\n{raw_json_content}", flush=True)
+            
+                # raw_json에서 먼저 추출 시도
+                action_name, action_data, next_step = self.extract_action_fields_from_raw_json(test_results['raw_json'])
+                import sys
+            
+                # raw_json에서 추출 실패한 경우 response_structured에서 시도
+                if not action_name or not action_data or not next_step:
+                    print(f"  ⚠️ raw_json에서 일부 필드 추출 실패, response_structured에서 시도...", flush=True)
+                    response_structured_content = test_results.get('response_structured', '')
+                    print(f"  🔍 Response (structured) 전체 내용 ({len(response_structured_content)}자):\n{response_structured_content}", flush=True)
                 
-                rs_action_name, rs_action_data, rs_next_step = self.extract_action_fields_from_response_structured(response_structured_content)
+                    rs_action_name, rs_action_data, rs_next_step = self.extract_action_fields_from_response_structured(response_structured_content)
                 
-                # response_structured에서 추출한 값으로 보완
-                if not action_name and rs_action_name:
-                    action_name = rs_action_name
-                    print(f"  ✅ response_structured에서 action_name 보완: '{action_name}'", flush=True)
-                if not action_data and rs_action_data:
-                    action_data = rs_action_data
-                    print(f"  ✅ response_structured에서 action_data 보완: 길이={len(action_data)}", flush=True)
-                if not next_step and rs_next_step:
-                    next_step = rs_next_step
-                    print(f"  ✅ response_structured에서 next_step 보완: '{next_step}'", flush=True)
-            
-            print(f"  📋 최종 추출된 action 필드: action_name='{action_name}', action_data 길이={len(action_data)}, next_step='{next_step}'", flush=True)
-            sys.stdout.flush()
+                    # response_structured에서 추출한 값으로 보완
+                    if not action_name and rs_action_name:
+                        action_name = rs_action_name
+                        print(f"  ✅ response_structured에서 action_name 보완: '{action_name}'", flush=True)
+                    if not action_data and rs_action_data:
+                        action_data = rs_action_data
+                        print(f"  ✅ response_structured에서 action_data 보완: 길이={len(action_data)}", flush=True)
+                    if not next_step and rs_next_step:
+                        next_step = rs_next_step
+                        print(f"  ✅ response_structured에서 next_step 보완: '{next_step}'", flush=True)
+            
+                print(f"  📋 최종 추출된 action 필드: action_name='{action_name}', action_data 길이={len(action_data)}, next_step='{next_step}'", flush=True)
+                sys.stdout.flush()
             
             # 기대값 컬럼 읽기 - row에서 직접 가져오기
             import pandas as pd
@@ -1488,22 +2170,23 @@ class TestAutomation:
             # 디버깅: 읽은 값 확인
             print(f"  🔍 기대값 읽기 결과: tts_expected='{tts_expected}', action_name_expected='{action_name_expected}', action_data_expected='{action_data_expected[:50] if action_data_expected else ''}', next_step_expected='{next_step_expected}'", flush=True)
             
-            # 종합 평가 수행
-            evaluation_result = evaluate_comprehensive(
-                raw_json=test_results.get('raw_json', ''),
-                tts_actual=tts_from_raw_json,
-                tts_expected=tts_expected,
-                action_name=action_name or '',
-                action_name_expected=action_name_expected,
-                action_data=action_data or '',
-                action_data_expected=action_data_expected,
-                next_step=next_step or '',
-                next_step_expected=next_step_expected,
-            )
+            with self.step_timer.span('evaluation'):
+                # 종합 평가 수행
+                evaluation_result = evaluate_comprehensive(
+                    raw_json=test_results.get('raw_json', ''),
+                    tts_actual=tts_from_raw_json,
+                    tts_expected=tts_expected,
+                    action_name=action_name or '',
+                    action_name_expected=action_name_expected,
+                    action_data=action_data or '',
+                    action_data_expected=action_data_expected,
+                    next_step=next_step or '',
+                    next_step_expected=next_step_expected,
+                )
             
-            verdict = evaluation_result['verdict']
-            fail_reason = evaluation_result['fail_reason']
-            scores = evaluation_result['scores']
+                verdict = evaluation_result['verdict']
+                fail_reason = evaluation_result['fail_reason']
+                scores = evaluation_result['scores']
             
             print(f"  📊 평가 결과: verdict={verdict}, fail_reason={fail_reason[:100] if fail_reason else ''}", flush=True)
             print(f"  📊 점수: tts={scores['tts']:.2f}, action_name={scores['action_name']:.2f}, action_data={scores['action_data']:.2f}, next_step={scores['next_step']:.2f}", flush=True)
@@ -1550,6 +2233,9 @@ class TestAutomation:
                 'latency_text': test_results['latency'],
                 'response_structured': test_results['response_structured'],
                 'raw_json': test_results['raw_json'],
+                'capture_source': test_results.get('capture_source', ''),
+                'turn_error': test_results.get('error', ''),
+                'response_timed_out': bool(test_results.get('response_timed_out')),
                 'tts_actual': tts_from_raw_json,
                 'action_name': action_name,
                 'action_data': action_data,
@@ -1564,274 +2250,1056 @@ class TestAutomation:
             
         except Exception as e:
             # 오류 발생 시
-            # is_driving 값 처리
-            is_driving_value = self._get_column_value(row, 'is_driving', False)
-            if isinstance(is_driving_value, str):
-                is_driving_value = is_driving_value.upper() == 'TRUE'
-            elif isinstance(is_driving_value, (int, float)):
-                is_driving_value = bool(is_driving_value)
-            else:
-                is_driving_value = bool(is_driving_value)
-            
-            import json as json_module
-            return {
-                'test_case_id': test_case_id if test_case_id is not None else '',
-                'turn_number': turn_number if turn_number is not None else '',
-                'user_id': str(self._get_column_value(row, 'user_id', '')),
-                'lng': self._get_column_value(row, 'lng', ''),
-                'lat': self._get_column_value(row, 'lat', ''),
-                'is_driving': is_driving_value,
-                'message': str(self._get_column_value(row, 'message', '')),
-                'tts_expected': str(self._get_column_value(row, 'tts_expected', '')) if self._get_column_value(row, 'tts_expected', '') else '',
-                'action_name_expected': '',  # 오류 시 빈 문자열
-                'action_data_expected': '',
-                'next_step_expected': '',
-                'latency': None,
-                'latency_text': '',
-                'response_structured': '',
-                'raw_json': '',
-                'tts_actual': '',
-                'action_name': '',
-                'action_data': '',
-                'next_step': '',
-                'verdict': 'FAIL',
-                'pass/fail': 'FAIL',  # 하위 호환성
-                'similarity_score': 0.0,
-                'fail_reason': f'테스트 실행 오류: {str(e)}',
-                'scores': json_module.dumps({'tts': 0.0, 'action_name': 0.0, 'action_data': 0.0, 'next_step': 0.0})
-            }
+            return self._build_error_row(row, turn_number, test_case_id, e)
+    
+    def _prepare_spare_page(self):
+        """
+        다음 리셋에서 바꿔 끼울 예비 컨텍스트/페이지를 준비합니다.
+        goto는 commit까지만 기다리므로 나머지 로딩은 현재 시나리오가 실행되는 동안 브라우저에서 진행됩니다.
+        """
+        if self.reset_mode != 'recycle' or self._spare is not None or self.browser is None:
+            return
+        try:
+            context, page, network_capture = self._new_context(self._get_proxy_config())
+            page.goto(self.base_url, timeout=self.page_load_timeout_ms, wait_until='commit')
+            self._spare = {'context': context, 'page': page, 'network_capture': network_capture}
+        except Exception as e:
+            print(f"⚠️ 예비 페이지 준비 실패 (다음 리셋은 전체 리로드): {e}")
+            self._spare = None
+    
+    def _discard_spare_page(self):
+        """사용하지 않은 예비 컨텍스트를 닫습니다."""
+        if self._spare is not None:
+            try:
+                self._spare['context'].close()
+            except Exception:
+                pass
+            self._spare = None
+    
+    def _swap_in_spare_page(self) -> bool:
+        """
+        예비 페이지를 현재 페이지로 바꾸고 이전 컨텍스트를 닫습니다.
+        
+        Returns:
+            교체에 성공하면 True (실패 시 호출자가 전체 리로드로 대체)
+        """
+        spare, self._spare = self._spare, None
+        old_context = self.context
+        try:
+            spare['page'].wait_for_load_state(
+                "networkidle",
+                timeout=self.timing_profile.timeout_ms('page_load', self.page_load_timeout_ms)
+            )
+            # Request Fields 입력창이 렌더링되면 사용 가능한 상태로 판단
+            spare['page'].wait_for_selector('input[aria-label="user_id"]', timeout=10000)
+        except Exception as e:
+            print(f"⚠️ 예비 페이지 준비 미완료: {e}")
+            try:
+                spare['context'].close()
+            except Exception:
+                pass
+            return False
+        
+        self.context = spare['context']
+        self.page = spare['page']
+        self.network_capture = spare['network_capture']
+        if self._pool_slot is not None:
+            # 풀에 반납할 때 현재 컨텍스트를 닫도록 슬롯 갱신 (예비 컨텍스트에는 이 실행의 차단기가 연결되어 있음)
+            self._pool_slot = dict(spare, resource_blocker=self.resource_blocker)
+        
+        # 다음 예비 페이지 로딩을 먼저 시작한 뒤 이전 컨텍스트 정리
+        self._prepare_spare_page()
+        if old_context is not None:
+            try:
+                old_context.close()
+            except Exception:
+                pass
+        return True
     
     def reset_page(self):
         """
         페이지를 리셋하여 새로운 세션을 시작합니다.
+        reset_mode가 'recycle'이면 미리 로드해 둔 예비 컨텍스트로 바꿔 끼우고,
+        예비 페이지가 없거나 실패하면 기존처럼 전체 리로드합니다.
         """
+        if self._spare is not None:
+            print("🔄 예비 페이지로 세션 교체 중...")
+            if self._swap_in_spare_page():
+                print("✅ 페이지 리셋 완료 (컨텍스트 교체)")
+                return
+        
         try:
             print("🔄 페이지 리셋 중...")
             # 페이지를 새로 로드하여 세션 초기화
-            self.page.goto(self.base_url, timeout=60000)
-            self.page.wait_for_load_state("networkidle", timeout=60000)
-            time.sleep(2)  # 페이지 로드 후 안정화 대기
+            self._load_base_url(self.page)
             print("✅ 페이지 리셋 완료")
         except Exception as e:
             print(f"⚠️ 페이지 리셋 중 오류 (계속 진행): {e}")
             # 오류가 발생해도 계속 진행
+        self._prepare_spare_page()
 
-    def run_tests(self, test_cases: pd.DataFrame, progress_callback=None) -> pd.DataFrame:
+    def _build_units(self, test_cases: pd.DataFrame) -> List[Dict]:
         """
-        모든 테스트 케이스를 실행합니다.
-        멀티턴 시나리오를 지원합니다 (test_case_id + turn_number).
+        테스트 케이스를 실행 단위로 나눕니다.
+        멀티턴이면 test_case_id별 시나리오가, 단일 턴이면 각 행이 하나의 단위입니다.
+        단위 내부의 턴 순서는 turn_number 순서로 고정됩니다.
         
         Args:
             test_cases: 테스트 케이스가 담긴 DataFrame
-            progress_callback: 진행 상황 콜백 함수 (current, total, elapsed_time, estimated_remaining)
         
         Returns:
-            결과가 포함된 DataFrame
+            단위 리스트. 각 단위는 index(원래 순서), key(저널 기록용 식별자), test_case_id,
+            turns[(turn_number, row)]를 가집니다.
         """
-        results = []
-        import time as time_module
-        
         # 컬럼명 대소문자 구분 없이 확인
         df_columns_lower = {col.lower(): col for col in test_cases.columns}
         has_test_case_id = 'test_case_id' in df_columns_lower
         has_turn_number = 'turn_number' in df_columns_lower
         
-        # 멀티턴 시나리오인지 확인
-        is_multi_turn = has_test_case_id and has_turn_number
-        
-        if is_multi_turn:
-            # test_case_id별로 그룹화
+        units = []
+        if has_test_case_id and has_turn_number:
             test_case_id_col = df_columns_lower['test_case_id']
             turn_number_col = df_columns_lower['turn_number']
             
             # test_case_id별로 정렬 (turn_number 순서대로)
-            test_cases = test_cases.sort_values([test_case_id_col, turn_number_col])
-            test_case_groups = test_cases.groupby(test_case_id_col)
-            
-            total_scenarios = len(test_case_groups)
-            total_turns = len(test_cases)
-            print(f"📊 멀티턴 시나리오 테스트 시작: 총 {total_scenarios}개 시나리오, {total_turns}개 턴")
+            sorted_cases = test_cases.sort_values([test_case_id_col, turn_number_col])
+            for test_case_id, group in sorted_cases.groupby(test_case_id_col):
+                scenario_turns = group.sort_values(turn_number_col)
+                units.append({
+                    'index': len(units),
+                    'key': str(test_case_id),
+                    'test_case_id': test_case_id,
+                    'turns': [(turn_row[turn_number_col], turn_row) for _, turn_row in scenario_turns.iterrows()],
+                })
         else:
-            # 기존 방식 (단일 턴)
-            total_cases = len(test_cases)
-            print(f"📊 단일 턴 테스트 시작: 총 {total_cases}개 케이스")
+            for row_label, row in test_cases.iterrows():
+                units.append({
+                    'index': len(units),
+                    'key': f"row:{row_label}",
+                    'test_case_id': None,
+                    'turns': [(None, row)],
+                })
+        return units
+    
+    def _build_error_row(self, row, turn_number, test_case_id, error) -> Dict:
+        """턴 실행에 실패했을 때 기록할 FAIL 결과 행을 만듭니다."""
+        import json as json_module
         
-        start_time = time_module.time()
+        # is_driving 값 처리
+        is_driving_value = self._get_column_value(row, 'is_driving', False)
+        if isinstance(is_driving_value, str):
+            is_driving_value = is_driving_value.upper() == 'TRUE'
+        elif isinstance(is_driving_value, (int, float)):
+            is_driving_value = bool(is_driving_value)
+        else:
+            is_driving_value = bool(is_driving_value)
         
+        return {
+            'test_case_id': test_case_id if test_case_id is not None else '',
+            'turn_number': turn_number if turn_number is not None else '',
+            'user_id': str(self._get_column_value(row, 'user_id', '')),
+            'lng': self._get_column_value(row, 'lng', ''),
+            'lat': self._get_column_value(row, 'lat', ''),
+            'is_driving': is_driving_value,
+            'message': str(self._get_column_value(row, 'message', '')),
+            'tts_expected': str(self._get_column_value(row, 'tts_expected', '')) if self._get_column_value(row, 'tts_expected', '') else '',
+            'action_name_expected': '',  # 오류 시 빈 문자열
+            'action_data_expected': '',
+            'next_step_expected': '',
+            'latency': None,
+            'latency_text': '',
+            'response_structured': '',
+            'raw_json': '',
+            'turn_error': str(error),
+            'response_timed_out': False,
+            'tts_actual': '',
+            'action_name': '',
+            'action_data': '',
+            'next_step': '',
+            'verdict': 'FAIL',
+            'pass/fail': 'FAIL',  # 하위 호환성
+            'similarity_score': 0.0,
+            'fail_reason': f'테스트 실행 오류: {str(error)}',
+            'scores': json_module.dumps({'tts': 0.0, 'action_name': 0.0, 'action_data': 0.0, 'next_step': 0.0})
+        }
+    
+    def _execute_timed_turn(self, row, turn_number, test_case_id):
+        """
+        턴을 실행하고 소요 시간을 타이밍 프로필(전체 턴, 메시지별)에 기록합니다.
+        동시성 조절기가 있으면 전송 전 초당 요청 수 상한을 지키고, 결과(지연 시간, 인프라 오류 여부)를 알려줍니다.
+        """
+        if self.governor:
+            self.governor.acquire_request()
+        turn_start = time.time()
+        turn_result = self._execute_turn(row, turn_number, test_case_id)
+        duration_ms = (time.time() - turn_start) * 1000
+        if not turn_result.get('turn_error'):
+            self.timing_profile.record('turn', duration_ms)
+            self.timing_profile.record_message(str(self._get_column_value(row, 'message', '')), duration_ms)
+        if self.governor:
+            # 에이전트 응답 지연(latency)이 있으면 그것을, 없으면 턴 전체 소요 시간을 부하 지표로 사용
+            latency_ms = turn_result.get('latency') or duration_ms
+            self.governor.observe(latency_ms, classify_failure(turn_result) == 'infra')
+        return turn_result
+    
+    def _execute_shared_turn(self, unit: Dict, positions: List[int]) -> List[Dict]:
+        """
+        prefix 공유 단위의 턴 하나를 한 번만 전송하고, 그 턴을 가진 시나리오 행마다 각자의 기대값으로 평가합니다.
+        
+        Args:
+            unit: 공유 실행 단위 (conversation_trie.build_prefix_units)
+            positions: 이 턴을 가진 행의 위치 리스트 (unit['turns']/unit['members'] 인덱스)
+        
+        Returns:
+            위치 순서의 턴 결과 행 리스트 (shared_by: 응답을 공유한 시나리오 수)
+        """
+        _, first_row = unit['turns'][positions[0]]
+        message = str(self._get_column_value(first_row, 'message', ''))
+        if self.governor:
+            self.governor.acquire_request()
+        turn_start = time.time()
         try:
-            self.start_browser()
-            print("✅ 브라우저 준비 완료, 테스트 시작")
-            
-            if is_multi_turn:
-                # 멀티턴 시나리오 실행
-                scenario_num = 0
-                for test_case_id, group in test_case_groups:
-                    scenario_num += 1
-                    scenario_start_time = time_module.time()
-                    
-                    # 시나리오의 턴들을 turn_number 순서대로 정렬
-                    scenario_turns = group.sort_values(turn_number_col)
-                    total_turns_in_scenario = len(scenario_turns)
-                    
-                    print(f"\n{'='*60}")
-                    print(f"시나리오 {scenario_num}/{total_scenarios}: test_case_id={test_case_id} ({total_turns_in_scenario}턴)")
-                    print(f"{'='*60}")
-                    
-                    # 각 시나리오의 첫 번째 턴에서만 페이지 리셋 및 초기화
-                    is_initialized = False
-                    
-                    for turn_idx, (turn_row_idx, turn_row) in enumerate(scenario_turns.iterrows()):
-                        turn_number = turn_row[turn_number_col]
-                        turn_num = turn_idx + 1
-                        
-                        # 진행 상황 업데이트
-                        if progress_callback:
-                            elapsed_time = time_module.time() - start_time
-                            completed_turns = sum(len(g) for i, (_, g) in enumerate(test_case_groups) if i < scenario_num - 1) + turn_num
-                            if completed_turns > 1:
-                                avg_time_per_turn = elapsed_time / completed_turns
-                                estimated_remaining = avg_time_per_turn * (total_turns - completed_turns)
-                            else:
-                                estimated_remaining = None
-                            
-                            progress_callback(
-                                current=completed_turns,
-                                total=total_turns,
-                                elapsed_time=elapsed_time,
-                                estimated_remaining=estimated_remaining
-                            )
-                        
-                        print(f"\n  ┌─ Turn {turn_number} ({turn_num}/{total_turns_in_scenario})")
-                        
-                        # 첫 번째 턴에서만 페이지 리셋 및 초기화
-                        # 같은 test_case_id 내에서는 세션 유지 (페이지 리셋 및 초기화 안 함)
-                        if not is_initialized:
-                            # 새로운 시나리오 시작 시에만 페이지 리셋
-                            if scenario_num > 1:
-                                print("  🔄 새로운 시나리오 시작 - 페이지 리셋")
-                                self.reset_page()
-                            
-                            # 채팅 초기화 (첫 번째 턴에서만)
-                            print("  🔧 채팅 초기화 중...")
-                            self._initialize_chat_for_row(turn_row)
-                            is_initialized = True
-                            print("  ✅ 채팅 초기화 완료")
-                            time.sleep(2)
-                        else:
-                            # 같은 시나리오 내의 후속 턴 - 세션 유지, 초기화 없음
-                            print(f"  ℹ️ 같은 시나리오 내 후속 턴 - 세션 유지 (초기화 없음)")
-                        
-                        # 턴 실행 (기존 대화 세션에서 계속)
-                        turn_result = self._execute_turn(turn_row, turn_number, test_case_id)
-                        results.append(turn_result)
-                        
-                        verdict = turn_result.get('verdict', turn_result.get('pass/fail', 'FAIL'))
-                        print(f"  └─ Turn {turn_number} 완료: {verdict}")
+            test_results = self._collect_turn_results(message)
+        except Exception as e:
+            test_results = None
+            error = e
+        duration_ms = (time.time() - turn_start) * 1000
+        
+        turn_results = []
+        for position in positions:
+            turn_number, row = unit['turns'][position]
+            member, _ = unit['members'][position]
+            if test_results is None:
+                turn_result = self._build_error_row(row, turn_number, member['test_case_id'], error)
+            else:
+                turn_result = self._execute_turn(row, turn_number, member['test_case_id'], test_results=dict(test_results))
+            turn_result['shared_by'] = len(positions)
+            turn_results.append(turn_result)
+        
+        first_result = turn_results[0]
+        if not first_result.get('turn_error'):
+            self.timing_profile.record('turn', duration_ms)
+            self.timing_profile.record_message(message, duration_ms)
+        if self.governor:
+            latency_ms = first_result.get('latency') or duration_ms
+            self.governor.observe(latency_ms, classify_failure(first_result) == 'infra')
+        return turn_results
+    
+    def save_conversation(self) -> Dict:
+        """현재 대화 상태(Request Fields, 보낸 메시지)를 저장합니다. (prefix 공유 실행의 분기점)"""
+        return {'fields': dict(self._conversation_fields), 'history': list(self._conversation_history)}
+    
+    def restore_conversation(self, state: Dict, fork: bool = False):
+        """
+        save_conversation()으로 저장한 대화 상태로 되돌립니다.
+        기본 구현은 세션을 리셋하고 저장된 메시지를 다시 보내 같은 대화를 만듭니다. (응답 평가 없음)
+        대화 상태를 복제할 수 있는 드라이버(supports_conversation_fork)는 이 메서드를 재정의합니다.
+        
+        Args:
+            state: save_conversation() 결과
+            fork: True이면 저장된 대화는 그대로 두고 복제본에서 계속 (이후 다른 가지가 같은 상태를 다시 복원)
+        """
+        self._replay_conversation(state)
+    
+    def _replay_conversation(self, state: Dict):
+        """세션 리셋 -> 채팅 초기화 -> 저장된 메시지 재전송으로 대화 상태를 다시 만듭니다."""
+        print(f"  🔁 대화 상태 재구성: 메시지 {len(state['history'])}개 재전송")
+        with self.step_timer.span('reset_page'):
+            self.reset_page()
+        self._conversation_fields = dict(state['fields'])
+        self._conversation_history = []
+        with self.step_timer.span('initialize_chat'):
+            self.initialize_chat(**self._conversation_fields)
+        for message in state['history']:
+            results = self._collect_turn_results(message)
+            if results.get('error'):
+                raise RuntimeError(f"대화 상태 재구성 실패: {results['error']}")
+    
+    def _run_prefix_plan(self, unit: Dict, reset_first: bool, unit_start_time: float) -> Iterator[Dict]:
+        """prefix 공유 단위의 실행 계획(start/send/save/restore)을 따라 턴을 실행하고 위치 순서로 결과 행을 내보냅니다."""
+        print(f"  🌳 prefix 공유 실행: 시나리오 {len(unit['scenarios'])}개, "
+              f"턴 {len(unit['turns'])}개를 {len(unit['send_turns'])}번 전송으로 실행")
+        saved_states: Dict[int, tuple] = {}
+        # 복원에 실패한 가지의 턴은 전송하지 않고 오류 행으로 기록 (다른 가지는 계속 실행)
+        branch_error = None
+        for step in unit['plan']:
+            op = step[0]
+            if op == 'start':
+                self._session_id = None
+                if reset_first:
+                    with self.step_timer.span('reset_page'):
+                        self.reset_page()
+                self._begin_unit_trace(unit)
+                print("  🔧 채팅 초기화 중...")
+                self._initialize_chat_for_row(unit['turns'][step[1]][1])
+                print("  ✅ 채팅 초기화 완료")
+                self.step_timer.sleep(self.chat_settle_seconds)
+                self.timing_profile.record('unit_setup', (time.time() - unit_start_time) * 1000)
+            elif op == 'send':
+                _, message, positions = step
+                print(f"\n  ┌─ 공유 턴 (시나리오 {len(positions)}개): {message[:50]}")
+                if branch_error is None:
+                    turn_results = self._execute_shared_turn(unit, positions)
+                else:
+                    turn_results = []
+                    for position in positions:
+                        turn_number, row = unit['turns'][position]
+                        turn_result = self._build_error_row(row, turn_number, unit['members'][position][0]['test_case_id'], branch_error)
+                        turn_result['shared_by'] = len(positions)
+                        turn_results.append(turn_result)
+                verdicts = [turn_result.get('verdict', turn_result.get('pass/fail', 'FAIL')) for turn_result in turn_results]
+                print(f"  └─ 공유 턴 완료: {verdicts}")
+                for turn_result in turn_results:
+                    yield turn_result
+            elif op == 'save':
+                saved_states[step[1]] = (self.save_conversation(), branch_error)
+            elif op == 'restore':
+                state, branch_error = saved_states[step[1]]
+                if branch_error is None:
+                    try:
+                        self.restore_conversation(state, fork=step[2])
+                    except Exception as e:
+                        print(f"  ⚠️ 대화 상태 복원 실패 - 이 가지의 턴은 오류로 기록: {e}")
+                        branch_error = e
+    
+    def _run_unit(self, unit: Dict, reset_first: bool = True) -> Iterator[Dict]:
+        """
+        실행 단위 하나(시나리오 또는 단일 턴 케이스)를 현재 페이지에서 실행합니다.
+        
+        Args:
+            unit: _build_units가 만든 실행 단위
+            reset_first: 실행 전에 페이지를 리셋할지 여부 (페이지의 첫 단위면 False)
+        
+        Yields:
+            턴별 결과 행 (turn_number 순서)
+        """
+        import time as time_module
+        
+        unit_start_time = time_module.time()
+        
+        # 다음 단위용 예비 페이지를 미리 로드 (reset_mode='recycle')
+        if not reset_first:
+            self._prepare_spare_page()
+        
+        # FAIL/오류 턴이 있거나 예외로 중단되면 이 단위의 트레이스를 저장 (아니면 버림)
+        failed = False
+        try:
+            for turn_result in self._run_unit_turns(unit, reset_first, unit_start_time):
+                if turn_result.get('verdict', turn_result.get('pass/fail')) == 'FAIL' or turn_result.get('turn_error'):
+                    failed = True
+                if turn_result.get('turn_error') or turn_result.get('response_timed_out'):
+                    # 오류/타임아웃이 난 세션은 상태를 믿을 수 없으므로 다음 케이스에서 재사용하지 않음
+                    self._session_fingerprint = None
+                turn_result.setdefault('shared_by', 1)
+                turn_result['session_id'] = self._session_id or ''
+                turn_result['session_case'] = self._session_case if self._session_id else 0
+                yield turn_result
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self._end_unit_trace(unit, keep=failed)
+    
+    def _run_unit_turns(self, unit: Dict, reset_first: bool, unit_start_time: float) -> Iterator[Dict]:
+        """_run_unit 본체: 세션 리셋/채팅 초기화 후 턴을 실행하고 결과 행을 내보냅니다."""
+        import time as time_module
+        
+        if 'plan' in unit:
+            yield from self._run_prefix_plan(unit, reset_first, unit_start_time)
+            return
+        
+        test_case_id = unit['test_case_id']
+        turns = unit['turns']
+        
+        if test_case_id is None:
+            # 단일 턴 케이스
+            _, row = turns[0]
+            try:
+                if reset_first and self._reuse_session(row):
+                    # Request Fields가 같은 직전 케이스의 채팅 세션에서 새 대화만 시작
+                    self._begin_unit_trace(unit)
+                    print(f"♻️ 세션 재사용: {self._session_id} ({self._session_case}번째 케이스, 새 대화 시작)")
+                else:
+                    # 각 테스트 케이스마다 페이지 리셋 (페이지의 첫 번째 케이스 제외)
+                    self._session_id = None
+                    if reset_first:
+                        with self.step_timer.span('reset_page'):
+                            self.reset_page()
+                    self._begin_unit_trace(unit)
                     
-                    scenario_elapsed = time_module.time() - scenario_start_time
-                    print(f"\n✅ 시나리오 {scenario_num} 완료 (소요: {scenario_elapsed:.1f}초)")
+                    # 각 테스트 케이스마다 채팅 초기화
+                    print("🔧 채팅 초기화 중...")
+                    self._initialize_chat_for_row(row)
+                    print("✅ 채팅 초기화 완료")
+                    self.step_timer.sleep(self.chat_settle_seconds)  # 초기화 후 안정화 대기
+                self.timing_profile.record('unit_setup', (time_module.time() - unit_start_time) * 1000)
+                
+                # 턴 실행 (단일 턴이므로 turn_number는 None)
+                turn_result = self._execute_timed_turn(row, None, None)
+            except Exception as e:
+                # 테스트 케이스 실행 중 오류 발생
+                print(f"테스트 케이스 {unit['index'] + 1} 실행 중 오류: {e}")
+                turn_result = self._build_error_row(row, None, None, e)
+            
+            case_elapsed = time_module.time() - unit_start_time
+            message_display = str(self._get_column_value(row, 'message', ''))[:50]
+            pass_fail = turn_result.get('verdict', turn_result.get('pass/fail', 'FAIL'))
+            print(f"({unit['index'] + 1}) 완료: {message_display}... - {pass_fail} (소요: {case_elapsed:.1f}초)")
+            yield turn_result
+            return
+        
+        # 멀티턴 시나리오: 첫 번째 턴에서만 페이지 리셋 및 초기화
+        # 같은 test_case_id 내에서는 세션 유지 (페이지 리셋 및 초기화 안 함)
+        total_turns_in_scenario = len(turns)
+        for turn_idx, (turn_number, turn_row) in enumerate(turns):
+            turn_num = turn_idx + 1
+            print(f"\n  ┌─ Turn {turn_number} ({turn_num}/{total_turns_in_scenario})")
+            
+            if turn_idx == 0:
+                # 새로운 시나리오 시작 시에만 페이지 리셋
+                self._session_id = None
+                if reset_first:
+                    print("  🔄 새로운 시나리오 시작 - 페이지 리셋")
+                    with self.step_timer.span('reset_page'):
+                        self.reset_page()
+                self._begin_unit_trace(unit)
                 
+                # 채팅 초기화 (첫 번째 턴에서만)
+                print("  🔧 채팅 초기화 중...")
+                self._initialize_chat_for_row(turn_row)
+                print("  ✅ 채팅 초기화 완료")
+                self.step_timer.sleep(self.chat_settle_seconds)
+                self.timing_profile.record('unit_setup', (time_module.time() - unit_start_time) * 1000)
             else:
-                # 기존 방식 (단일 턴)
-                for idx, row in test_cases.iterrows():
-                    case_num = idx + 1
-                    case_start_time = time_module.time()
-                    
-                    # 진행 상황 업데이트
-                    if progress_callback:
-                        elapsed_time = time_module.time() - start_time
-                        if case_num > 1:
-                            avg_time_per_case = elapsed_time / (case_num - 1)
-                            estimated_remaining = avg_time_per_case * (total_cases - case_num)
-                        else:
-                            estimated_remaining = None
-                        
-                        progress_callback(
-                            current=case_num,
-                            total=total_cases,
-                            elapsed_time=elapsed_time,
-                            estimated_remaining=estimated_remaining
-                        )
+                # 같은 시나리오 내의 후속 턴 - 세션 유지, 초기화 없음
+                print(f"  ℹ️ 같은 시나리오 내 후속 턴 - 세션 유지 (초기화 없음)")
+            
+            # 턴 실행 (기존 대화 세션에서 계속)
+            turn_result = self._execute_timed_turn(turn_row, turn_number, test_case_id)
+            verdict = turn_result.get('verdict', turn_result.get('pass/fail', 'FAIL'))
+            print(f"  └─ Turn {turn_number} 완료: {verdict}")
+            yield turn_result
+        
+        scenario_elapsed = time_module.time() - unit_start_time
+        print(f"\n✅ 시나리오 test_case_id={test_case_id} 완료 (소요: {scenario_elapsed:.1f}초)")
+    
+    def _recycle_context(self):
+        """현재 컨텍스트를 닫고 새 컨텍스트/페이지로 base_url에 다시 접속합니다. (쌓인 DOM/캐시 정리)"""
+        self._discard_spare_page()
+        old_context = self.context
+        self._open_page(self._get_proxy_config())
+        if self._pool_slot is not None:
+            # 풀에 반납할 때 새 컨텍스트를 닫도록 슬롯 갱신
+            self._pool_slot = {'context': self.context, 'page': self.page, 'network_capture': self.network_capture,
+                               'resource_blocker': self.resource_blocker}
+        if old_context is not None:
+            try:
+                old_context.close()
+            except Exception:
+                pass
+    
+    def _memory_checkpoint(self, allow_browser_restart: bool):
+        """
+        실행 단위 경계에서 메모리 감시기가 요청한 재생성을 수행합니다.
+        
+        Args:
+            allow_browser_restart: 브라우저 재시작 허용 여부 (브라우저를 다른 워커/풀과 공유하면 False -> 컨텍스트 재생성)
+        """
+        if self.memory_watchdog is None:
+            return
+        action, self._memory_generation = self.memory_watchdog.pending_action(self._memory_generation)
+        if action is None:
+            return
+        if action == ACTION_BROWSER and (not allow_browser_restart or self.browser_pool is not None):
+            # 풀 브라우저는 다른 실행/세션과 공유하므로 재시작하지 않고 빌린 컨텍스트만 재생성
+            action = ACTION_CONTEXT
+        before_mb = self.memory_watchdog.sample()
+        error = None
+        try:
+            with self.step_timer.span('browser_start'):
+                if action == ACTION_BROWSER:
+                    print("🧠 메모리 임계값 초과 - 브라우저 재시작")
+                    self.close_browser()
+                    self.start_browser()
+                    self.memory_watchdog.set_browser_pid(self.browser_pid)
+                else:
+                    print("🧠 메모리 임계값 초과 - 브라우저 컨텍스트 재생성")
+                    self._recycle_context()
+        except Exception as e:
+            error = str(e)
+            raise
+        finally:
+            after_mb = self.memory_watchdog.sample() if error is None else None
+            self.memory_watchdog.record_recycle(action, before_mb, after_mb, threading.current_thread().name, error)
+    
+    def _begin_unit_trace(self, unit: Dict):
+        """현재 컨텍스트에 실행 단위의 트레이스 청크를 시작합니다. (세션 리셋 후 호출)"""
+        if self.failure_tracer is None or self.context is None:
+            return
+        if self.failure_tracer.begin(self.context, title=unit['key']):
+            self._trace_context = self.context
+    
+    def _end_unit_trace(self, unit: Dict, keep: bool):
+        """실행 단위의 트레이스 청크를 끝냅니다. keep이면 저장하고 아니면 버립니다."""
+        context, self._trace_context = self._trace_context, None
+        if context is not None:
+            self.failure_tracer.end(context, unit['key'], keep)
+    
+    def _spawn_worker(self) -> "TestAutomation":
+        """현재 인스턴스와 같은 실행 설정을 가진 워커 인스턴스를 만듭니다."""
+        worker = type(self)(base_url=self.base_url)
+        for attr in self._WORKER_CONFIG_ATTRS:
+            setattr(worker, attr, getattr(self, attr))
+        if worker.memory_watchdog:
+            # 새 워커는 새 컨텍스트로 시작하므로 이미 처리된 재생성 요청은 건너뜀
+            worker._memory_generation = worker.memory_watchdog.generation
+        return worker
+    
+    def _parallel_worker(self, worker_id: int, unit_queue: "queue.Queue", event_queue: "queue.Queue",
+                         stop_event: threading.Event):
+        """
+        병렬 워커 스레드 본체.
+        공유 Chromium에 독립된 컨텍스트로 접속한 뒤, 큐에서 실행 단위를 꺼내 순서대로 실행합니다.
+        큐의 항목은 단위 묶음(리스트)이며, 묶음 안의 단위는 같은 워커가 순서대로 실행합니다.
+        결과는 ('row', unit_index, turn_pos, row) 이벤트로 메인 스레드에 전달합니다.
+        stop_event가 설정되면(결과를 읽는 쪽이 스트림을 닫음) 진행 중인 턴까지만 마치고 종료합니다.
+        """
+        worker = self._spawn_worker()
+        governor = self.governor
+        if worker.memory_watchdog:
+            worker.memory_watchdog.attach_worker(threading.current_thread().name)
+        try:
+            attached = False
+            is_first_unit = True
+            while not stop_event.is_set():
+                # 동시성 조절기가 허용하는 수만큼만 단위를 실행 (남은 단위가 없거나 중지되면 종료)
+                if governor and not governor.acquire_slot(should_stop=lambda: stop_event.is_set() or unit_queue.empty()):
+                    break
+                try:
                     try:
-                        print(f"\n{'='*60}")
-                        print(f"테스트 케이스 {idx + 1}/{len(test_cases)}")
-                        print(f"{'='*60}")
-                        
-                        # 각 테스트 케이스마다 페이지 리셋 (첫 번째 케이스 제외)
-                        if idx > 0:
-                            self.reset_page()
-                        
-                        # 각 테스트 케이스마다 채팅 초기화
-                        print("🔧 채팅 초기화 중...")
-                        self._initialize_chat_for_row(row)
-                        print("✅ 채팅 초기화 완료")
-                        time.sleep(2)  # 초기화 후 안정화 대기
-                        
-                        # 턴 실행 (단일 턴이므로 turn_number는 None)
-                        turn_result = self._execute_turn(row, turn_number=None, test_case_id=None)
-                        results.append(turn_result)
-                        
-                        case_elapsed = time_module.time() - case_start_time
-                        message_display = str(self._get_column_value(row, 'message', ''))[:50]
-                        pass_fail = turn_result.get('verdict', turn_result.get('pass/fail', 'FAIL'))
-                        print(f"({case_num}/{total_cases}) 완료: {message_display}... - {pass_fail} (소요: {case_elapsed:.1f}초)")
+                        bundle = unit_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    
+                    # 브라우저 컨텍스트는 실제로 실행할 단위가 생겼을 때 연결
+                    if not attached:
+                        try:
+                            with worker.step_timer.span('browser_start'):
+                                worker.attach_browser(self.cdp_endpoint)
+                        except Exception:
+                            unit_queue.put(bundle)
+                            raise
+                        attached = True
+                    
+                    # 묶음의 단위는 같은 워커에서 연속 실행 (세션 재사용)
+                    for unit in bundle:
+                        if stop_event.is_set():
+                            break
+                        if not is_first_unit:
+                            worker._memory_checkpoint(allow_browser_restart=False)
                         
-                        # 최종 진행 상황 업데이트
-                        if progress_callback:
-                            elapsed_time = time_module.time() - start_time
-                            if case_num < total_cases:
-                                avg_time_per_case = elapsed_time / case_num
-                                estimated_remaining = avg_time_per_case * (total_cases - case_num)
+                        print(f"\n[워커 {worker_id}] 단위 {unit['index'] + 1} 시작 (test_case_id={unit['test_case_id']}, {len(unit['turns'])}턴)")
+                        unit_start = time.time()
+                        try:
+                            unit_rows = worker._run_unit(unit, reset_first=not is_first_unit)
+                            for turn_pos, turn_result in enumerate(unit_rows):
+                                event_queue.put(('row', unit['index'], turn_pos, turn_result))
+                                if stop_event.is_set():
+                                    # 남은 턴은 보내지 않음 (트레이스 정리를 위해 단위 제너레이터를 닫음)
+                                    unit_rows.close()
+                                    break
                             else:
-                                estimated_remaining = 0
-                            
-                            progress_callback(
-                                current=case_num,
-                                total=total_cases,
-                                elapsed_time=elapsed_time,
-                                estimated_remaining=estimated_remaining
-                            )
-                        
-                    except Exception as e:
-                        # 테스트 케이스 실행 중 오류 발생
-                        print(f"테스트 케이스 {idx+1} 실행 중 오류: {e}")
-                        
-                        # is_driving 값 처리
-                        is_driving_value = self._get_column_value(row, 'is_driving', False)
-                        if isinstance(is_driving_value, str):
-                            is_driving_value = is_driving_value.upper() == 'TRUE'
-                        elif isinstance(is_driving_value, (int, float)):
-                            is_driving_value = bool(is_driving_value)
-                        else:
-                            is_driving_value = bool(is_driving_value)
-                        
-                        result_row = {
-                            'test_case_id': '',
-                            'turn_number': '',
-                            'user_id': str(self._get_column_value(row, 'user_id', '')),
-                            'lng': self._get_column_value(row, 'lng', ''),
-                            'lat': self._get_column_value(row, 'lat', ''),
-                            'is_driving': is_driving_value,
-                            'message': str(self._get_column_value(row, 'message', '')),
-                            'tts_expected': str(self._get_column_value(row, 'tts_expected', '')),
-                            'latency': None,
-                            'latency_text': '',
-                            'response_structured': '',
-                            'raw_json': '',
-                            'tts_actual': '',
-                            'action_name': '',
-                            'action_data': '',
-                            'next_step': '',
-                            'verdict': 'FAIL',
-                            'pass/fail': 'FAIL',  # 하위 호환성
-                            'similarity_score': 0.0,
-                            'fail_reason': f'테스트 실행 오류: {str(e)}',
-                            'scores': json_module.dumps({'tts': 0.0, 'action_name': 0.0, 'action_data': 0.0, 'next_step': 0.0})
-                        }
-                        results.append(result_row)
+                                event_queue.put(('unit_done', unit['index'], None, (time.time() - unit_start) * 1000))
+                        except Exception as e:
+                            print(f"⚠️ [워커 {worker_id}] 단위 {unit['index'] + 1} 실행 중 오류: {e}")
+                            event_queue.put(('unit_error', unit['index'], None, e))
+                        is_first_unit = False
+                finally:
+                    if governor:
+                        governor.release_slot()
+        except Exception as e:
+            print(f"❌ [워커 {worker_id}] 중단: {e}")
+            event_queue.put(('worker_error', worker_id, None, e))
+        finally:
+            if worker.memory_watchdog:
+                worker.memory_watchdog.detach_worker(threading.current_thread().name)
+            try:
+                worker.close_browser()
+            except Exception:
+                pass
+            event_queue.put(('done', worker_id, None, None))
+    
+    def _iter_units_parallel(self, units: List[Dict], workers: int, bundle_key=None) -> Iterator[tuple]:
+        """
+        실행 단위를 N개의 독립 브라우저 컨텍스트(같은 Chromium)에 나눠 실행하고, 턴 결과가 도착하는 대로 내보냅니다.
+        워커는 공유 큐에서 다음 단위를 가져가므로 먼저 끝난 워커가 남은 단위를 이어서 실행합니다.
+        
+        Args:
+            units: 실행 단위 리스트
+            workers: 워커(컨텍스트) 수
+            bundle_key: unit -> 묶음 키. 키가 같은 단위는 한 큐 항목으로 묶어 같은 워커가 연속 실행 (세션 재사용, 기본값: 묶지 않음)
+        
+        Yields:
+            (unit, turn_pos, row) 튜플 (완료 순서)
+        
+        결과를 읽는 쪽이 중간에 제너레이터를 닫으면 워커에 중지를 알리고 진행 중인 턴이 끝날 때까지 기다립니다.
+        (남은 단위를 아무도 읽지 않는 채로 에이전트에 계속 보내지 않도록)
+        """
+        bundles: Dict = {}
+        for unit in units:
+            bundles.setdefault(bundle_key(unit) if bundle_key else unit['index'], []).append(unit)
+        unit_queue = queue.Queue()
+        for bundle in bundles.values():
+            unit_queue.put(bundle)
+        event_queue = queue.Queue()
+        stop_event = threading.Event()
+        
+        threads = []
+        for worker_id in range(1, workers + 1):
+            thread = threading.Thread(
+                target=self._parallel_worker,
+                args=(worker_id, unit_queue, event_queue, stop_event),
+                name=f"naviqa-worker-{worker_id}",
+                daemon=True,
+            )
+            thread.start()
+            threads.append(thread)
+        
+        units_by_index = {unit['index']: unit for unit in units}
+        received: Dict[int, set] = {}
+        unit_errors: Dict[int, Exception] = {}
+        worker_errors = []
+        remaining_workers = len(threads)
+        try:
+            while remaining_workers > 0:
+                kind, key, turn_pos, payload = event_queue.get()
+                if kind == 'row':
+                    received.setdefault(key, set()).add(turn_pos)
+                    yield units_by_index[key], turn_pos, payload
+                elif kind == 'unit_done':
+                    self._unit_durations[key] = payload
+                elif kind == 'unit_error':
+                    unit_errors[key] = payload
+                elif kind == 'worker_error':
+                    worker_errors.append(payload)
+                elif kind == 'done':
+                    remaining_workers -= 1
+        finally:
+            # 정상 종료면 이미 모두 끝난 상태이고, 중간에 닫혔으면(GeneratorExit) 워커를 멈추고 합류
+            stop_event.set()
+            for thread in threads:
+                thread.join()
+        
+        # 모든 워커가 접속에 실패했다면 첫 번째 오류(ConnectionError 등)를 그대로 전파
+        if not received and worker_errors and len(worker_errors) == len(threads):
+            raise worker_errors[0]
+        
+        # 중단된 워커 때문에 비어 있는 턴은 FAIL 행으로 채움
+        fallback_error = worker_errors[0] if worker_errors else Exception("워커가 단위를 완료하지 못함")
+        for unit in units:
+            done_turns = received.get(unit['index'], set())
+            for turn_pos, (turn_number, turn_row) in enumerate(unit['turns']):
+                if turn_pos not in done_turns:
+                    error = unit_errors.get(unit['index'], fallback_error)
+                    yield unit, turn_pos, self._build_error_row(turn_row, turn_number, unit['test_case_id'], error)
+    
+    def _iter_units_sequential(self, units: List[Dict], first_reset: bool = False) -> Iterator[tuple]:
+        """
+        실행 단위를 현재 페이지에서 순서대로 실행하고 턴 결과를 내보냅니다.
+        
+        Args:
+            units: 실행 단위 리스트
+            first_reset: 첫 단위 실행 전에도 세션을 리셋할지 여부
         
+        Yields:
+            (unit, turn_pos, row) 튜플
+        """
+        is_multi_turn = bool(units) and units[0]['test_case_id'] is not None
+        worker_name = threading.current_thread().name
+        if self.memory_watchdog:
+            self.memory_watchdog.attach_worker(worker_name)
+        try:
+            for position, unit in enumerate(units):
+                print(f"\n{'='*60}")
+                if is_multi_turn:
+                    print(f"시나리오 {unit['index'] + 1}: test_case_id={unit['test_case_id']} ({len(unit['turns'])}턴)")
+                else:
+                    print(f"테스트 케이스 {unit['index'] + 1}")
+                print(f"{'='*60}")
+                
+                if first_reset or position > 0:
+                    self._memory_checkpoint(allow_browser_restart=self.browser_pool is None)
+                
+                unit_start = time.time()
+                for turn_pos, turn_result in enumerate(self._run_unit(unit, reset_first=first_reset or position > 0)):
+                    yield unit, turn_pos, turn_result
+                self._unit_durations[unit['index']] = (time.time() - unit_start) * 1000
         finally:
-            self.close_browser()
+            if self.memory_watchdog:
+                self.memory_watchdog.detach_worker(worker_name)
+    
+    def iter_results(self, test_cases: pd.DataFrame, workers: int = 1, run_id: Optional[str] = None,
+                     resume: bool = False, progress_callback=None) -> Iterator[Dict]:
+        """
+        테스트 케이스를 실행하면서 턴 결과 행을 완료되는 대로 하나씩 내보냅니다.
+        결과를 저장소/대시보드로 바로 흘려보낼 때 사용하며, 전체 결과를 메모리에 모으지 않습니다.
+        
+        행의 순서는 완료 순서입니다(병렬 실행 시 원래 순서와 다를 수 있음). 재개(resume) 시 저널에서 불러온 행이 먼저 나오고,
+        재시도 레인에서 다시 실행된 단위의 행(attempt > 1)은 같은 test_case_id/turn_number의 이전 행을 대체합니다.
         
+        Args:
+            test_cases: 테스트 케이스가 담긴 DataFrame
+            workers: 병렬 브라우저 컨텍스트 수
+            run_id: 저널 실행 ID (기본값: 스위트 해시-시작 시각. resume이면 같은 스위트의 가장 최근 저널)
+            resume: 저널에 완료된 단위는 다시 실행하지 않음
+            progress_callback: 진행 상황 콜백 함수 (current, total, elapsed_time, estimated_remaining)
+        
+        Yields:
+            턴 결과 행 딕셔너리
+        """
+        for _unit, _turn_pos, row in self._iter_result_events(test_cases, workers, run_id, resume, progress_callback):
+            yield row
+    
+    def run_tests(self, test_cases: pd.DataFrame, progress_callback=None, workers: int = 1,
+                  run_id: Optional[str] = None, resume: bool = False) -> pd.DataFrame:
+        """
+        모든 테스트 케이스를 실행합니다. (iter_results의 결과를 원래 순서로 모은 DataFrame)
+        멀티턴 시나리오를 지원합니다 (test_case_id + turn_number).
+        완료된 턴은 실행 ID별 저널(result_journal.ResultJournal)에 즉시 기록됩니다.
+        
+        Args:
+            test_cases: 테스트 케이스가 담긴 DataFrame
+            progress_callback: 진행 상황 콜백 함수 (current, total, elapsed_time, estimated_remaining)
+            workers: 병렬 브라우저 컨텍스트 수. 2 이상이면 하나의 Chromium 안에서
+                시나리오(또는 단일 턴 행)를 컨텍스트별로 나눠 실행하고 원래 순서로 결과를 합칩니다.
+            run_id: 저널 실행 ID (기본값: 스위트 내용과 base_url의 해시-시작 시각. resume이면 같은 스위트의 가장 최근 저널)
+            resume: True이면 저널에 모든 턴이 기록된 시나리오는 다시 실행하지 않고 기록된 결과를 사용합니다.
+                일부 턴만 기록된 멀티턴 시나리오는 대화 세션을 이어갈 수 없으므로 처음부터 다시 실행합니다.
+        
+        Returns:
+            결과가 포함된 DataFrame
+        """
+        unit_rows: Dict[int, Dict[int, Dict]] = {}
+        for unit, turn_pos, row in self._iter_result_events(test_cases, workers, run_id, resume, progress_callback):
+            # 재시도 결과는 같은 턴의 이전 결과를 대체
+            unit_rows.setdefault(unit['index'], {})[turn_pos] = row
+        
+        # 원래 순서로 결과 병합
+        results = []
+        for unit_index in sorted(unit_rows):
+            rows = unit_rows[unit_index]
+            results.extend(rows[turn_pos] for turn_pos in sorted(rows))
         return pd.DataFrame(results)
-
+    
+    def _iter_result_events(self, test_cases: pd.DataFrame, workers: int = 1, run_id: Optional[str] = None,
+                            resume: bool = False, progress_callback=None) -> Iterator[tuple]:
+        """
+        iter_results/run_tests의 공통 실행 루프.
+        저널 재개 -> 메인 레인 실행 -> 재시도 레인 순서로 진행하며 (unit, turn_pos, row)를 완료되는 대로 내보냅니다.
+        생성기가 끝나거나 중간에 닫히면 브라우저를 종료하고 타이밍 프로필/실행 리포트를 정리합니다.
+        """
+        import time as time_module
+        
+        units = self._build_units(test_cases)
+        is_multi_turn = bool(units) and units[0]['test_case_id'] is not None
+        total_turns = sum(len(unit['turns']) for unit in units)
+        
+        # 결과 저널 열기 (재개 시 완료된 단위의 결과를 불러옴)
+        self.run_report = {}
+        resumed_rows: Dict[int, Dict[int, Dict]] = {}
+        journal = None
+        if self.journal_enabled:
+            current_suite_hash = suite_hash(test_cases, self.base_url)
+            if run_id is None:
+                # 실행마다 새 실행 ID를 쓰고, 재개 시에는 같은 스위트의 가장 최근 저널을 이어서 사용
+                run_id = (latest_run_id(current_suite_hash) if resume else None) or new_run_id(current_suite_hash)
+            journal = ResultJournal(run_id)
+            recorded = journal.open({'suite_hash': current_suite_hash, 'base_url': self.base_url}, resume=resume)
+            for unit in units:
+                rows = recorded.get(unit['key'], {})
+                if len(rows) == len(unit['turns']):
+                    resumed_rows[unit['index']] = rows
+            self.run_report['run_id'] = journal.run_id
+            self.run_report['journal_path'] = journal.path
+            print(f"📝 결과 저널: {journal.path} (실행 ID: {journal.run_id})")
+        pending_units = [unit for unit in units if unit['index'] not in resumed_rows]
+        if self.failure_tracer:
+            self.failure_tracer.start_run(self.run_report.get('run_id') or suite_hash(test_cases, self.base_url))
+        resumed_turns = total_turns - sum(len(unit['turns']) for unit in pending_units)
+        self.run_report['resumed_units'] = len(resumed_rows)
+        if resumed_turns:
+            print(f"⏩ 저널에서 재개: 완료된 {len(resumed_rows)}개 단위({resumed_turns}개 턴) 건너뜀")
+        
+        workers = max(1, min(int(workers or 1), len(pending_units) or 1))
+        if self.throttle_requests:
+            self.governor = ConcurrencyGovernor(max_workers=workers, rps=default_rps_for(self.target_url))
+        else:
+            self.governor = ConcurrencyGovernor(max_workers=workers, rps=None, adaptive=False)
+        if self.governor.rps or self.governor.adaptive:
+            print(f"🎛️ 동시성 조절: 초당 요청 상한 {self.governor.rps or '없음'}, "
+                  f"워커 {self.governor.limit}/{workers}개로 시작 (AIMD {'사용' if self.governor.adaptive else '미사용'})")
+        
+        if is_multi_turn:
+            print(f"📊 멀티턴 시나리오 테스트 시작: 총 {len(units)}개 시나리오, {total_turns}개 턴 (워커 {workers}개)")
+        else:
+            print(f"📊 단일 턴 테스트 시작: 총 {total_turns}개 케이스 (워커 {workers}개)")
+        
+        start_time = time_module.time()
+        self.step_timer.reset()
+        completed = {'turns': resumed_turns}
+        blocker_stats_before = self.resource_blocker.stats() if self.resource_blocker else None
+        
+        session_usage = {'sessions': set(), 'reused_cases': 0}
+        
+        def record_row(unit, turn_pos, row, attempt):
+            row['attempt'] = attempt
+            row['failure_class'] = classify_failure(row) or ''
+            if row.get('session_id'):
+                session_usage['sessions'].add(row['session_id'])
+                if row.get('session_case', 0) > 1:
+                    session_usage['reused_cases'] += 1
+            if journal:
+                journal.append(unit['key'], turn_pos, row)
+        
+        def report_progress():
+            completed['turns'] += 1
+            if progress_callback:
+                elapsed_time = time_module.time() - start_time
+                done = completed['turns']
+                done_this_run = done - resumed_turns
+                if done < total_turns:
+                    estimated_remaining = elapsed_time / done_this_run * (total_turns - done)
+                else:
+                    estimated_remaining = 0
+                progress_callback(
+                    current=done,
+                    total=total_turns,
+                    elapsed_time=elapsed_time,
+                    estimated_remaining=estimated_remaining
+                )
+        
+        try:
+            for unit in units:
+                for turn_pos in sorted(resumed_rows.get(unit['index'], {})):
+                    yield unit, turn_pos, resumed_rows[unit['index']][turn_pos]
+            resumed_rows.clear()
+            
+            if pending_units:
+                with self.step_timer.span('browser_start'):
+                    self.start_browser(remote_debugging=workers > 1)
+                if self.memory_watchdog:
+                    self.memory_watchdog.start(self.browser_pid)
+                print("✅ 브라우저 준비 완료, 테스트 시작")
+                
+                message_of = lambda row: str(self._get_column_value(row, 'message', ''))
+                execution_units = pending_units
+                if is_multi_turn and self.prefix_sharing and self.supports_conversation_fork:
+                    # 앞부분이 같은 시나리오를 prefix 공유 단위로 묶음 (결과 행은 원래 시나리오 단위로 되돌려 기록)
+                    execution_units = build_prefix_units(pending_units, self._session_key, message_of)
+                    sharing = sharing_report(execution_units)
+                    self.run_report['prefix_sharing'] = sharing
+                    if sharing['groups']:
+                        print(f"🌳 prefix 공유: 시나리오 {sharing['scenarios']}개를 {sharing['groups']}개 공유 단위로 실행 "
+                              f"(턴 {sharing['turns']}개 중 {sharing['saved_turns']}개 전송 생략)")
+                
+                # 단위별 소요 시간 추정 및 배정 순서 결정 (병렬 실행에서만 순서를 바꿈). 공유 단위는 실제 전송하는 턴으로 추정
+                estimates = {
+                    unit['index']: estimate_unit_ms({'turns': unit.get('send_turns', unit['turns'])}, self.timing_profile, message_of)
+                    for unit in execution_units
+                }
+                schedule_policy = self.schedule_policy if workers > 1 else 'fifo'
+                if schedule_policy == 'lpt':
+                    execution_units = order_longest_first(execution_units, estimates)
+                session_bundle_key = None
+                if self.session_reuse and not is_multi_turn:
+                    # Request Fields가 같은 단일 턴 케이스를 연속 배치해 채팅 세션을 재사용 (결과는 원래 순서로 합쳐짐)
+                    # 병렬 실행에서는 같은 키의 단위를 한 큐 항목으로 묶어 한 워커에서 연속 실행
+                    session_bundle_key = lambda unit: self._session_key(unit['turns'][0][1])
+                    execution_units = group_by_key(execution_units, session_bundle_key)
+                self._unit_durations = {}
+                main_lane_start = time_module.time()
+                
+                if workers > 1:
+                    # 연결 확인용 페이지는 더 이상 필요 없으므로 닫고 워커 컨텍스트만 유지
+                    try:
+                        self.context.close()
+                    except Exception:
+                        pass
+                    unit_events = self._iter_units_parallel(execution_units, workers, session_bundle_key)
+                else:
+                    unit_events = self._iter_units_sequential(execution_units)
+                events = self._expand_shared_events(unit_events)
+                
+                # 재시도 판단에는 인프라 오류가 난 단위 번호와 사유만 보관 (결과 행은 보관하지 않음)
+                infra_units: Dict[int, List[str]] = {}
+                try:
+                    for unit, turn_pos, row in events:
+                        record_row(unit, turn_pos, row, attempt=1)
+                        if row['failure_class'] == 'infra':
+                            infra_units.setdefault(unit['index'], []).append(row.get('turn_error') or row.get('fail_reason', ''))
+                        report_progress()
+                        yield unit, turn_pos, row
+                finally:
+                    # 결과 스트림이 중간에 닫히면 브라우저를 닫기 전에 워커부터 멈춤
+                    events.close()
+                    unit_events.close()
+                
+                makespan = makespan_report(self._unit_durations, estimates, workers,
+                                           (time_module.time() - main_lane_start) * 1000, schedule_policy)
+                self.run_report['makespan'] = makespan
+                print(f"📐 makespan ({schedule_policy}): 실제 {makespan['achieved_ms'] / 1000:.1f}초, "
+                      f"이상 {makespan['ideal_ms'] / 1000:.1f}초 (효율 {makespan['efficiency']}), "
+                      f"추정 {makespan['estimated_ms'] / 1000:.1f}초")
+                
+                for unit, turn_pos, row in self._iter_retry_lane(pending_units, infra_units, workers, record_row):
+                    yield unit, turn_pos, row
+        
+        finally:
+            if journal:
+                journal.close()
+            if self.memory_watchdog and pending_units:
+                self.memory_watchdog.stop()
+                memory = self.memory_watchdog.report()
+                self.run_report['memory'] = memory
+                if memory['metric']:
+                    print(f"🧠 Chromium 메모리 최대 {memory['peak_mb']:.0f}MB ({memory['metric']}), 재생성 {len(memory['recycles'])}회")
+            if pending_units:
+                self.close_browser()
+            # 이번 실행의 단계별 소요 시간을 저장 (다음 실행의 타임아웃 산출에 사용)
+            self.timing_profile.save()
+            print(f"⏱️ 타이밍 프로필 ({self.timing_profile.preset}): {self.timing_profile.summary()}")
+            self.run_report['selector_resolution'] = self.selector_resolver.stats()
+            step_timing = self.step_timer.report((time_module.time() - start_time) * 1000)
+            self.run_report['step_timing'] = step_timing
+            if step_timing['phases']:
+                print(f"⏱️ 단계별 소요 시간 (전체 {step_timing['wall_ms'] / 1000:.1f}초, 측정 합계 {step_timing['measured_ms'] / 1000:.1f}초, "
+                      f"고정 대기 {step_timing['sleep_ms'] / 1000:.1f}초, 응답 대기 {step_timing['wait_response_ms'] / 1000:.1f}초)\n"
+                      f"{StepTimer.format_report(step_timing)}")
+            self.run_report['governor'] = self.governor.report()
+            # 실제로 동시에 실행된 단위 수 (순차 실행은 슬롯을 쓰지 않으므로 1)
+            self.run_report['effective_workers'] = (self.run_report['governor']['peak_active_workers'] or 1) if units else 0
+            if self.session_reuse and not is_multi_turn:
+                self.run_report['session_reuse'] = {
+                    'sessions': len(session_usage['sessions']),
+                    'reused_cases': session_usage['reused_cases'],
+                }
+                print(f"♻️ 세션 재사용: 채팅 세션 {len(session_usage['sessions'])}개, "
+                      f"새 대화로 실행한 케이스 {session_usage['reused_cases']}개")
+            if self.failure_tracer:
+                traces = self.failure_tracer.stats()
+                self.run_report['failure_traces'] = traces
+                if traces['saved'] or traces['dropped_over_budget']:
+                    print(f"🎞️ 실패 트레이스: {len(traces['saved'])}개 저장 ({traces['saved_bytes'] / 1024 / 1024:.1f}MB, {traces['directory']}), "
+                          f"용량 초과로 {traces['dropped_over_budget']}개 미저장, 통과 단위 {traces['discarded']}개 폐기")
+            if self.response_archive is not None:
+                archive_stats = self.response_archive.stats()
+                self.run_report['response_archive'] = {'mode': self.archive_mode, **archive_stats}
+                print(f"🗄️ 응답 아카이브 ({self.archive_mode}): 기록 {archive_stats['stored']}개, "
+                      f"재생 {archive_stats['hits']}개, 없음 {archive_stats['misses']}개 ({archive_stats['directory']})")
+            if self.resource_blocker:
+                blocking = self._resource_blocking_report(blocker_stats_before)
+                self.run_report['resource_blocking'] = blocking
+                print(f"🚫 리소스 차단: {blocking['blocked_requests']}개 요청 {blocking['blocked_by_type']}, "
+                      f"절감 추정치 약 {blocking['estimated_bytes_saved'] / 1024:.0f}KB (유형별 고정 크기 기준, 실측 아님)")
+    
+    @staticmethod
+    def _expand_shared_events(events: Iterator[tuple]) -> Iterator[tuple]:
+        """prefix 공유 단위의 결과를 원래 시나리오 단위와 턴 위치로 되돌립니다. (저널, 재시도, 결과 병합은 원래 단위 기준)"""
+        for unit, turn_pos, row in events:
+            if 'members' in unit:
+                member, member_turn_pos = unit['members'][turn_pos]
+                row['test_case_id'] = member['test_case_id']
+                yield member, member_turn_pos, row
+            else:
+                yield unit, turn_pos, row
+    
+    def _iter_retry_lane(self, units: List[Dict], infra_units: Dict[int, List[str]], workers: int,
+                         record_row) -> Iterator[tuple]:
+        """
+        인프라 오류로 FAIL한 실행 단위를 별도 재시도 레인에서 다시 실행하고 새 결과를 내보냅니다.
+        멀티턴은 시나리오 전체를 다시 실행하며, 재시도 예산과 단위당 최대 실행 횟수를 넘지 않습니다.
+        모든 시도는 run_report['retry_attempts']에 기록되고, 마지막 시도의 결과가 최종 결과가 됩니다.
+        
+        Args:
+            units: 이번 실행에서 실행한 단위 리스트
+            infra_units: {단위 index: 인프라 오류 사유 리스트}
+            workers: 메인 레인의 워커 수 (2 이상이면 재시도도 새 워커 컨텍스트에서 실행)
+            record_row: record_row(unit, turn_pos, row, attempt) - 결과 행 분류 및 저널 기록
+        
+        Yields:
+            (unit, turn_pos, row) 튜플 (row['attempt'] > 1)
+        """
+        policy = self.retry_policy
+        budget = policy.budget(len(units))
+        attempt_log = self.run_report.setdefault('retry_attempts', [])
+        candidates = [unit for unit in units if unit['index'] in infra_units]
+        if candidates:
+            print(f"\n🔁 인프라 오류 단위 {len(candidates)}개 발견 (재시도 예산 {budget}, 단위당 최대 {policy.max_attempts}회 실행)")
+        # 단위별 마지막 시도의 인프라 오류 사유
+        infra_reasons = {unit['index']: list(infra_units[unit['index']]) for unit in candidates}
+        
+        attempt = 1
+        while candidates and budget > 0 and attempt < policy.max_attempts:
+            attempt += 1
+            batch = candidates[:budget]
+            budget -= len(batch)
+            skipped = len(candidates) - len(batch)
+            print(f"🔁 재시도 레인 {attempt}차 시도: {len(batch)}개 단위" + (f" (예산 초과로 {skipped}개 제외)" if skipped else ""))
+            for unit in batch:
+                attempt_log.append({'unit_key': unit['key'], 'attempt': attempt - 1, 'fail_reasons': infra_reasons[unit['index']]})
+                infra_reasons[unit['index']] = []
+            
+            if workers > 1:
+                events = self._iter_units_parallel(batch, min(workers, len(batch)))
+            else:
+                events = self._iter_units_sequential(batch, first_reset=True)
+            
+            still_failing = set()
+            try:
+                for unit, turn_pos, row in events:
+                    record_row(unit, turn_pos, row, attempt=attempt)
+                    if row['failure_class'] == 'infra':
+                        still_failing.add(unit['index'])
+                        infra_reasons[unit['index']].append(row.get('turn_error') or row.get('fail_reason', ''))
+                    yield unit, turn_pos, row
+            except Exception as e:
+                print(f"⚠️ 재시도 레인 중단 (이전 결과 유지): {e}")
+                break
+            finally:
+                events.close()
+            candidates = [unit for unit in batch if unit['index'] in still_failing]
+        
+        # 최종적으로 남은 인프라 오류도 기록
+        for unit in candidates:
+            attempt_log.append({'unit_key': unit['key'], 'attempt': attempt, 'fail_reasons': infra_reasons[unit['index']]})
+        if attempt_log:
+            recovered = len({entry['unit_key'] for entry in attempt_log}) - len(candidates)
+            print(f"🔁 재시도 결과: {recovered}개 단위 복구, {len(candidates)}개 단위 인프라 오류 유지")
+    
+    def _resource_blocking_report(self, before: Dict) -> Dict:
+        """
+        이번 실행 동안의 리소스 차단 통계를 계산합니다.
+        
+        Args:
+            before: 실행 시작 시점의 ResourceBlocker.stats()
+        
+        Returns:
+            blocked_requests, allowed_requests, stubbed_requests, blocked_by_type (실측 요청 수),
+            estimated_bytes_saved, estimate_bytes_by_type (차단 요청 수 x 유형별 고정 크기로 계산한 추정치와 그 기준)
+        """
+        after = self.resource_blocker.stats()
+        report = {
+            key: after[key] - before[key]
+            for key in ('blocked_requests', 'allowed_requests', 'stubbed_requests', 'estimated_bytes_saved')
+        }
+        report['blocked_by_type'] = {
+            resource_type: count - before['blocked_by_type'].get(resource_type, 0)
+            for resource_type, count in after['blocked_by_type'].items()
+            if count - before['blocked_by_type'].get(resource_type, 0) > 0
+        }
+        # 차단한 요청은 응답을 받지 않아 실제 크기를 알 수 없으므로 추정 기준을 함께 기록
+        report['estimate_bytes_by_type'] = {
+            resource_type: ESTIMATED_BYTES_BY_TYPE.get(resource_type, DEFAULT_ESTIMATED_BYTES)
+            for resource_type in report['blocked_by_type']
+        }
+        return report
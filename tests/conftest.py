@@ -0,0 +1,52 @@
+"""
+공용 pytest fixture
+저장소 루트 모듈을 import할 수 있게 경로를 추가하고, 저널/타이밍 프로필을 테스트별 임시 디렉터리에 기록합니다.
+"""
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import result_journal  # noqa: E402
+import timing_profile  # noqa: E402
+from mock_agent_server import MockAgentHandler, start_mock_agent_server  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def isolated_state(tmp_path, monkeypatch):
+    """저널과 타이밍 프로필이 실제 /tmp/naviqa 대신 테스트 임시 디렉터리를 쓰도록 합니다."""
+    monkeypatch.setattr(result_journal, 'DEFAULT_JOURNAL_DIR', str(tmp_path / 'journal'))
+    monkeypatch.setattr(timing_profile, 'DEFAULT_PROFILE_PATH', str(tmp_path / 'timing_profile.json'))
+
+
+@pytest.fixture
+def agent_url():
+    """모의 에이전트 서버를 띄우고 채팅 URL을 반환합니다. (세션 기록은 테스트마다 초기화)"""
+    with MockAgentHandler.sessions_lock:
+        MockAgentHandler.sessions.clear()
+    server, chat_url = start_mock_agent_server()
+    yield chat_url
+    server.shutdown()
+    server.server_close()
+
+
+def make_multi_turn_suite(scenarios):
+    """
+    (test_case_id, [메시지, ...], user_id) 목록으로 멀티턴 스위트 DataFrame을 만듭니다.
+    """
+    rows = []
+    for test_case_id, messages, user_id in scenarios:
+        for turn_number, message in enumerate(messages, 1):
+            rows.append({
+                'test_case_id': test_case_id,
+                'turn_number': turn_number,
+                'message': message,
+                'user_id': user_id,
+                'lat': 37.5,
+                'lng': 127.0,
+                'is_driving': True,
+            })
+    return pd.DataFrame(rows)
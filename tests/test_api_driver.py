@@ -0,0 +1,51 @@
+"""
+직접 API 호출 드라이버의 HTTP 세션 설정과 모의 에이전트 서버 응답 평가를 검증합니다.
+"""
+import warnings
+
+import pandas as pd
+
+from api_driver import ApiTestAutomation
+
+
+def test_tls_verification_on_by_default(agent_url, monkeypatch):
+    monkeypatch.delenv('NAVIQA_API_INSECURE', raising=False)
+    filters_before = list(warnings.filters)
+    automation = ApiTestAutomation(api_url=agent_url)
+
+    automation.start_browser()
+    try:
+        assert automation.session.verify is True
+        assert warnings.filters == filters_before
+    finally:
+        automation.close_browser()
+
+
+def test_insecure_is_opt_in_and_passed_to_workers(agent_url, monkeypatch):
+    monkeypatch.setenv('NAVIQA_API_INSECURE', 'true')
+    automation = ApiTestAutomation(api_url=agent_url)
+    worker = automation._spawn_worker()
+
+    worker.start_browser()
+    try:
+        assert worker.session.verify is False
+    finally:
+        worker.close_browser()
+    assert ApiTestAutomation(api_url=agent_url, insecure=False).verify_tls
+
+
+def test_mock_agent_responses_are_evaluated(agent_url):
+    df = pd.DataFrame({
+        'message': ['강남역 길안내 해줘', '판교 검색해줘'],
+        'user_id': 'u',
+        'lat': 37.5,
+        'lng': 127.0,
+        'is_driving': True,
+        'next_step_expected': ['END', 'END'],
+    })
+
+    results = ApiTestAutomation(api_url=agent_url).run_tests(df)
+
+    assert results['next_step'].tolist() == ['END', 'CONTINUE']
+    assert results['verdict'].tolist() == ['PASS', 'FAIL']
+    assert results['capture_source'].eq('api').all()
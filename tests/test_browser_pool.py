@@ -0,0 +1,64 @@
+"""
+상주 브라우저 풀 슬롯의 리소스 차단기 연결을 가짜 Playwright 컨텍스트로 검증합니다.
+"""
+from browser_pool import BrowserPool
+from resource_blocker import ResourceBlocker
+import test_automation
+
+
+class FakeContext:
+    def __init__(self):
+        self.routes = []
+        self.closed = False
+
+    def route(self, pattern, handler):
+        self.routes.append((pattern, handler))
+
+    def unroute(self, pattern, handler):
+        self.routes = [(p, h) for p, h in self.routes if not (p == pattern and h == handler)]
+
+    def close(self):
+        self.closed = True
+
+
+class FakePage:
+    def wait_for_load_state(self, *args, **kwargs):
+        pass
+
+    def wait_for_selector(self, *args, **kwargs):
+        pass
+
+
+def test_rebind_blocker_swaps_routes():
+    context = FakeContext()
+    warm_blocker, run_blocker = ResourceBlocker(), ResourceBlocker(resource_types=('image',))
+    warm_blocker.attach(context)
+    slot = {'context': context, 'resource_blocker': warm_blocker}
+
+    BrowserPool._rebind_blocker(slot, run_blocker)
+
+    assert slot['resource_blocker'] is run_blocker
+    assert {handler.__self__ for _, handler in context.routes} == {run_blocker}
+    BrowserPool._rebind_blocker(slot, None)
+    assert context.routes == [] and slot['resource_blocker'] is None
+
+
+def test_swapped_spare_keeps_run_blocker_in_pool_slot():
+    automation = test_automation.TestAutomation()
+    automation.reset_mode = 'reload'  # 다음 예비 페이지는 준비하지 않음
+    automation.resource_blocker = ResourceBlocker()
+    old_context, spare_context = FakeContext(), FakeContext()
+    automation.resource_blocker.attach(spare_context)
+    automation.context = old_context
+    automation._pool_slot = {'context': old_context, 'page': FakePage(), 'network_capture': None,
+                             'resource_blocker': automation.resource_blocker}
+    automation._spare = {'context': spare_context, 'page': FakePage(), 'network_capture': None}
+
+    assert automation._swap_in_spare_page()
+
+    slot = automation._pool_slot
+    assert slot['context'] is spare_context and old_context.closed
+    assert slot['resource_blocker'] is automation.resource_blocker
+    # 풀이 다른 실행에 빌려줄 때 이 실행의 차단기를 떼어낼 수 있어야 함
+    BrowserPool._rebind_blocker(slot, None)
+    assert spare_context.routes == []
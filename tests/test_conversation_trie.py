@@ -0,0 +1,57 @@
+from conversation_trie import build_prefix_units, sharing_report
+
+
+def _unit(index, test_case_id, messages, user_id='u'):
+    turns = [(index * 10 + pos, {'message': message, 'user_id': user_id}) for pos, message in enumerate(messages)]
+    return {'index': index, 'key': str(test_case_id), 'test_case_id': test_case_id, 'turns': turns}
+
+
+def _build(units):
+    return build_prefix_units(units, fields_key=lambda row: (row['user_id'],), message_of=lambda row: row['message'])
+
+
+def test_shared_first_turn_groups_scenarios():
+    units = [
+        _unit(0, 'A', ['검색', '길안내']),
+        _unit(1, 'B', ['검색', '취소']),
+        _unit(2, 'C', ['검색', '길안내', '취소']),
+        _unit(3, 'D', ['판교']),
+    ]
+    result = _build(units)
+
+    assert len(result) == 2
+    group, single = result
+    assert single is units[3]
+    assert group['scenarios'] == ['A', 'B', 'C']
+    assert group['index'] == 0
+    # 검색(1회) -> 분기: 길안내(A, C 공유) -> 취소(C) / 취소(B)
+    assert [turn[1]['message'] for turn in group['send_turns']] == ['검색', '길안내', '취소', '취소']
+    assert len(group['turns']) == 7
+    assert group['plan'][0] == ('start', 0)
+    assert ('save', 1) in group['plan']
+    restores = [step for step in group['plan'] if step[0] == 'restore']
+    # 마지막 가지만 저장 상태를 그대로 이어 씀
+    assert [step[2] for step in restores] == [True, False]
+
+
+def test_different_request_fields_are_not_shared():
+    units = [
+        _unit(0, 'A', ['검색', '길안내'], user_id='u1'),
+        _unit(1, 'B', ['검색', '길안내'], user_id='u2'),
+    ]
+    result = _build(units)
+
+    assert result == units
+    assert sharing_report(result)['groups'] == 0
+
+
+def test_sharing_report_counts_saved_turns():
+    units = [
+        _unit(0, 'A', ['검색', '길안내']),
+        _unit(1, 'B', ['검색', '길안내']),
+        _unit(2, 'C', ['검색']),
+        _unit(3, 'D', ['판교']),
+    ]
+    report = sharing_report(_build(units))
+
+    assert report == {'groups': 1, 'scenarios': 3, 'turns': 5, 'sent_turns': 2, 'saved_turns': 3}
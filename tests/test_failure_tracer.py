@@ -0,0 +1,75 @@
+"""
+실패 전용 트레이서의 저장/폐기와 실행당 용량 상한을 가짜 Playwright 컨텍스트로 검증합니다.
+"""
+from failure_tracer import FailureTracer
+import test_automation
+
+
+class FakeTracing:
+    def __init__(self, chunk_bytes):
+        self.chunk_bytes = chunk_bytes
+        self.start_options = None
+
+    def start(self, **options):
+        self.start_options = options
+
+    def start_chunk(self, title=None):
+        pass
+
+    def stop_chunk(self, path=None):
+        if path:
+            with open(path, 'wb') as f:
+                f.write(b'x' * self.chunk_bytes)
+
+
+class FakeContext:
+    def __init__(self, chunk_bytes=1000):
+        self.tracing = FakeTracing(chunk_bytes)
+
+
+def _trace(tracer, context, unit_key, keep):
+    assert tracer.begin(context, unit_key)
+    return tracer.end(context, unit_key, keep)
+
+
+def test_keeps_only_failed_units(tmp_path):
+    tracer = FailureTracer(directory=str(tmp_path))
+    tracer.start_run('run')
+    context = FakeContext()
+
+    assert _trace(tracer, context, 'pass', keep=False) is None
+    path = _trace(tracer, context, 'fail', keep=True)
+
+    stats = tracer.stats()
+    assert [item['path'] for item in stats['saved']] == [path]
+    assert stats['discarded'] == 1
+    assert context.tracing.start_options == {'screenshots': False, 'snapshots': True}
+
+
+def test_byte_cap_stops_saving(tmp_path):
+    tracer = FailureTracer(directory=str(tmp_path), max_bytes=2500)
+    tracer.start_run('run')
+    context = FakeContext(chunk_bytes=1000)
+
+    paths = [_trace(tracer, context, f"unit{i}", keep=True) for i in range(4)]
+
+    assert [path is not None for path in paths] == [True, True, False, False]
+    stats = tracer.stats()
+    assert stats['saved_bytes'] == 2000
+    assert stats['dropped_over_budget'] == 2
+    # 상한을 넘은 트레이스 파일은 지움
+    assert sorted(p.name for p in (tmp_path / 'run').iterdir()) == sorted(p.split('/')[-1] for p in paths[:2])
+
+
+def test_screenshots_are_opt_in(tmp_path):
+    context = FakeContext()
+    _trace(FailureTracer(directory=str(tmp_path), screenshots=True), context, 'unit', keep=False)
+
+    assert context.tracing.start_options['screenshots'] is True
+
+
+def test_tracing_is_off_by_default(monkeypatch):
+    monkeypatch.delenv('NAVIQA_TRACE_FAILURES', raising=False)
+    assert test_automation.TestAutomation().failure_tracer is None
+    monkeypatch.setenv('NAVIQA_TRACE_FAILURES', 'true')
+    assert test_automation.TestAutomation().failure_tracer is not None
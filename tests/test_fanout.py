@@ -0,0 +1,89 @@
+"""
+다중 환경 실행(fanout.py)의 결과 합치기와 기준 환경 처리를 검증합니다.
+"""
+import pandas as pd
+import pytest
+
+from api_driver import ApiTestAutomation
+from fanout import join_environment_results, run_multi_environment
+
+
+def _results(rows):
+    return pd.DataFrame([
+        {'test_case_id': case_id, 'turn_number': turn, 'message': message, 'verdict': verdict, 'latency': latency}
+        for case_id, turn, message, verdict, latency in rows
+    ])
+
+
+def test_join_matches_rows_by_case_not_position():
+    baseline = _results([
+        (1, 1, '검색', 'PASS', 100),
+        (1, 2, '길안내', 'PASS', 200),
+        (2, 1, '취소', 'FAIL', 300),
+    ])
+    # 후보 환경은 행 순서가 다르고 (1, 2) 행이 빠짐
+    candidate = _results([
+        (2, 1, '취소', 'PASS', 330),
+        (1, 1, '검색', 'PASS', 150),
+    ])
+
+    joined = join_environment_results({'cand': candidate, 'base': baseline}, baseline_label='base')
+
+    assert joined['message'].tolist() == ['검색', '길안내', '취소']
+    assert joined['verdict_cand'].isna().tolist() == [False, True, False]
+    assert joined['verdict_cand'][[0, 2]].tolist() == ['PASS', 'PASS']
+    assert joined['latency_delta_cand'].tolist()[0] == 50
+    assert joined['latency_delta_cand'].tolist()[2] == 30
+    assert joined['verdict_changed_cand'].tolist() == [False, True, True]
+
+
+def test_join_single_turn_duplicates_by_occurrence():
+    baseline = pd.DataFrame({'message': ['a', 'b', 'a'], 'verdict': ['PASS', 'PASS', 'FAIL']})
+    candidate = pd.DataFrame({'message': ['b', 'a', 'a'], 'verdict': ['FAIL', 'PASS', 'FAIL']})
+
+    joined = join_environment_results({'base': baseline, 'cand': candidate}, baseline_label='base')
+
+    assert joined['verdict_cand'].tolist() == ['PASS', 'FAIL', 'FAIL']
+
+
+def test_join_requires_baseline():
+    with pytest.raises(ValueError):
+        join_environment_results({'cand': _results([(1, 1, '검색', 'PASS', 1)])}, baseline_label='base')
+
+
+def _suite():
+    return pd.DataFrame({
+        'message': ['취소', '강남역 검색해줘', '뭐야'],
+        'user_id': 'u',
+        'lat': 37.5,
+        'lng': 127.0,
+        'is_driving': True,
+        'next_step_expected': 'END',
+    })
+
+
+def test_run_multi_environment_joins_environments(agent_url):
+    environments = {'dev': 'http://dev.example.test/', 'stg': 'http://stg.example.test/'}
+
+    joined, per_env = run_multi_environment(
+        _suite(), environments, workers=2,
+        automation_factory=lambda base_url: ApiTestAutomation(api_url=agent_url, base_url=base_url),
+        return_per_environment=True,
+    )
+
+    assert set(per_env) == {'dev', 'stg'}
+    assert joined['verdict_dev'].tolist() == ['PASS', 'FAIL', 'PASS']
+    assert not joined['verdict_changed_stg'].any()
+
+
+def test_failed_baseline_is_not_replaced(agent_url):
+    environments = {'dev': 'http://dev.example.test/', 'stg': 'http://stg.example.test/'}
+
+    def factory(base_url):
+        # 기준 환경(dev)은 에이전트 URL이 없어 실행 시작에 실패
+        return ApiTestAutomation(api_url=agent_url if 'stg' in base_url else '', base_url=base_url)
+
+    with pytest.raises(RuntimeError, match='dev'):
+        run_multi_environment(_suite(), environments, automation_factory=factory)
+    with pytest.raises(ValueError):
+        run_multi_environment(_suite(), environments, automation_factory=factory, baseline_label='prod')
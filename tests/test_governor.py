@@ -0,0 +1,91 @@
+"""
+동시성 조절기(토큰 버킷, AIMD)와 대상별 기본 동작을 검증합니다.
+"""
+import time
+
+import pandas as pd
+import pytest
+
+from api_driver import ApiTestAutomation
+from governor import ConcurrencyGovernor, TokenBucket, default_rps_for
+from mock_agent_server import MockAgentHandler
+
+
+@pytest.fixture(autouse=True)
+def no_env_overrides(monkeypatch):
+    monkeypatch.delenv('NAVIQA_MAX_RPS', raising=False)
+    monkeypatch.delenv('NAVIQA_ADAPTIVE_WORKERS', raising=False)
+
+
+def test_default_rps_for_target(monkeypatch):
+    assert default_rps_for('https://navi-agent-adk-api.dev.onkakao.net/streamlit/') == 2.0
+    assert default_rps_for('http://127.0.0.1:8765/chat') is None
+    monkeypatch.setenv('NAVIQA_MAX_RPS', '5')
+    assert default_rps_for('http://127.0.0.1:8765/chat') == 5.0
+    monkeypatch.setenv('NAVIQA_MAX_RPS', '0')
+    assert default_rps_for('https://navi-agent-adk-api.dev.onkakao.net/streamlit/') is None
+
+
+def test_unlimited_target_starts_at_requested_workers():
+    governor = ConcurrencyGovernor(max_workers=8, rps=None)
+
+    assert not governor.adaptive
+    assert governor.limit == 8
+
+
+def test_limited_target_starts_low_with_aimd(monkeypatch):
+    assert ConcurrencyGovernor(max_workers=8, rps=2.0).limit == 2
+    assert ConcurrencyGovernor(max_workers=8, rps=2.0).adaptive
+    monkeypatch.setenv('NAVIQA_ADAPTIVE_WORKERS', 'false')
+    assert ConcurrencyGovernor(max_workers=8, rps=2.0).limit == 8
+
+
+def test_aimd_increases_when_stable_and_halves_on_errors():
+    governor = ConcurrencyGovernor(max_workers=8, rps=100.0, initial_workers=4)
+
+    for _ in range(8):
+        governor.observe(1000, False)
+    assert governor.limit == 5
+
+    for _ in range(10):
+        governor.observe(None, True)
+    assert governor.limit == 2
+    assert [decision['action'] for decision in governor.report()['decisions']] == ['increase', 'decrease']
+
+
+def test_aimd_halves_when_latency_doubles():
+    governor = ConcurrencyGovernor(max_workers=8, rps=100.0, initial_workers=4)
+    for _ in range(8):
+        governor.observe(1000, False)
+    for _ in range(10):
+        governor.observe(2500, False)
+
+    assert governor.limit == 2
+
+
+def test_token_bucket_limits_rate():
+    bucket = TokenBucket(rate=20)
+    start = time.monotonic()
+    for _ in range(5):
+        bucket.acquire()
+
+    # 첫 토큰은 바로, 나머지 4개는 0.05초 간격
+    assert time.monotonic() - start >= 0.19
+
+
+def test_unlimited_target_runs_requested_workers(agent_url, monkeypatch):
+    monkeypatch.setattr(MockAgentHandler, 'latency_ms', 100)
+    df = pd.DataFrame({
+        'message': [f'강남역 검색해줘 {i}' for i in range(12)],
+        'user_id': [f'u{i}' for i in range(12)],
+        'lat': 37.5,
+        'lng': 127.0,
+        'is_driving': True,
+    })
+    automation = ApiTestAutomation(api_url=agent_url)
+    automation.run_tests(df, workers=4)
+
+    report = automation.run_report['governor']
+    assert report['rps_limit'] is None
+    assert report['initial_workers'] == 4
+    assert automation.run_report['effective_workers'] == 4
@@ -0,0 +1,94 @@
+"""
+Chromium 메모리 감시기의 재생성 요청과 상주 브라우저 풀 실행에서의 동작을 검증합니다.
+(Chromium 대신 테스트 프로세스 PID를 감시 대상으로 사용하므로 측정값은 0MB이고, 임계값 0MB로 재생성을 유도)
+"""
+import os
+
+import pandas as pd
+
+from api_driver import ApiTestAutomation
+from memory_watchdog import ACTION_BROWSER, ACTION_CONTEXT, MemoryWatchdog
+from test_automation import TestAutomation as BrowserAutomation
+
+
+class FakePool:
+    """빌려줄 슬롯과 풀 브라우저 PID만 가진 상주 브라우저 풀"""
+
+    browser = None
+    cdp_endpoint = None
+
+    def __init__(self):
+        self.browser_pid = os.getpid()
+        self.released = 0
+
+    def acquire(self, base_url, capture_mode='dom', resource_blocker=None, timing_profile=None):
+        return {'context': None, 'page': None, 'network_capture': None, 'resource_blocker': resource_blocker}
+
+    def release(self, slot, base_url, capture_mode='dom'):
+        self.released += 1
+
+
+class PooledApiAutomation(ApiTestAutomation):
+    """풀에서 페이지를 빌리는 UI 실행처럼 동작하고, 메시지는 모의 에이전트 API로 보내는 테스트용 드라이버"""
+
+    def __init__(self, api_url, pool):
+        super().__init__(api_url=api_url)
+        self.browser_pool = pool
+        self.memory_watchdog = MemoryWatchdog(recycle_mb=0, restart_mb=0, interval_seconds=0.01)
+        self.browser_starts = 0
+        self.context_recycles = 0
+
+    def start_browser(self, remote_debugging=False):
+        self.browser_starts += 1
+        self._lease_from_pool()
+        super().start_browser(remote_debugging)
+
+    def close_browser(self):
+        super().close_browser()
+        BrowserAutomation.close_browser(self)
+
+    def _recycle_context(self):
+        self.context_recycles += 1
+
+
+def test_pooled_run_watches_pool_browser_and_recycles_contexts_only(agent_url, monkeypatch):
+    from mock_agent_server import MockAgentHandler
+    monkeypatch.setattr(MockAgentHandler, 'latency_ms', 50)
+    pool = FakePool()
+    automation = PooledApiAutomation(agent_url, pool)
+    df = pd.DataFrame({
+        'message': [f'강남역 검색해줘 {i}' for i in range(5)],
+        'user_id': [f'u{i}' for i in range(5)],
+        'lat': 37.5,
+        'lng': 127.0,
+        'is_driving': True,
+    })
+
+    automation.run_tests(df)
+
+    memory = automation.run_report['memory']
+    assert memory['samples']
+    assert memory['recycles']
+    # 풀 브라우저는 공유하므로 재시작 요청도 컨텍스트 재생성으로 수행
+    assert {recycle['action'] for recycle in memory['recycles']} == {ACTION_CONTEXT}
+    assert automation.context_recycles == len(memory['recycles'])
+    assert automation.browser_starts == 1
+    assert pool.released == 1
+    assert automation.browser_pid is None
+
+
+def test_request_waits_for_every_worker():
+    watchdog = MemoryWatchdog(recycle_mb=0, restart_mb=0)
+    watchdog.browser_pid = os.getpid()
+    watchdog.attach_worker('w1')
+    watchdog.attach_worker('w2')
+
+    watchdog.sample()
+    assert watchdog.pending_action(0) == (ACTION_BROWSER, 1)
+    watchdog.record_recycle(ACTION_CONTEXT, 0, 0, 'w1')
+    watchdog.sample()
+    assert watchdog.generation == 1
+    watchdog.detach_worker('w2')
+    watchdog.sample()
+    assert watchdog.generation == 2
+
@@ -0,0 +1,84 @@
+"""
+명령줄 실행기(naviqa.py)의 종료 코드와 판정 기준(--max-fail, --min-pass-rate)을 모의 에이전트 서버로 검증합니다.
+"""
+import json
+
+import pandas as pd
+import pytest
+
+import naviqa
+
+
+@pytest.fixture
+def suite_path(tmp_path):
+    """PASS 2개('취소', '뭐야'), FAIL 1개('강남역 검색해줘'는 CONTINUE 응답)인 단일 턴 스위트"""
+    path = tmp_path / 'suite.csv'
+    pd.DataFrame({
+        'message': ['취소', '강남역 검색해줘', '뭐야'],
+        'user_id': 'u',
+        'lat': 37.5,
+        'lng': 127.0,
+        'is_driving': True,
+        'next_step_expected': 'END',
+    }).to_csv(path, index=False)
+    return str(path)
+
+
+def _run(suite_path, agent_url, out_path, *options):
+    return naviqa.main(['run', suite_path, '--driver', 'api', '--api-url', agent_url, '--out', str(out_path), *options])
+
+
+def test_default_max_fail_zero_fails_on_any_fail(suite_path, agent_url, tmp_path):
+    out_path = tmp_path / 'results.csv'
+
+    assert _run(suite_path, agent_url, out_path) == naviqa.EXIT_THRESHOLD
+
+    results = pd.read_csv(out_path)
+    assert results['verdict'].tolist() == ['PASS', 'FAIL', 'PASS']
+    report = json.loads((tmp_path / 'results.report.json').read_text(encoding='utf-8'))
+    assert report['exit_code'] == naviqa.EXIT_THRESHOLD
+    assert report['summary']['fail'] == 1
+    assert report['violations']
+
+
+def test_thresholds(suite_path, agent_url, tmp_path):
+    out_path = tmp_path / 'results.jsonl'
+
+    assert _run(suite_path, agent_url, out_path, '--max-fail', '1') == naviqa.EXIT_OK
+    assert _run(suite_path, agent_url, out_path, '--max-fail', '1', '--min-pass-rate', '0.9') == naviqa.EXIT_THRESHOLD
+    assert _run(suite_path, agent_url, out_path, '--max-fail', '1', '--min-pass-rate', '0.6') == naviqa.EXIT_OK
+
+
+def test_shard_runs_only_its_rows(suite_path, agent_url, tmp_path):
+    out_path = tmp_path / 'shard.csv'
+
+    assert _run(suite_path, agent_url, out_path, '--shard', '2/3') == naviqa.EXIT_THRESHOLD
+
+    assert pd.read_csv(out_path)['message'].tolist() == ['강남역 검색해줘']
+
+
+@pytest.mark.parametrize('options', [
+    ['--shard', '4/3'],
+    ['--workers', 'many'],
+])
+def test_invalid_options(suite_path, agent_url, tmp_path, options):
+    assert _run(suite_path, agent_url, tmp_path / 'results.csv', *options) == naviqa.EXIT_INVALID
+
+
+def test_invalid_inputs(suite_path, agent_url, tmp_path):
+    missing_column = tmp_path / 'missing.csv'
+    pd.DataFrame({'message': ['취소']}).to_csv(missing_column, index=False)
+
+    assert _run(str(tmp_path / 'nope.csv'), agent_url, tmp_path / 'results.csv') == naviqa.EXIT_INVALID
+    assert _run(str(missing_column), agent_url, tmp_path / 'results.csv') == naviqa.EXIT_INVALID
+    assert _run(suite_path, agent_url, tmp_path / 'results.txt') == naviqa.EXIT_INVALID
+
+
+def test_write_failure_is_run_error(suite_path, agent_url, tmp_path):
+    blocker = tmp_path / 'not_a_directory'
+    blocker.write_text('')
+
+    exit_code = _run(suite_path, agent_url, blocker / 'results.csv', '--report', str(tmp_path / 'report.json'))
+
+    assert exit_code == naviqa.EXIT_ERROR
+    assert json.loads((tmp_path / 'report.json').read_text(encoding='utf-8'))['error']
@@ -0,0 +1,20 @@
+"""
+병렬 실행(workers > 1) 결과가 순차 실행과 같은 순서와 값으로 모이는지 검증합니다.
+"""
+from api_driver import ApiTestAutomation
+from conftest import make_multi_turn_suite
+
+RESULT_COLUMNS = ['test_case_id', 'turn_number', 'action_data', 'tts_actual', 'next_step', 'verdict']
+
+
+def test_parallel_results_match_sequential(agent_url):
+    df = make_multi_turn_suite([
+        (case_id, ['강남역 검색해줘', '강남역 길안내 해줘'] if case_id % 2 else ['판교 검색해줘'], f'u{case_id}')
+        for case_id in range(1, 9)
+    ])
+
+    sequential = ApiTestAutomation(api_url=agent_url).run_tests(df, workers=1)
+    parallel = ApiTestAutomation(api_url=agent_url).run_tests(df, workers=4)
+
+    assert len(parallel) == len(df)
+    assert parallel[RESULT_COLUMNS].equals(sequential[RESULT_COLUMNS])
@@ -0,0 +1,106 @@
+"""리소스 차단기 라우팅/통계 테스트 (가짜 Playwright 컨텍스트/라우트 사용)"""
+import re
+
+from resource_blocker import ESTIMATED_BYTES_BY_TYPE, ResourceBlocker
+
+
+class FakeRequest:
+    def __init__(self, resource_type, url):
+        self.resource_type = resource_type
+        self.url = url
+
+
+class FakeRoute:
+    def __init__(self, resource_type, url):
+        self.request = FakeRequest(resource_type, url)
+        self.outcome = None
+
+    def continue_(self):
+        self.outcome = 'continue'
+
+    def abort(self):
+        self.outcome = 'abort'
+
+    def fulfill(self, status, content_type, body):
+        self.outcome = ('fulfill', status, content_type, body)
+
+
+class FakeContext:
+    def __init__(self):
+        self.routes = []
+
+    def route(self, pattern, handler):
+        self.routes.append((pattern, handler))
+
+    def unroute(self, pattern, handler):
+        self.routes.remove((pattern, handler))
+
+    def is_routed(self, url):
+        return any(pattern.search(url) for pattern, _ in self.routes)
+
+
+def _blocker(**kwargs):
+    kwargs.setdefault('resource_types', ['image', 'font', 'media'])
+    kwargs.setdefault('url_patterns', [r'google-analytics\.com'])
+    return ResourceBlocker(**kwargs)
+
+
+def test_route_patterns_skip_app_bundles_and_websocket():
+    context = FakeContext()
+    _blocker().attach(context)
+
+    assert context.is_routed('http://app/static/media/logo.png')
+    assert context.is_routed('http://app/static/fonts/pretendard.woff2?v=1')
+    assert context.is_routed('https://www.google-analytics.com/collect')
+    assert not context.is_routed('http://app/static/js/main.abc123.js')
+    assert not context.is_routed('http://app/static/css/main.css')
+    assert not context.is_routed('ws://app/_stcore/stream')
+    assert not context.is_routed('http://app/')
+
+
+def test_handle_route_blocks_stubs_and_continues():
+    blocker = _blocker(resource_types=['image', 'stylesheet'])
+
+    image = FakeRoute('image', 'http://app/a.png')
+    stylesheet = FakeRoute('stylesheet', 'http://app/a.css')
+    analytics = FakeRoute('script', 'https://www.google-analytics.com/analytics.js')
+    xhr = FakeRoute('xhr', 'http://app/api.json')
+    for route in (image, stylesheet, analytics, xhr):
+        blocker._handle_route(route)
+
+    assert image.outcome == 'abort'
+    assert stylesheet.outcome == ('fulfill', 200, 'text/css', '')
+    assert analytics.outcome == ('fulfill', 200, 'application/javascript', '')
+    assert xhr.outcome == 'continue'
+
+    stats = blocker.stats()
+    assert stats['blocked_requests'] == 3
+    assert stats['stubbed_requests'] == 2
+    assert stats['allowed_requests'] == 1
+    assert stats['blocked_by_type'] == {'image': 1, 'stylesheet': 1, 'script': 1}
+    assert stats['estimated_bytes_saved'] == sum(
+        ESTIMATED_BYTES_BY_TYPE[t] for t in ('image', 'stylesheet', 'script')
+    )
+    assert 'bytes_saved' not in stats
+
+
+def test_document_and_websocket_are_never_blocked():
+    blocker = _blocker(url_patterns=[r'.*'])
+    assert not blocker.should_block('document', 'http://app/')
+    assert not blocker.should_block('websocket', 'ws://app/_stcore/stream')
+    assert blocker.should_block('xhr', 'http://app/api')
+
+
+def test_unmapped_type_routes_everything():
+    blocker = _blocker(resource_types=['image', 'xhr'])
+    assert blocker.route_patterns == ['**/*']
+
+
+def test_detach_removes_every_route():
+    context = FakeContext()
+    blocker = _blocker()
+    blocker.attach(context)
+    assert len(context.routes) == len(blocker.route_patterns)
+    assert all(isinstance(pattern, re.Pattern) for pattern, _ in context.routes)
+    blocker.detach(context)
+    assert context.routes == []
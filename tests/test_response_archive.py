@@ -0,0 +1,56 @@
+"""응답 녹화(ApiTestAutomation) 후 재생(ReplayTestAutomation) 왕복 테스트"""
+from api_driver import ApiTestAutomation
+from replay_driver import ReplayTestAutomation
+from response_archive import ResponseArchive, turn_inputs, turn_key
+
+from conftest import make_multi_turn_suite
+
+
+COMPARED_COLUMNS = ['test_case_id', 'turn_number', 'message', 'action_data', 'tts_actual', 'next_step', 'verdict']
+
+SCENARIOS = [
+    ('A', ['강남역 검색해줘', '강남역 길안내 해줘'], 'u1'),
+    ('B', ['강남역 검색해줘', '취소'], 'u2'),
+    ('C', ['판교 검색해줘'], 'u3'),
+]
+
+
+def _record(agent_url, archive_dir, suite):
+    automation = ApiTestAutomation(api_url=agent_url)
+    automation.archive_mode = 'record'
+    automation.response_archive = ResponseArchive(str(archive_dir))
+    results = automation.run_tests(suite)
+    return automation, results
+
+
+def test_turn_key_depends_on_every_input():
+    base = turn_inputs('http://app', {'user_id': 'u1'}, ['검색'], '취소')
+    assert turn_key(base) == turn_key(turn_inputs('http://app', {'user_id': 'u1'}, ['검색'], '취소'))
+    assert turn_key(base) != turn_key(turn_inputs('http://app', {'user_id': 'u2'}, ['검색'], '취소'))
+    assert turn_key(base) != turn_key(turn_inputs('http://app', {'user_id': 'u1'}, [], '취소'))
+    assert turn_key(base) != turn_key(turn_inputs('http://other', {'user_id': 'u1'}, ['검색'], '취소'))
+
+
+def test_replay_reproduces_recorded_results(agent_url, tmp_path):
+    suite = make_multi_turn_suite(SCENARIOS)
+    recorder, recorded = _record(agent_url, tmp_path / 'archive', suite)
+    assert recorder.run_report['response_archive']['stored'] == len(suite)
+
+    replay = ReplayTestAutomation(archive_dir=str(tmp_path / 'archive'))
+    replayed = replay.run_tests(suite)
+
+    assert replayed[COMPARED_COLUMNS].equals(recorded[COMPARED_COLUMNS])
+    assert replay.run_report['response_archive']['hits'] == len(suite)
+    assert replay.run_report['response_archive']['misses'] == 0
+
+
+def test_replay_without_recording_fails_the_turn(agent_url, tmp_path):
+    _record(agent_url, tmp_path / 'archive', make_multi_turn_suite(SCENARIOS[:1]))
+
+    replay = ReplayTestAutomation(archive_dir=str(tmp_path / 'archive'))
+    replayed = replay.run_tests(make_multi_turn_suite([('Z', ['녹화 안 된 메시지'], 'u9')]))
+
+    row = replayed.iloc[0]
+    assert row['verdict'] == 'FAIL'
+    assert '녹화된 응답 없음' in str(row.get('turn_error', ''))
+    assert replay.run_report['response_archive']['misses'] == 1
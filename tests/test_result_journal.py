@@ -0,0 +1,103 @@
+"""
+결과 저널 기록/재개를 API 드라이버와 모의 에이전트 서버로 검증합니다.
+"""
+import pytest
+
+from api_driver import ApiTestAutomation
+from conftest import make_multi_turn_suite
+from result_journal import ResultJournal, latest_run_id, suite_hash
+
+RESULT_COLUMNS = ['test_case_id', 'turn_number', 'action_data', 'tts_actual', 'verdict']
+
+
+def _suite():
+    return make_multi_turn_suite([
+        (1, ['강남역 검색해줘', '강남역 길안내 해줘'], 'u'),
+        (2, ['뭐야'], 'u'),
+        (3, ['취소'], 'u'),
+    ])
+
+
+def _record_units(automation):
+    calls = []
+    run_unit = automation._run_unit
+
+    def recording_run_unit(unit, reset_first=True):
+        calls.append(unit['test_case_id'])
+        return run_unit(unit, reset_first)
+
+    automation._run_unit = recording_run_unit
+    return calls
+
+
+def test_resume_skips_completed_scenarios(agent_url):
+    df = _suite()
+    first = ApiTestAutomation(api_url=agent_url).run_tests(df, run_id='resume-test')
+
+    automation = ApiTestAutomation(api_url=agent_url)
+    calls = _record_units(automation)
+    resumed = automation.run_tests(df, run_id='resume-test', resume=True)
+
+    assert calls == []
+    assert automation.run_report['resumed_units'] == 3
+    assert resumed[RESULT_COLUMNS].equals(first[RESULT_COLUMNS])
+
+
+def test_resume_reruns_partial_scenario(agent_url):
+    df = _suite()
+    automation = ApiTestAutomation(api_url=agent_url)
+    first = automation.run_tests(df, run_id='resume-partial')
+    path = automation.run_report['journal_path']
+
+    # 헤더, 시나리오 1의 첫 턴, 시나리오 2만 남기고 마지막 줄은 기록 도중 중단된 것처럼 만듦
+    with open(path, encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines[:2] + [lines[3]]) + '\n{"type": "row", "unit')
+
+    automation = ApiTestAutomation(api_url=agent_url)
+    calls = _record_units(automation)
+    resumed = automation.run_tests(df, run_id='resume-partial', resume=True)
+
+    assert sorted(calls) == [1, 3]
+    assert resumed[RESULT_COLUMNS].equals(first[RESULT_COLUMNS])
+
+
+def test_fresh_runs_do_not_overwrite_each_other(agent_url):
+    df = _suite()
+    first = ApiTestAutomation(api_url=agent_url)
+    first.run_tests(df)
+    second = ApiTestAutomation(api_url=agent_url)
+    second.run_tests(df)
+
+    assert first.run_report['run_id'] != second.run_report['run_id']
+    assert first.run_report['run_id'].startswith(suite_hash(df, first.base_url))
+    with open(first.run_report['journal_path'], encoding='utf-8') as f:
+        assert sum(1 for line in f if '"type": "row"' in line) == len(df)
+
+
+def test_resume_without_run_id_uses_latest_journal(agent_url):
+    df = _suite()
+    ApiTestAutomation(api_url=agent_url).run_tests(df)
+    latest = ApiTestAutomation(api_url=agent_url)
+    latest.run_tests(df)
+
+    automation = ApiTestAutomation(api_url=agent_url)
+    calls = _record_units(automation)
+    automation.run_tests(df, resume=True)
+
+    assert latest_run_id(suite_hash(df, automation.base_url)) == latest.run_report['run_id']
+    assert automation.run_report['run_id'] == latest.run_report['run_id']
+    assert calls == []
+
+
+def test_existing_journal_is_not_truncated(tmp_path):
+    journal = ResultJournal('taken', directory=str(tmp_path))
+    journal.open({'suite_hash': 'abc'})
+    journal.append('1', 0, {'verdict': 'PASS'})
+    journal.close()
+
+    with pytest.raises(ValueError):
+        ResultJournal('taken', directory=str(tmp_path)).open({'suite_hash': 'abc'})
+    recorded = ResultJournal('taken', directory=str(tmp_path)).open({'suite_hash': 'abc'}, resume=True)
+    assert recorded == {'1': {0: {'verdict': 'PASS'}}}
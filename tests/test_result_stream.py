@@ -0,0 +1,42 @@
+"""
+iter_results 결과 스트리밍을 API 드라이버와 모의 에이전트 서버로 검증합니다.
+"""
+import time
+
+import pandas as pd
+
+from api_driver import ApiTestAutomation
+from mock_agent_server import MockAgentHandler
+
+
+def _single_turn_suite(count):
+    return pd.DataFrame({
+        'message': [f'강남역 검색해줘 {i}' for i in range(count)],
+        'user_id': 'u',
+        'lat': 37.5,
+        'lng': 127.0,
+        'is_driving': True,
+    })
+
+
+def test_iter_results_yields_every_row(agent_url):
+    df = _single_turn_suite(6)
+
+    rows = list(ApiTestAutomation(api_url=agent_url).iter_results(df, workers=3))
+
+    assert sorted(row['message'] for row in rows) == sorted(df['message'])
+
+
+def test_closing_iter_results_stops_workers(agent_url, monkeypatch):
+    monkeypatch.setattr(MockAgentHandler, 'latency_ms', 100)
+    df = _single_turn_suite(40)
+    automation = ApiTestAutomation(api_url=agent_url)
+
+    results = automation.iter_results(df, workers=4)
+    next(results)
+    results.close()
+
+    sessions_at_close = len(MockAgentHandler.sessions)
+    time.sleep(1)
+    assert len(MockAgentHandler.sessions) == sessions_at_close
+    assert sessions_at_close < len(df)
@@ -0,0 +1,54 @@
+import pytest
+
+from retry_policy import FAILURE_INFRA, FAILURE_VERDICT, RetryPolicy, classify_failure
+
+
+def _row(turn_error='', raw_json='{"ok": true}', verdict='FAIL', **extra):
+    return {'verdict': verdict, 'turn_error': turn_error, 'raw_json': raw_json, **extra}
+
+
+@pytest.mark.parametrize('turn_error', [
+    '메시지 입력창을 찾을 수 없음',
+    '메시지 입력 실패: detached',
+    'Timeout 30000ms exceeded.',
+    'Locator.click: Timeout 5000ms exceeded.',
+    'Page.goto: net::ERR_CONNECTION_REFUSED at http://x',
+    'Target page, context or browser has been closed',
+    "HTTPConnectionPool(host='x', port=80): Read timed out.",
+    'HTTP 503: upstream unavailable',
+])
+def test_infra_errors(turn_error):
+    assert classify_failure(_row(turn_error)) == FAILURE_INFRA
+
+
+@pytest.mark.parametrize('turn_error', [
+    'HTTP 400: bad request',
+    'HTTP 429: too many requests',
+    # 패턴이 문장 중간에 있으면 인프라 오류로 보지 않음
+    '평가 실패: Timeout 문구가 응답에 포함됨',
+    'KeyError: HTTP 500',
+])
+def test_product_errors(turn_error):
+    assert classify_failure(_row(turn_error)) == FAILURE_VERDICT
+
+
+def test_4xx_without_body_is_product_failure():
+    assert classify_failure(_row('HTTP 404: not found', raw_json='')) == FAILURE_VERDICT
+
+
+def test_missing_body_or_timeout_is_infra():
+    assert classify_failure(_row(raw_json='')) == FAILURE_INFRA
+    assert classify_failure(_row(response_timed_out=True)) == FAILURE_INFRA
+
+
+def test_plain_fail_and_pass():
+    assert classify_failure(_row()) == FAILURE_VERDICT
+    assert classify_failure(_row('Timeout 1ms exceeded', verdict='PASS')) is None
+    assert classify_failure({'pass/fail': 'FAIL', 'raw_json': ''}) == FAILURE_INFRA
+
+
+def test_retry_budget():
+    assert RetryPolicy(max_attempts=1).budget(100) == 0
+    assert RetryPolicy(max_attempts=3).budget(10) == 3
+    assert RetryPolicy(max_attempts=3).budget(100) == 10
+    assert RetryPolicy(max_attempts=3, budget=7).budget(100) == 7
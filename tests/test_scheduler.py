@@ -0,0 +1,34 @@
+from scheduler import estimate_unit_ms, group_by_key, order_longest_first, simulate_makespan
+from timing_profile import TimingProfile
+
+
+def _unit(index, messages):
+    return {'index': index, 'turns': [(index, {'message': message}) for message in messages]}
+
+
+def test_longest_first_with_stable_ties():
+    units = [_unit(i, ['m']) for i in range(5)]
+    estimates = {0: 10.0, 1: 50.0, 2: 10.0, 3: 30.0, 4: 50.0}
+
+    ordered = order_longest_first(units, estimates)
+
+    assert [unit['index'] for unit in ordered] == [1, 4, 3, 0, 2]
+
+
+def test_estimate_uses_turn_count_without_history():
+    profile = TimingProfile('http://example.test')
+    short, long = _unit(0, ['a']), _unit(1, ['a', 'b', 'c'])
+    estimates = {unit['index']: estimate_unit_ms(unit, profile, lambda row: row['message']) for unit in (short, long)}
+
+    assert estimates[1] > estimates[0]
+    assert [unit['index'] for unit in order_longest_first([short, long], estimates)] == [1, 0]
+
+
+def test_lpt_order_reduces_makespan():
+    durations = [1.0, 1.0, 1.0, 1.0, 4.0]
+    assert simulate_makespan(sorted(durations, reverse=True), 2) < simulate_makespan(durations, 2)
+
+
+def test_group_by_key_keeps_first_seen_order():
+    units = [{'index': i, 'k': k} for i, k in enumerate('abab')]
+    assert [unit['index'] for unit in group_by_key(units, lambda unit: unit['k'])] == [0, 2, 1, 3]
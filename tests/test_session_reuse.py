@@ -0,0 +1,46 @@
+"""
+단일 턴 세션 재사용(NAVIQA_SESSION_REUSE)이 병렬 실행에서도 Request Fields별 채팅 세션을 유지하는지 검증합니다.
+"""
+import pandas as pd
+import pytest
+
+from api_driver import ApiTestAutomation
+
+
+def _interleaved_suite(users, cases_per_user):
+    # 같은 Request Fields의 케이스가 서로 떨어져 있도록 사용자를 번갈아 배치
+    users_in_order = [user for _ in range(cases_per_user) for user in users]
+    return pd.DataFrame({
+        'message': [f'강남역 검색해줘 {i}' for i in range(len(users_in_order))],
+        'user_id': users_in_order,
+        'lat': 37.5,
+        'lng': 127.0,
+        'is_driving': True,
+    })
+
+
+@pytest.mark.parametrize('workers', [1, 3])
+def test_session_resets_once_per_request_fields(agent_url, monkeypatch, workers):
+    counts = {'initialize_chat': 0, 'reset_page': 0}
+    original = {name: getattr(ApiTestAutomation, name) for name in counts}
+
+    def counting(name):
+        def wrapper(self, *args, **kwargs):
+            counts[name] += 1
+            return original[name](self, *args, **kwargs)
+        return wrapper
+
+    for name in counts:
+        monkeypatch.setattr(ApiTestAutomation, name, counting(name))
+    df = _interleaved_suite(['a', 'b', 'c'], 4)
+    automation = ApiTestAutomation(api_url=agent_url)
+    automation.session_reuse = True
+
+    results = automation.run_tests(df, workers=workers)
+
+    assert counts['initialize_chat'] == 3
+    # 워커의 첫 단위는 리셋 없이 시작하므로 리셋은 (세션 수 - 1)회 이하
+    assert counts['reset_page'] <= 2
+    assert automation.run_report['session_reuse'] == {'sessions': 3, 'reused_cases': 9}
+    assert results['message'].tolist() == df['message'].tolist()
+    assert results.groupby('user_id')['session_id'].nunique().tolist() == [1, 1, 1]
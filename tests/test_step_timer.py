@@ -0,0 +1,99 @@
+"""단계별 소요 시간 span(자기 시간) 측정 테스트"""
+import threading
+
+import pytest
+
+import step_timer
+from step_timer import StepTimer
+
+
+class FakeClock:
+    """perf_counter/sleep을 대신하는 결정적 시계 (초 단위)"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def perf_counter(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(step_timer.time, 'perf_counter', fake.perf_counter)
+    monkeypatch.setattr(step_timer.time, 'sleep', fake.advance)
+    return fake
+
+
+def test_nested_spans_record_self_time(clock):
+    timer = StepTimer()
+    with timer.span('initialize_chat'):
+        clock.advance(0.1)
+        with timer.span('input_fill'):
+            clock.advance(0.2)
+        timer.sleep(0.5)
+        clock.advance(0.05)
+
+    phases = timer.report()['phases']
+    assert phases['initialize_chat']['total_ms'] == pytest.approx(150.0)
+    assert phases['input_fill']['total_ms'] == pytest.approx(200.0)
+    assert phases['sleep']['total_ms'] == pytest.approx(500.0)
+
+
+def test_report_totals_and_phase_order(clock):
+    timer = StepTimer()
+    with timer.span('evaluation'):
+        clock.advance(0.1)
+    for _ in range(3):
+        with timer.span('wait_response'):
+            clock.advance(0.2)
+    timer.sleep(0.3)
+    timer.sleep(0)  # 0초 대기는 기록하지 않음
+
+    report = timer.report(wall_ms=2000)
+    assert list(report['phases']) == ['wait_response', 'evaluation', 'sleep']
+    assert report['wall_ms'] == 2000
+    assert report['measured_ms'] == pytest.approx(1000.0)
+    assert report['wait_response_ms'] == pytest.approx(600.0)
+    assert report['sleep_ms'] == pytest.approx(300.0)
+    assert report['phases']['wait_response']['count'] == 3
+    assert report['phases']['wait_response']['share'] == pytest.approx(0.6)
+    assert report['phases']['sleep']['count'] == 1
+    assert 'wait_response' in StepTimer.format_report(report)
+
+
+def test_span_stacks_are_per_thread(clock):
+    timer = StepTimer()
+    inner_started = threading.Event()
+    release = threading.Event()
+
+    def worker():
+        with timer.span('send'):
+            inner_started.set()
+            release.wait(5)
+
+    with timer.span('reset_page'):
+        thread = threading.Thread(target=worker)
+        thread.start()
+        inner_started.wait(5)
+        clock.advance(0.4)
+        release.set()
+        thread.join(5)
+
+    phases = timer.report()['phases']
+    # 다른 스레드의 span은 바깥 span의 자기 시간에서 빠지지 않음
+    assert phases['reset_page']['total_ms'] == pytest.approx(400.0)
+    assert phases['send']['total_ms'] == pytest.approx(400.0)
+
+
+def test_reset_clears_samples(clock):
+    timer = StepTimer()
+    timer.record('extraction', 10)
+    timer.reset()
+    report = timer.report()
+    assert report['phases'] == {}
+    assert report['measured_ms'] == 0
+    assert report['wall_ms'] is None
@@ -0,0 +1,45 @@
+import pandas as pd
+import pytest
+
+from conftest import make_multi_turn_suite
+from suite_loader import parse_shard, shard_suite
+
+
+def test_parse_shard():
+    assert parse_shard('2/4') == (2, 4)
+    for value in ('0/3', '4/3', '1/0', 'a/b', '3'):
+        with pytest.raises(ValueError):
+            parse_shard(value)
+
+
+def test_shard_single_turn_round_robin_by_row():
+    df = pd.DataFrame({'message': [f'msg {i}' for i in range(7)]})
+    shards = [shard_suite(df, k, 3) for k in (1, 2, 3)]
+
+    assert [shard['message'].tolist() for shard in shards] == [
+        ['msg 0', 'msg 3', 'msg 6'],
+        ['msg 1', 'msg 4'],
+        ['msg 2', 'msg 5'],
+    ]
+
+
+def test_shard_multi_turn_keeps_scenarios_together():
+    df = make_multi_turn_suite([
+        ('A', ['강남역 검색해줘', '강남역 길안내 해줘'], 'u'),
+        ('B', ['판교 검색해줘'], 'u'),
+        ('C', ['취소', '뭐야', '취소'], 'u'),
+        ('D', ['뭐야'], 'u'),
+    ])
+    shards = [shard_suite(df, k, 2) for k in (1, 2)]
+
+    assert [sorted(set(shard['test_case_id'])) for shard in shards] == [['A', 'C'], ['B', 'D']]
+    # 모든 행이 정확히 한 샤드에 들어가고 원래 순서를 유지
+    combined = pd.concat(shards).sort_index()
+    assert combined.equals(df)
+    for shard in shards:
+        assert shard.index.is_monotonic_increasing
+
+
+def test_shard_count_one_returns_suite():
+    df = pd.DataFrame({'message': ['a', 'b']})
+    assert shard_suite(df, 1, 1) is df
@@ -0,0 +1,84 @@
+"""타이밍 프로필 타임아웃 산출/저장 테스트"""
+import json
+import os
+
+import pytest
+
+import timing_profile
+from timing_profile import MAX_TIMEOUT_FACTOR, MIN_TIMEOUT_MS, TimingProfile, percentile
+
+
+def _profile(tmp_path, preset='fast'):
+    return TimingProfile('http://app', preset=preset, path=str(tmp_path / 'profile.json'))
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 0.99) == 99
+    assert percentile(values, 0.5) == 50
+    assert percentile([], 0.99) is None
+
+
+def test_timeout_is_p99_times_safety_factor(tmp_path):
+    profile = _profile(tmp_path)
+    settings = timing_profile.PRESETS['fast']
+    assert profile.timeout_ms('response', 30000) == 30000  # 관측값 부족 시 기본값
+
+    for duration in range(1000, 1000 + 100 * settings['min_samples'], 100):
+        profile.record('response', duration)
+    samples = list(range(1000, 1000 + 100 * settings['min_samples'], 100))
+    expected = int(percentile(samples, settings['percentile']) * settings['safety_factor'])
+    assert profile.timeout_ms('response', 30000) == expected
+
+
+def test_timeout_is_clamped(tmp_path):
+    profile = _profile(tmp_path)
+    for _ in range(20):
+        profile.record('fast_step', 10)
+        profile.record('slow_step', 100000)
+    assert profile.timeout_ms('fast_step', 30000) == MIN_TIMEOUT_MS
+    assert profile.timeout_ms('slow_step', 30000) == 30000 * MAX_TIMEOUT_FACTOR
+
+
+def test_debug_preset_keeps_default_timeout(tmp_path):
+    profile = _profile(tmp_path, preset='debug')
+    for _ in range(50):
+        profile.record('response', 100)
+    assert profile.timeout_ms('response', 30000) == 30000
+
+
+def test_unknown_preset_raises(tmp_path):
+    with pytest.raises(ValueError):
+        _profile(tmp_path, preset='turbo')
+
+
+def test_censored_timeouts_raise_next_timeout(tmp_path):
+    profile = _profile(tmp_path)
+    for _ in range(20):
+        profile.record('response', 1000)
+    before = profile.timeout_ms('response', 30000)
+
+    # 타임아웃 난 대기는 상한값으로 기록되어 p99를 끌어올림
+    profile.record_timeout('response', before)
+    after = profile.timeout_ms('response', 30000)
+    assert after > before
+    assert after == int(before * timing_profile.PRESETS['fast']['safety_factor'])
+
+
+def test_save_merges_and_reloads(tmp_path):
+    first = _profile(tmp_path)
+    first.record('page_load', 1200)
+    first.record_message('안녕', 3000)
+    first.save()
+
+    second = _profile(tmp_path)
+    second.record('page_load', 800)
+    second.save()
+
+    reloaded = _profile(tmp_path)
+    assert reloaded.summary()['page_load']['count'] == 2
+    assert reloaded.message_estimate_ms('안녕') == 3000
+    with open(tmp_path / 'profile.json', encoding='utf-8') as f:
+        assert json.load(f)['http://app']['page_load'] == [1200, 800]
+    # 고유 임시 파일은 교체 후 남지 않음
+    assert os.listdir(tmp_path) == ['profile.json']
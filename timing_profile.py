@@ -0,0 +1,235 @@
+"""
+타이밍 프로필 모듈
+단계별(페이지 로드, 응답 대기, 채팅 시작 등) 실제 소요 시간을 실행 간에 누적 기록하고,
+대상 base_url별 관측 백분위수(p99 x 안전 계수)로 타임아웃을 산출합니다.
+"fast" / "balanced" / "debug" 프리셋으로 slow_mo와 고정 안정화 대기도 함께 조정합니다.
+메시지별 턴 소요 시간(지수 이동 평균)도 기록하여 스케줄러의 시나리오 소요 시간 추정에 사용합니다.
+"""
+import hashlib
+import json
+import math
+import os
+import tempfile
+import threading
+from typing import Dict, List, Optional
+
+
+# 프리셋별 설정
+# - slow_mo: Playwright 동작 지연 (ms). 디버깅 시에만 사용
+# - settle_seconds: 페이지 로드 직후 고정 안정화 대기 (초)
+# - adaptive: 관측값 기반 타임아웃 사용 여부
+# - percentile / safety_factor: 타임아웃 = 관측 백분위수 x 안전 계수
+# - min_samples: 관측값이 이보다 적으면 기본 타임아웃 사용
+PRESETS = {
+    'fast': {
+        'slow_mo': 0,
+        'settle_seconds': 0.0,
+        'adaptive': True,
+        'percentile': 0.99,
+        'safety_factor': 1.5,
+        'min_samples': 10,
+    },
+    'balanced': {
+        'slow_mo': 0,
+        'settle_seconds': 0.5,
+        'adaptive': True,
+        'percentile': 0.99,
+        'safety_factor': 2.0,
+        'min_samples': 20,
+    },
+    'debug': {
+        'slow_mo': 100,
+        'settle_seconds': 2.0,
+        'adaptive': False,
+        'percentile': 0.99,
+        'safety_factor': 4.0,
+        'min_samples': 20,
+    },
+}
+
+# 산출 타임아웃 하한 (ms) 및 기본값 대비 상한 배수
+MIN_TIMEOUT_MS = 1000
+MAX_TIMEOUT_FACTOR = 2.0
+# 단계별로 보관하는 최근 관측값 수
+MAX_SAMPLES_PER_STEP = 500
+# 메시지별 턴 소요 시간 지수 이동 평균 가중치
+MESSAGE_EWMA_ALPHA = 0.3
+
+DEFAULT_PROFILE_PATH = os.environ.get(
+    'NAVIQA_TIMING_PROFILE_PATH',
+    os.path.join(tempfile.gettempdir(), 'naviqa', 'timing_profile.json'),
+)
+
+
+def message_key(message: str) -> str:
+    """메시지별 소요 시간 기록용 키 (메시지 원문 대신 해시 저장)"""
+    return hashlib.sha1(str(message).strip().encode('utf-8')).hexdigest()[:16]
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """
+    nearest-rank 방식 백분위수
+
+    Args:
+        values: 관측값 리스트
+        q: 0.0 ~ 1.0
+
+    Returns:
+        백분위수 값 (값이 없으면 None)
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q * len(ordered)))
+    return ordered[rank - 1]
+
+
+class TimingProfile:
+    """base_url별 단계 소요 시간 기록 및 타임아웃 산출 클래스 (스레드 안전)"""
+
+    def __init__(self, base_url: str, preset: Optional[str] = None, path: Optional[str] = None):
+        """
+        Args:
+            base_url: 대상 URL (관측값을 구분하는 키)
+            preset: 'fast', 'balanced', 'debug' (기본값: 환경 변수 NAVIQA_TIMING_PRESET 또는 'balanced')
+            path: 관측값 저장 파일 경로
+        """
+        preset = (preset or os.environ.get('NAVIQA_TIMING_PRESET', 'balanced')).lower()
+        if preset not in PRESETS:
+            raise ValueError(f"알 수 없는 타이밍 프리셋: {preset} (가능: {', '.join(PRESETS)})")
+        self.base_url = base_url
+        self.preset = preset
+        self.settings = PRESETS[preset]
+        self.path = path or DEFAULT_PROFILE_PATH
+        self._lock = threading.Lock()
+        self._history: Dict[str, List[float]] = self._load()
+        self._new_samples: Dict[str, List[float]] = {}
+        self._messages: Dict[str, float] = self._load(self._messages_key)
+        self._new_messages: Dict[str, float] = {}
+
+    @property
+    def slow_mo(self) -> int:
+        return self.settings['slow_mo']
+
+    @property
+    def settle_seconds(self) -> float:
+        return self.settings['settle_seconds']
+
+    @property
+    def _messages_key(self) -> str:
+        return f"{self.base_url}::messages"
+
+    def _load(self, key: Optional[str] = None) -> Dict:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f).get(key or self.base_url, {})
+        except (OSError, ValueError):
+            return {}
+
+    def record(self, step: str, duration_ms: float):
+        """단계 소요 시간을 기록합니다. (성공한 대기. 타임아웃은 record_timeout)"""
+        with self._lock:
+            samples = self._history.setdefault(step, [])
+            samples.append(round(duration_ms, 1))
+            del samples[:-MAX_SAMPLES_PER_STEP]
+            self._new_samples.setdefault(step, []).append(round(duration_ms, 1))
+
+    def record_timeout(self, step: str, timeout_ms: float):
+        """
+        타임아웃으로 끝난 대기를 기록합니다.
+        실제 소요 시간은 알 수 없고 timeout_ms 이상이므로 대기 상한을 관측값(중도 절단 표본)으로 넣습니다.
+        성공한 대기만 기록하면 타임아웃이 나도 백분위수가 오르지 않으므로, 다음 산출 타임아웃이 늘어나도록 함께 반영합니다.
+
+        Args:
+            step: 단계 이름
+            timeout_ms: 이번 대기에 사용한 타임아웃 (ms)
+        """
+        self.record(step, timeout_ms)
+
+    def record_message(self, message: str, duration_ms: float):
+        """메시지 한 턴의 소요 시간을 지수 이동 평균으로 기록합니다."""
+        key = message_key(message)
+        with self._lock:
+            previous = self._messages.get(key)
+            value = duration_ms if previous is None else previous + MESSAGE_EWMA_ALPHA * (duration_ms - previous)
+            self._messages[key] = round(value, 1)
+            self._new_messages[key] = self._messages[key]
+
+    def message_estimate_ms(self, message: str) -> Optional[float]:
+        """메시지의 과거 턴 소요 시간 추정치 (기록이 없으면 None)"""
+        with self._lock:
+            return self._messages.get(message_key(message))
+
+    def typical_ms(self, step: str) -> Optional[float]:
+        """단계 소요 시간의 중앙값 (관측값이 없으면 None)"""
+        with self._lock:
+            return percentile(list(self._history.get(step, [])), 0.5)
+
+    def timeout_ms(self, step: str, default_ms: int) -> int:
+        """
+        단계별 타임아웃을 반환합니다.
+        관측값이 충분하면 백분위수 x 안전 계수를 [MIN_TIMEOUT_MS, default_ms x MAX_TIMEOUT_FACTOR]로 제한해 사용합니다.
+
+        Args:
+            step: 단계 이름 (예: 'page_load', 'response', 'chat_ready')
+            default_ms: 관측값이 부족할 때 사용할 기본 타임아웃
+
+        Returns:
+            타임아웃 (ms)
+        """
+        if not self.settings['adaptive']:
+            return int(default_ms)
+        with self._lock:
+            samples = list(self._history.get(step, []))
+        if len(samples) < self.settings['min_samples']:
+            return int(default_ms)
+        observed = percentile(samples, self.settings['percentile'])
+        timeout = observed * self.settings['safety_factor']
+        return int(min(max(timeout, MIN_TIMEOUT_MS), default_ms * MAX_TIMEOUT_FACTOR))
+
+    def summary(self) -> Dict[str, Dict]:
+        """단계별 관측 개수, p50, p99를 반환합니다."""
+        with self._lock:
+            history = {step: list(values) for step, values in self._history.items()}
+        return {
+            step: {
+                'count': len(values),
+                'p50_ms': percentile(values, 0.5),
+                'p99_ms': percentile(values, 0.99),
+            }
+            for step, values in history.items()
+        }
+
+    def save(self):
+        """이번 실행의 관측값을 파일에 병합 저장합니다. (실패해도 실행에는 영향 없음)"""
+        with self._lock:
+            if not self._new_samples and not self._new_messages:
+                return
+            new_samples, self._new_samples = self._new_samples, {}
+            new_messages, self._new_messages = self._new_messages, {}
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                data = {}
+            steps = data.setdefault(self.base_url, {})
+            for step, values in new_samples.items():
+                merged = steps.get(step, []) + values
+                steps[step] = merged[-MAX_SAMPLES_PER_STEP:]
+            if new_messages:
+                data.setdefault(self._messages_key, {}).update(new_messages)
+            # 같은 프로필 파일을 동시에 저장하는 실행(환경 비교, CLI 샤드)끼리 임시 파일이 겹치지 않도록 고유 이름 사용
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=os.path.dirname(self.path),
+                                             prefix=f"{os.path.basename(self.path)}.", suffix='.tmp',
+                                             delete=False) as f:
+                tmp_path = f.name
+                json.dump(data, f)
+            try:
+                os.replace(tmp_path, self.path)
+            except OSError:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            print(f"⚠️ 타이밍 프로필 저장 실패: {e}")